@@ -0,0 +1,176 @@
+import math
+import random
+import time
+
+import numpy as np
+
+from exact import EXACT_MAX_STOPS, solve_if_small
+from fitness import route_lengths
+from local_search import best_seed_route, insert_stops
+from routing import RouteResult, prepare_instance, print_summary, route_totals, solution_stats
+
+
+# ---------------------------
+# Destroy Operators
+# ---------------------------
+# 모두 (경로, 제거할 개수 q, 거리 행렬, 난수) -> 제거할 정류장 목록
+def random_removal(route, q, dist, rng):
+    return rng.sample(route, q)
+
+def worst_removal(route, q, dist, rng):
+    # 빠지면 경로가 가장 많이 줄어드는(우회가 큰) 정류장부터, 순위에 약간의 무작위성
+    r = np.asarray(route)
+    detour = np.zeros(len(r))
+    detour[1:] += dist[r[:-1], r[1:]]
+    detour[:-1] += dist[r[:-1], r[1:]]
+    detour[1:-1] -= dist[r[:-2], r[2:]]
+    ranked = np.argsort(-detour, kind="stable").tolist()
+    removed = []
+    while len(removed) < q:
+        removed.append(route[ranked.pop(int(rng.random() ** 3 * len(ranked)))])
+    return removed
+
+def related_removal(route, q, dist, rng):
+    # 임의의 정류장과 가까운(왕복 거리 기준) 정류장들을 함께 제거
+    seed = rng.choice(route)
+    r = np.asarray(route)
+    closeness = dist[seed, r] + dist[r, seed]
+    return r[np.argsort(closeness, kind="stable")[:q]].tolist()
+
+DESTROY = {
+    "random": random_removal,
+    "worst": worst_removal,
+    "related": related_removal,
+}
+
+# ---------------------------
+# Repair Operators
+# ---------------------------
+# 모두 (부분 경로, 제거한 정류장, 거리 행렬, 제약 그래프, 난수) -> 완성 경로
+def greedy_insertion(partial, removed, dist, graph, rng):
+    # 승차 정류장이 먼저 오도록 위상 순서로 하나씩 가장 싼 위치에 삽입
+    return insert_stops(partial, graph.topological_order(removed), dist, graph)
+
+def random_insertion(partial, removed, dist, graph, rng):
+    # 삽입 순서만 무작위 위상 순서로 바꾼 탐욕 삽입
+    priority = {v: rng.random() for v in removed}
+    return insert_stops(partial, graph.topological_order(removed, priority), dist, graph)
+
+REPAIR = {
+    "greedy": greedy_insertion,
+    "random": random_insertion,
+}
+
+
+class ALNSSolver:
+    """적응형 대규모 이웃 탐색(ALNS) 경로 솔버
+
+    매 반복 정류장 일부를 제거(destroy)하고 다시 삽입(repair)한다. 연산자 쌍의 가중치는
+    segment 반복마다 성과 점수(새 최적 / 개선 / 수락)에 따라 reaction 비율로 갱신되고,
+    수락 여부는 담금질 기법 기준(시작 온도는 초기 경로 길이의 start_tolerance 만큼 나빠진 해를
+    절반 확률로 받는 값)으로 정한다. capacity를 주면 경로 비교에 정원 초과 벌점을 더한다.
+    """
+
+    SCORES = (33, 9, 13)  # 새 최적해, 현재해 개선, 나쁘지만 수락
+
+    def __init__(self, iterations=1000, removal_fraction=(0.1, 0.4), segment=100, reaction=0.1,
+                 start_tolerance=0.05, cooling=0.995, seed=None, verbose=False, deadline_ms=None,
+                 exact_threshold=EXACT_MAX_STOPS, capacity=None, capacity_penalty=10.0):
+        self.iterations = iterations
+        self.removal_fraction = removal_fraction
+        self.segment = segment
+        self.reaction = reaction
+        self.start_tolerance = start_tolerance
+        self.cooling = cooling
+        self.seed = seed
+        self.verbose = verbose
+        self.deadline_ms = deadline_ms
+        self.exact_threshold = exact_threshold
+        self.capacity = capacity
+        self.capacity_penalty = capacity_penalty
+
+    def solve(self, pairs, memo=None, seed_routes=None, load_deltas=None):
+        small = solve_if_small(self, pairs, load_deltas)
+        if small is not None:
+            return small
+        rng = random.Random(self.seed)
+        started = time.perf_counter()
+        stops, engine, graph = prepare_instance(pairs, load_deltas, self.capacity, self.capacity_penalty)
+        dist = engine.dist
+
+        def length_of(route):
+            # 정원 벌점을 더한 비교용 길이
+            engine.evaluations += 1
+            population = np.array([route])
+            length = route_lengths(dist, population)[0]
+            if self.capacity is not None:
+                length += engine.penalty(population)[0]
+            return float(length)
+
+        current = best_seed_route(seed_routes, stops, dist, graph) or graph.random_route(rng)
+        current_length = length_of(current)
+        best, best_length = current[:], current_length
+        temperature = self.start_tolerance * current_length / math.log(2) or 1.0
+
+        operators = [(d, r) for d in DESTROY for r in REPAIR]
+        weights = [1.0] * len(operators)
+        earned = [0.0] * len(operators)
+        used = [0] * len(operators)
+        history = []
+        stop_reason = "iterations"
+        n = len(current)
+        lo_q = max(1, int(self.removal_fraction[0] * n))
+        hi_q = max(lo_q, int(self.removal_fraction[1] * n))
+
+        iterations_run = 0
+        for it in range(self.iterations if n > 1 else 0):
+            iterations_run += 1
+            k = rng.choices(range(len(operators)), weights)[0]
+            destroy, repair = operators[k]
+            q = rng.randint(lo_q, min(hi_q, n - 1))
+            removed = DESTROY[destroy](current, q, dist, rng)
+            gone = set(removed)
+            partial = [s for s in current if s not in gone]
+            candidate = REPAIR[repair](partial, removed, dist, graph, rng)
+            candidate_length = length_of(candidate)
+
+            score = 0
+            if candidate_length < best_length - 1e-9:
+                best, best_length = candidate, candidate_length
+                score = self.SCORES[0]
+            if candidate_length < current_length - 1e-9:
+                score = score or self.SCORES[1]
+                current, current_length = candidate, candidate_length
+            elif rng.random() < math.exp(-(candidate_length - current_length) / temperature):
+                score = score or self.SCORES[2]
+                current, current_length = candidate, candidate_length
+            earned[k] += score
+            used[k] += 1
+            temperature *= self.cooling
+
+            if (it + 1) % self.segment == 0:
+                for o in range(len(operators)):
+                    if used[o]:
+                        weights[o] = (1 - self.reaction) * weights[o] + self.reaction * earned[o] / used[o]
+                earned = [0.0] * len(operators)
+                used = [0] * len(operators)
+            history.append(best_length + float(engine.ret[best[-1]]))
+            if self.deadline_ms is not None and (time.perf_counter() - started) * 1000 >= self.deadline_ms:
+                stop_reason = "deadline"
+                break
+
+        stats = {
+            "evaluations": engine.evaluations,
+            "iterations_run": iterations_run,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            **solution_stats(engine, best, engine.lower_bound()),
+            "operator_weights": {f"{d}+{r}": w for (d, r), w in zip(operators, weights)},
+        }
+        route_names = [stops[i] for i in best]
+        total_distance, total_minutes = route_totals(route_names, self.verbose)
+        fitness_with_return = [float(route_lengths(dist, np.array([best]))[0] + engine.ret[best[-1]])]
+        result = RouteResult(route_names, fitness_with_return, total_distance, total_minutes, stats, stop_reason,
+                             history or [best_length + float(engine.ret[best[-1]])])
+        if self.verbose:
+            print_summary(result, label="ALNS")
+        return result
@@ -0,0 +1,127 @@
+import math
+import random
+import time
+
+import numpy as np
+
+from exact import EXACT_MAX_STOPS, solve_if_small
+from fitness import route_lengths
+from ga_optimizer import apply_relocation, apply_swap
+from local_search import best_seed_route
+from routing import RouteResult, prepare_instance, print_summary, route_totals, solution_stats
+
+
+class AnnealingSolver:
+    """담금질 기법(simulated annealing) 경로 솔버
+
+    한 경로에서 시작해 제약을 지키는 교환/재배치 이동을 O(1) 변화량으로 평가하고,
+    나빠지는 이동도 온도에 따라 받아들인다. 온도는 initial_temperature에서
+    initial_temperature * final_ratio까지 기하급수적으로 내려간다 (None이면 표본 이동으로 자동 설정).
+    capacity를 주면 이동마다 정원 초과 벌점 변화도 함께 계산한다 (경로 전체 누적합, O(n)).
+    """
+
+    def __init__(self, iterations=20000, initial_temperature=None, final_ratio=1e-3, seed=None,
+                 verbose=False, deadline_ms=None, exact_threshold=EXACT_MAX_STOPS, capacity=None,
+                 capacity_penalty=10.0):
+        self.iterations = iterations
+        self.initial_temperature = initial_temperature
+        self.final_ratio = final_ratio
+        self.seed = seed
+        self.verbose = verbose
+        self.deadline_ms = deadline_ms
+        self.exact_threshold = exact_threshold
+        self.capacity = capacity
+        self.capacity_penalty = capacity_penalty
+
+    def solve(self, pairs, memo=None, seed_routes=None, load_deltas=None):
+        small = solve_if_small(self, pairs, load_deltas)
+        if small is not None:
+            return small
+        rng = random.Random(self.seed)
+        started = time.perf_counter()
+        stops, engine, graph = prepare_instance(pairs, load_deltas, self.capacity, self.capacity_penalty)
+
+        def penalty_of(route):
+            return float(engine.penalty(np.array([route]))[0]) if self.capacity is not None else 0.0
+
+        route = best_seed_route(seed_routes, stops, engine.dist, graph) or graph.random_route(rng)
+        # length는 순수 경로 길이, 비교는 정원 벌점을 더한 length + penalty로
+        length = float(route_lengths(engine.dist, np.array([route]))[0])
+        penalty = penalty_of(route)
+        best, best_score = route[:], length + penalty
+        temperature = self.initial_temperature or _initial_temperature(route, engine, graph, rng)
+        cooling = self.final_ratio ** (1 / max(self.iterations, 1))
+        history = []
+        evaluated = accepted = 0
+        stop_reason = "iterations"
+        sample_every = max(self.iterations // 100, 1)
+
+        iterations_run = 0
+        for it in range(self.iterations if len(route) > 1 else 0):
+            iterations_run += 1
+            move = _pick_move(route, graph, rng)
+            if move is not None:
+                apply, delta_name, i, j = move
+                delta = getattr(engine, delta_name)(route, i, j)
+                new_penalty = penalty
+                if self.capacity is not None:
+                    candidate = route[:]
+                    apply(candidate, i, j)
+                    new_penalty = penalty_of(candidate)
+                change = delta + new_penalty - penalty
+                evaluated += 1
+                if change <= 0 or rng.random() < math.exp(-change / temperature):
+                    apply(route, i, j)
+                    length += delta
+                    penalty = new_penalty
+                    accepted += 1
+                    if length + penalty < best_score - 1e-9:
+                        best, best_score = route[:], length + penalty
+            temperature *= cooling
+
+            if it % sample_every == 0:
+                history.append(best_score + float(engine.ret[best[-1]]))
+                if self.deadline_ms is not None and (time.perf_counter() - started) * 1000 >= self.deadline_ms:
+                    stop_reason = "deadline"
+                    break
+
+        stats = {
+            "evaluations": evaluated,
+            "accepted": accepted,
+            "iterations_run": iterations_run,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            **solution_stats(engine, best, engine.lower_bound()),
+        }
+        route_names = [stops[i] for i in best]
+        total_distance, total_minutes = route_totals(route_names, self.verbose)
+        history.append(best_score + float(engine.ret[best[-1]]))
+        # 변화량 누적 오차 없이 최종 경로 길이를 다시 계산
+        fitness_with_return = [float(route_lengths(engine.dist, np.array([best]))[0] + engine.ret[best[-1]])]
+        result = RouteResult(route_names, fitness_with_return, total_distance, total_minutes, stats, stop_reason,
+                             history)
+        if self.verbose:
+            print_summary(result, label="SA")
+        return result
+
+
+def _pick_move(route, graph, rng):
+    # 임의의 두 위치에 대한 교환 또는 재배치 (제약을 깨면 None)
+    i, j = rng.sample(range(len(route)), 2)
+    if rng.random() < 0.5:
+        if graph.allows_swap(route, i, j):
+            return apply_swap, "swap_delta", i, j
+    elif graph.allows_relocation(route, i, j):
+        return apply_relocation, "relocate_delta", i, j
+    return None
+
+
+def _initial_temperature(route, engine, graph, rng, samples=100, acceptance=0.5):
+    # 나빠지는 표본 이동의 평균 증가량이 처음에 acceptance 확률로 받아들여지도록 설정
+    worse = []
+    for _ in range(samples if len(route) > 1 else 0):
+        move = _pick_move(route, graph, rng)
+        if move is not None:
+            delta = getattr(engine, move[1])(route, move[2], move[3])
+            if delta > 0:
+                worse.append(delta)
+    return (sum(worse) / len(worse)) / -math.log(acceptance) if worse else 1.0
@@ -2,10 +2,19 @@
 from route import get_distance_between
 
 class Bus:
+    # 버스가 많아져도 인스턴스가 가볍도록 속성을 고정
+    __slots__ = (
+        "bus_id", "current_stop", "onboard_by_stop", "onboard_count", "route", "finished_customers",
+        "total_distance", "passed_stops", "max_capacity", "total_boarded_customers", "start_time",
+        "end_time", "next_stop", "departure_time", "is_moving", "cycle", "route_index", "clock",
+        "available_at", "fleet_index",
+    )
+
     def __init__(self, current_stop, bus_id, max_capacity=15):
         self.bus_id = bus_id
         self.current_stop = current_stop
-        self.onboard_customers = []
+        self.onboard_by_stop = {}  # 하차 정류장 -> 탑승 중인 고객 리스트
+        self.onboard_count = 0     # 탑승 중인 고객 수
         self.route = []
         self.finished_customers = []
         self.total_distance = 0
@@ -17,12 +26,22 @@ class Bus:
         self.next_stop = None
         self.departure_time = None
         self.is_moving = False
+        self.cycle = None        # 운행 중인 시간대 (None이면 배정 없음)
+        self.route_index = None  # 시간대 경로에서 향하는/머무는 위치 (None이면 한 바퀴 사이 대기)
+        self.clock = 0           # 지금 정류장에 있게 된 시각, 이동 중이면 다음 정류장 도착 시각 (분)
+        self.available_at = 0    # 새 시간대를 맡을 수 있는 시각 (분)
+        self.fleet_index = None  # 시뮬레이터 버스 목록에서의 위치 (쉬는 버스 힙에 넣는 번호)
+
+    @property
+    def onboard_customers(self):
+        # 탑승 중인 고객 전체 (조회용, 하차 정류장별로 모아 반환)
+        return [c for riders in self.onboard_by_stop.values() for c in riders]
 
     def is_idle(self):
-        return not self.is_moving and self.next_stop is None and len(self.onboard_customers) == 0
+        return not self.is_moving and self.next_stop is None and self.onboard_count == 0
 
     def can_board_customer(self):
-        return len(self.onboard_customers) < self.max_capacity
+        return self.onboard_count < self.max_capacity
 
     def start_move(self):
         self.is_moving = True
@@ -33,15 +52,17 @@ class Bus:
 
     def board_customer(self, customer, boarding_time):
         if self.can_board_customer():
-            self.onboard_customers.append(customer)
+            self.onboard_by_stop.setdefault(customer.getoff_stop, []).append(customer)
+            self.onboard_count += 1
             self.total_boarded_customers += 1
             if self.start_time is None:
                 self.start_time = boarding_time
             print(f"Customer {customer.customer_id} boarded on Bus {self.bus_id}")
 
     def drop_customer(self, stop_id, current_time):
-        dropping = [c for c in self.onboard_customers if c.getoff_stop == stop_id]
-        self.onboard_customers = [c for c in self.onboard_customers if c.getoff_stop != stop_id]
+        # 이 정류장에서 내리는 고객만 꺼냄 (내리는 사람이 없으면 O(1))
+        dropping = self.onboard_by_stop.pop(stop_id, [])
+        self.onboard_count -= len(dropping)
         self.finished_customers.extend([(c, current_time) for c in dropping])
         return dropping
 
@@ -1,9 +1,3 @@
-import pandas as pd
-import numpy as np
-import random
-from collections import defaultdict
-from utils import get_distance_between
-
 class Customer:
     def __init__(self, customer_id, boarding_stop, getoff_stop, time):
         self.customer_id = customer_id
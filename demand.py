@@ -0,0 +1,40 @@
+from collections import Counter
+from dataclasses import dataclass
+
+
+@dataclass
+class Demand:
+    """고객별 (승차, 하차) 쌍을 고유 OD 수요로 압축한 경로 문제
+
+    솔버에는 pairs(고유 쌍)만 넘기고, 정류장별 승하차 인원은 결과 경로에 다시 붙여 시뮬레이터가 쓴다.
+    """
+    pairs: list    # 고유 (승차, 하차) 쌍 (처음 등장 순서)
+    counts: list   # 쌍별 고객 수
+    boarding: dict  # 정류장 -> 승차 인원
+    getoff: dict    # 정류장 -> 하차 인원
+
+    @property
+    def riders(self):
+        return sum(self.counts)
+
+    def load_delta(self, stop):
+        # 정류장을 지날 때 버스 탑승 인원 변화 (+승차 -하차)
+        return self.boarding.get(stop, 0) - self.getoff.get(stop, 0)
+
+    def load_deltas(self):
+        """정류장 -> 탑승 인원 변화 (솔버의 정원 검사용)"""
+        return {stop: self.load_delta(stop) for stop in {**self.boarding, **self.getoff}}
+
+    def stop_loads(self, route):
+        """경로의 정류장마다 (정류장, 승차 인원, 하차 인원)"""
+        return [(stop, self.boarding.get(stop, 0), self.getoff.get(stop, 0)) for stop in route]
+
+
+def compress_demand(pairs):
+    """승하차 쌍 목록을 Demand로 압축 (솔버 비용이 고객 수가 아니라 고유 쌍/정류장 수에 비례하도록)"""
+    counts = Counter(pairs)
+    boarding, getoff = Counter(), Counter()
+    for (board, drop), count in counts.items():
+        boarding[board] += count
+        getoff[drop] += count
+    return Demand(list(counts), list(counts.values()), dict(boarding), dict(getoff))
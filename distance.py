@@ -0,0 +1,243 @@
+import ast
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+
+import numpy as np
+
+
+class StopRegistry:
+    """정류장 ID(문자열)를 0부터 시작하는 정수 인덱스로 인터닝"""
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        self._index = {name: i for i, name in enumerate(self.names)}
+        if len(self._index) != len(self.names):
+            raise ValueError("정류장 ID가 중복되었습니다.")
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def index(self, name):
+        return self._index[name]
+
+    def get(self, name, default=None):
+        return self._index.get(name, default)
+
+    def encode(self, stops):
+        return np.fromiter((self._index[s] for s in stops), dtype=np.intp)
+
+    def decode(self, indices):
+        return [self.names[i] for i in indices]
+
+
+def build_distance_matrix(distance_map, registry=None, dtype=np.float32):
+    """(정류장, 정류장) -> km 딕셔너리를 거리 행렬(기본 float32)로 변환
+
+    없는 구간은 NaN, 같은 정류장 사이는 0으로 채운다.
+    """
+    if registry is None:
+        names = sorted({a for a, _ in distance_map} | {b for _, b in distance_map})
+        registry = StopRegistry(names)
+    n = len(registry)
+    matrix = np.full((n, n), np.nan, dtype=dtype)
+    rows = registry.encode(a for a, _ in distance_map)
+    cols = registry.encode(b for _, b in distance_map)
+    matrix[rows, cols] = np.fromiter(distance_map.values(), dtype=dtype, count=len(distance_map))
+    np.fill_diagonal(matrix, 0)
+    return registry, matrix
+
+
+def shortest_path_closure(matrix):
+    """벡터화한 Floyd–Warshall로 모든 정류장 쌍의 최단 거리와 선행 정류장 테이블 계산
+
+    predecessor[i, j]는 i에서 j로 가는 최단 경로에서 j 바로 앞 정류장 (경로 없음은 -1).
+    """
+    n = len(matrix)
+    dist = np.where(np.isnan(matrix), np.inf, matrix).astype(np.float64)
+    pred = np.where(np.isfinite(dist), np.arange(n)[:, None], -1)
+    for k in range(n):
+        via = dist[:, k, None] + dist[None, k, :]
+        better = via < dist
+        dist = np.where(better, via, dist)
+        pred = np.where(better, pred[k][None, :], pred)
+    return dist, pred.astype(np.int16)
+
+
+def complete_distance_matrix(matrix):
+    """없는 구간(NaN)만 최단 경로 거리로 채운 행렬과 선행 정류장 테이블 반환
+
+    측정된 구간은 실제 도로 거리를 그대로 쓴다. 선행 정류장 테이블은 최단 경로 기준이라
+    다른 정류장을 거치는 편이 더 짧은 측정 구간은 reconstruct_path 경로가 직접 구간과 다를 수 있다.
+    어떤 경로로도 갈 수 없는 쌍이 있으면 ValueError.
+    """
+    closure, pred = shortest_path_closure(matrix)
+    if not np.isfinite(closure).all():
+        i, j = np.argwhere(~np.isfinite(closure))[0]
+        raise ValueError(f"거리 데이터로 연결할 수 없는 정류장 쌍이 있습니다: ({i}, {j})")
+    return np.where(np.isnan(matrix), closure, matrix), pred
+
+
+def reconstruct_path(pred, i, j):
+    """선행 정류장 테이블로 i -> j 최단 경로(인덱스 리스트) 복원"""
+    path = [j]
+    while j != i:
+        j = int(pred[i, j])
+        if j < 0:
+            return []
+        path.append(j)
+    return path[::-1]
+
+
+# ---------------------------
+# 바이너리 캐시 (정류장 이름 테이블 + 거리 행렬 + 선행 정류장 테이블 + 원본 정밀도 거리 행렬)
+# ---------------------------
+# 파일 구조: MAGIC | 헤더 길이(uint32 LE) | JSON 헤더 | 패딩 | float32 거리 | 패딩 | int16 선행 정류장 | 패딩 | float64 거리
+# float32 행렬은 솔버 핫패스용, float64 행렬은 get_distance_between 등 사용자에게 보이는 값용 (1.8이 1.7999999가 되지 않도록)
+# 헤더에는 원본 파일의 mtime/size/sha256이 들어 있어 원본이 바뀔 때만 다시 만든다.
+CACHE_MAGIC = b"DRTDIST\0"
+CACHE_VERSION = 5
+CACHE_ARRAYS = (("distance", "<f4"), ("predecessor", "<i2"), ("distance_exact", "<f8"))
+CACHE_SUFFIX = ".distcache"
+_ALIGN = 64
+
+
+def default_cache_path(source_path):
+    return os.path.splitext(source_path)[0] + CACHE_SUFFIX
+
+
+def parse_distance_source(source_path):
+    """텍스트/파이썬 원본에서 {(정류장, 정류장): km} 블록을 모두 읽어 하나의 딕셔너리로 합침"""
+    with open(source_path, "r", encoding="utf-8") as f:
+        raw_text = f.read()
+    distance_map = {}
+    for block in re.findall(r"\{[^{}]+\}", raw_text):
+        distance_map.update(ast.literal_eval(block))
+    return distance_map
+
+
+def _source_stamp(source_path, with_hash=True):
+    st = os.stat(source_path)
+    stamp = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    if with_hash:
+        with open(source_path, "rb") as f:
+            stamp["sha256"] = hashlib.sha256(f.read()).hexdigest()
+    return stamp
+
+
+def _align(offset):
+    # 배열 시작 위치를 64바이트 경계에 맞춤
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _data_offset(header_length):
+    return _align(len(CACHE_MAGIC) + 4 + header_length)
+
+
+def _read_header(cache_path):
+    with open(cache_path, "rb") as f:
+        if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+            raise ValueError(f"거리 캐시 형식이 아닙니다: {cache_path}")
+        (length,) = struct.unpack("<I", f.read(4))
+        return json.loads(f.read(length).decode("utf-8")), _data_offset(length)
+
+
+def build_distance_cache(source_path, cache_path=None):
+    """원본 거리 데이터를 한 번 파싱해 메모리 매핑 가능한 캐시 파일로 저장"""
+    cache_path = cache_path or default_cache_path(source_path)
+    registry, raw = build_distance_matrix(parse_distance_source(source_path), dtype=np.float64)
+    matrix, pred = complete_distance_matrix(raw)
+
+    header = {
+        "version": CACHE_VERSION,
+        "source": _source_stamp(source_path),
+        "stops": list(registry.names),
+        "shape": list(matrix.shape),
+    }
+    encoded = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+    # 여러 프로세스가 동시에 빌드해도 서로의 파일을 건드리지 않도록 프로세스마다 다른 임시 파일에 쓰고 교체
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(CACHE_MAGIC)
+            f.write(struct.pack("<I", len(encoded)))
+            f.write(encoded)
+            for array, (_, dtype) in zip((matrix, pred, matrix), CACHE_ARRAYS):
+                f.write(b"\0" * (_align(f.tell()) - f.tell()))
+                f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        os.chmod(tmp_path, 0o644)  # mkstemp은 소유자 전용(0600)으로 만듦
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return cache_path
+
+
+def load_distance_cache(cache_path):
+    """캐시 파일을 (StopRegistry, float32 거리 행렬, 선행 정류장 테이블, float64 거리 행렬)로 로드 (행렬은 읽기 전용 memmap)"""
+    header, offset = _read_header(cache_path)
+    if header.get("version") != CACHE_VERSION:
+        raise ValueError(f"지원하지 않는 거리 캐시 버전입니다: {header.get('version')}")
+    shape = tuple(header["shape"])
+    arrays = []
+    for _, dtype in CACHE_ARRAYS:
+        array = np.memmap(cache_path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        arrays.append(array)
+        offset = _align(offset + array.nbytes)
+    return (StopRegistry(header["stops"]), *arrays)
+
+
+def is_cache_fresh(source_path, cache_path):
+    try:
+        header, _ = _read_header(cache_path)
+    except (OSError, ValueError):
+        return False
+    if header.get("version") != CACHE_VERSION:
+        return False
+    cached = header["source"]
+    try:
+        current = _source_stamp(source_path, with_hash=False)
+    except FileNotFoundError:
+        return True  # 원본 없이 캐시만 배포된 경우는 캐시를 그대로 사용
+    if cached["mtime_ns"] == current["mtime_ns"] and cached["size"] == current["size"]:
+        return True
+    # mtime만 바뀐 경우(체크아웃, 복사 등)는 내용 해시로 재확인
+    return cached["size"] == current["size"] and cached["sha256"] == _source_stamp(source_path)["sha256"]
+
+
+def open_distance_matrix(source_path, cache_path=None):
+    """캐시가 최신이면 바로 mmap, 원본이 바뀌었으면 다시 빌드 후 mmap
+
+    반환값: (StopRegistry, 빈 구간을 최단 거리로 채운 float32 거리 행렬, 선행 정류장 테이블, 같은 행렬의 float64 원본 정밀도 값)
+    """
+    cache_path = cache_path or default_cache_path(source_path)
+    if not is_cache_fresh(source_path, cache_path):
+        try:
+            build_distance_cache(source_path, cache_path)
+        except OSError:
+            # 캐시를 쓸 수 없는 위치면 메모리에서만 구성
+            registry, raw = build_distance_matrix(parse_distance_source(source_path), dtype=np.float64)
+            matrix, pred = complete_distance_matrix(raw)
+            return registry, matrix.astype(np.float32), pred, matrix
+    return load_distance_cache(cache_path)
+
+
+if __name__ == "__main__":
+    # 빌드 단계: python distance.py <원본 경로> [캐시 경로]
+    import sys
+
+    if len(sys.argv) < 2:
+        sys.exit("usage: python distance.py <distance source> [cache path]")
+    path = build_distance_cache(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    registry, matrix, *_ = load_distance_cache(path)
+    print(f"{path}: 정류장 {len(registry)}개, 행렬 {matrix.shape}")
@@ -0,0 +1,2451 @@
+# 25번 노선 정류장 간 거리 원본 (km). 실행 시에는 distance.py가 만든 바이너리 캐시를 사용
+distance_map = {('00_오이도차고지', '02_오이도해양단지.옥터초교입구'): 0.9,
+ ('00_오이도차고지', '03_오이도중앙로입구'): 1.2,
+ ('00_오이도차고지', '04_오이도종합어시장'): 1.5,
+ ('00_오이도차고지', '05_함상전망대'): 1.9,
+ ('00_오이도차고지', '06_오이도박물관'): 2.5,
+ ('00_오이도차고지', '07_대부도입구'): 1.1,
+ ('00_오이도차고지', '08_시화환경사업소'): 0.7,
+ ('00_오이도차고지', '09_시화염색단지입구'): 0.9,
+ ('00_오이도차고지', '10_삼양사'): 1.3,
+ ('00_오이도차고지', '11_열병합발전소'): 1.7,
+ ('00_오이도차고지', '12_우진플라스코'): 2.3,
+ ('00_오이도차고지', '13_대한통운.동화산업'): 2.6,
+ ('00_오이도차고지', '14_우석철강'): 2.4,
+ ('00_오이도차고지', '15_파워맥스'): 3.0,
+ ('00_오이도차고지', '16_삼화정공'): 3.4,
+ ('00_오이도차고지', '17_홈플러스'): 3.6,
+ ('00_오이도차고지', '18_청솔아파트'): 4.0,
+ ('00_오이도차고지', '19_계룡1차아파트'): 4.4,
+ ('00_오이도차고지', '20_중앙도서관'): 4.8,
+ ('00_오이도차고지', '21_이마트'): 5.0,
+ ('00_오이도차고지', '22_시화정형외과.이철신경외과'): 5.7,
+ ('00_오이도차고지', '23_소방서.군서고.여성비전센터'): 5.4,
+ ('00_오이도차고지', '24_정왕역'): 5.5,
+ ('00_오이도차고지', '25_정왕역환승센터'): 5.7,
+ ('00_오이도차고지', '26_소방서.군서고.여성비전센터'): 5.4,
+ ('00_오이도차고지', '27_군서미래국제학교'): 5.9,
+ ('00_오이도차고지', '28_시화정형외과'): 6.3,
+ ('00_오이도차고지', '29_금강아파트'): 5.6,
+ ('00_오이도차고지', '30_이마트'): 5.0,
+ ('00_오이도차고지', '31_중앙도서관'): 4.8,
+ ('00_오이도차고지', '32_세종3차아파트'): 4.2,
+ ('00_오이도차고지', '33_진로아파트'): 4.2,
+ ('00_오이도차고지', '34_홈플러스'): 3.6,
+ ('00_오이도차고지', '35_동국산업'): 3.9,
+ ('00_오이도차고지', '36_중앙알칸'): 3.4,
+ ('00_오이도차고지', '37_희망공원'): 2.9,
+ ('00_오이도차고지', '38_대한통운'): 2.2,
+ ('00_오이도차고지', '39_우진프라스코'): 2.4,
+ ('00_오이도차고지', '40_열병합발전소'): 1.7,
+ ('00_오이도차고지', '41_삼양사'): 1.3,
+ ('00_오이도차고지', '42_시화염색단지입구'): 0.9,
+ ('00_오이도차고지', '43_시화환경사업소'): 0.7,
+ ('00_오이도차고지', '44_오이도입구'): 0.9,
+ ('00_오이도차고지', '45_오이도박물관'): 2.5,
+ ('00_오이도차고지', '46_함상전망대'): 1.9,
+ ('00_오이도차고지', '47_오이도종합어시장'): 1.5,
+ ('00_오이도차고지', '48_오이도중앙로입구'): 1.2,
+ ('00_오이도차고지', '49_오이도해양단지.옥터초교입구'): 0.9,
+ ('00_오이도차고지', '50_오이도차고지'): 0.0,
+ ('02_오이도해양단지.옥터초교입구', '00_오이도차고지'): 1.6,
+ ('02_오이도해양단지.옥터초교입구', '03_오이도중앙로입구'): 0.3,
+ ('02_오이도해양단지.옥터초교입구', '04_오이도종합어시장'): 0.6,
+ ('02_오이도해양단지.옥터초교입구', '05_함상전망대'): 0.9,
+ ('02_오이도해양단지.옥터초교입구', '06_오이도박물관'): 1.5,
+ ('02_오이도해양단지.옥터초교입구', '07_대부도입구'): 2.0,
+ ('02_오이도해양단지.옥터초교입구', '08_시화환경사업소'): 1.6,
+ ('02_오이도해양단지.옥터초교입구', '09_시화염색단지입구'): 1.8,
+ ('02_오이도해양단지.옥터초교입구', '10_삼양사'): 2.2,
+ ('02_오이도해양단지.옥터초교입구', '11_열병합발전소'): 2.6,
+ ('02_오이도해양단지.옥터초교입구', '12_우진플라스코'): 3.3,
+ ('02_오이도해양단지.옥터초교입구', '13_대한통운.동화산업'): 3.0,
+ ('02_오이도해양단지.옥터초교입구', '14_우석철강'): 2.9,
+ ('02_오이도해양단지.옥터초교입구', '15_파워맥스'): 3.0,
+ ('02_오이도해양단지.옥터초교입구', '16_삼화정공'): 3.3,
+ ('02_오이도해양단지.옥터초교입구', '17_홈플러스'): 3.6,
+ ('02_오이도해양단지.옥터초교입구', '18_청솔아파트'): 3.9,
+ ('02_오이도해양단지.옥터초교입구', '19_계룡1차아파트'): 4.3,
+ ('02_오이도해양단지.옥터초교입구', '20_중앙도서관'): 4.7,
+ ('02_오이도해양단지.옥터초교입구', '21_이마트'): 5.0,
+ ('02_오이도해양단지.옥터초교입구', '22_시화정형외과.이철신경외과'): 5.6,
+ ('02_오이도해양단지.옥터초교입구', '23_소방서.군서고.여성비전센터'): 5.4,
+ ('02_오이도해양단지.옥터초교입구', '24_정왕역'): 5.4,
+ ('02_오이도해양단지.옥터초교입구', '25_정왕역환승센터'): 5.6,
+ ('02_오이도해양단지.옥터초교입구', '26_소방서.군서고.여성비전센터'): 5.4,
+ ('02_오이도해양단지.옥터초교입구', '27_군서미래국제학교'): 5.8,
+ ('02_오이도해양단지.옥터초교입구', '28_시화정형외과'): 6.2,
+ ('02_오이도해양단지.옥터초교입구', '29_금강아파트'): 5.6,
+ ('02_오이도해양단지.옥터초교입구', '30_이마트'): 5.0,
+ ('02_오이도해양단지.옥터초교입구', '31_중앙도서관'): 4.7,
+ ('02_오이도해양단지.옥터초교입구', '32_세종3차아파트'): 4.2,
+ ('02_오이도해양단지.옥터초교입구', '33_진로아파트'): 4.1,
+ ('02_오이도해양단지.옥터초교입구', '34_홈플러스'): 3.6,
+ ('02_오이도해양단지.옥터초교입구', '35_동국산업'): 3.8,
+ ('02_오이도해양단지.옥터초교입구', '36_중앙알칸'): 3.3,
+ ('02_오이도해양단지.옥터초교입구', '37_희망공원'): 2.9,
+ ('02_오이도해양단지.옥터초교입구', '38_대한통운'): 2.7,
+ ('02_오이도해양단지.옥터초교입구', '39_우진프라스코'): 2.9,
+ ('02_오이도해양단지.옥터초교입구', '40_열병합발전소'): 2.6,
+ ('02_오이도해양단지.옥터초교입구', '41_삼양사'): 2.2,
+ ('02_오이도해양단지.옥터초교입구', '42_시화염색단지입구'): 1.8,
+ ('02_오이도해양단지.옥터초교입구', '43_시화환경사업소'): 1.6,
+ ('02_오이도해양단지.옥터초교입구', '44_오이도입구'): 1.8,
+ ('02_오이도해양단지.옥터초교입구', '45_오이도박물관'): 1.5,
+ ('02_오이도해양단지.옥터초교입구', '46_함상전망대'): 0.9,
+ ('02_오이도해양단지.옥터초교입구', '47_오이도종합어시장'): 0.6,
+ ('02_오이도해양단지.옥터초교입구', '48_오이도중앙로입구'): 0.3,
+ ('02_오이도해양단지.옥터초교입구', '49_오이도해양단지.옥터초교입구'): 0.0,
+ ('02_오이도해양단지.옥터초교입구', '50_오이도차고지'): 1.6,
+ ('03_오이도중앙로입구', '00_오이도차고지'): 2.1,
+ ('03_오이도중앙로입구', '02_오이도해양단지.옥터초교입구'): 1.1,
+ ('03_오이도중앙로입구', '04_오이도종합어시장'): 0.3,
+ ('03_오이도중앙로입구', '05_함상전망대'): 0.7,
+ ('03_오이도중앙로입구', '06_오이도박물관'): 1.5,
+ ('03_오이도중앙로입구', '07_대부도입구'): 1.9,
+ ('03_오이도중앙로입구', '08_시화환경사업소'): 2.1,
+ ('03_오이도중앙로입구', '09_시화염색단지입구'): 2.3,
+ ('03_오이도중앙로입구', '10_삼양사'): 2.7,
+ ('03_오이도중앙로입구', '11_열병합발전소'): 3.1,
+ ('03_오이도중앙로입구', '12_우진플라스코'): 3.8,
+ ('03_오이도중앙로입구', '13_대한통운.동화산업'): 3.5,
+ ('03_오이도중앙로입구', '14_우석철강'): 3.4,
+ ('03_오이도중앙로입구', '15_파워맥스'): 3.5,
+ ('03_오이도중앙로입구', '16_삼화정공'): 3.8,
+ ('03_오이도중앙로입구', '17_홈플러스'): 4.1,
+ ('03_오이도중앙로입구', '18_청솔아파트'): 4.5,
+ ('03_오이도중앙로입구', '19_계룡1차아파트'): 4.9,
+ ('03_오이도중앙로입구', '20_중앙도서관'): 5.2,
+ ('03_오이도중앙로입구', '21_이마트'): 5.5,
+ ('03_오이도중앙로입구', '22_시화정형외과.이철신경외과'): 6.1,
+ ('03_오이도중앙로입구', '23_소방서.군서고.여성비전센터'): 5.9,
+ ('03_오이도중앙로입구', '24_정왕역'): 6.0,
+ ('03_오이도중앙로입구', '25_정왕역환승센터'): 6.1,
+ ('03_오이도중앙로입구', '26_소방서.군서고.여성비전센터'): 5.9,
+ ('03_오이도중앙로입구', '27_군서미래국제학교'): 6.3,
+ ('03_오이도중앙로입구', '28_시화정형외과'): 6.7,
+ ('03_오이도중앙로입구', '29_금강아파트'): 6.1,
+ ('03_오이도중앙로입구', '30_이마트'): 5.5,
+ ('03_오이도중앙로입구', '31_중앙도서관'): 5.2,
+ ('03_오이도중앙로입구', '32_세종3차아파트'): 4.7,
+ ('03_오이도중앙로입구', '33_진로아파트'): 4.6,
+ ('03_오이도중앙로입구', '34_홈플러스'): 4.1,
+ ('03_오이도중앙로입구', '35_동국산업'): 4.3,
+ ('03_오이도중앙로입구', '36_중앙알칸'): 3.8,
+ ('03_오이도중앙로입구', '37_희망공원'): 3.4,
+ ('03_오이도중앙로입구', '38_대한통운'): 3.3,
+ ('03_오이도중앙로입구', '39_우진프라스코'): 3.4,
+ ('03_오이도중앙로입구', '40_열병합발전소'): 3.1,
+ ('03_오이도중앙로입구', '41_삼양사'): 2.7,
+ ('03_오이도중앙로입구', '42_시화염색단지입구'): 2.3,
+ ('03_오이도중앙로입구', '43_시화환경사업소'): 2.1,
+ ('03_오이도중앙로입구', '44_오이도입구'): 2.3,
+ ('03_오이도중앙로입구', '45_오이도박물관'): 1.5,
+ ('03_오이도중앙로입구', '46_함상전망대'): 0.7,
+ ('03_오이도중앙로입구', '47_오이도종합어시장'): 0.3,
+ ('03_오이도중앙로입구', '48_오이도중앙로입구'): 0.0,
+ ('03_오이도중앙로입구', '49_오이도해양단지.옥터초교입구'): 1.1,
+ ('03_오이도중앙로입구', '50_오이도차고지'): 2.1,
+ ('04_오이도종합어시장', '00_오이도차고지'): 2.1,
+ ('04_오이도종합어시장', '02_오이도해양단지.옥터초교입구'): 1.2,
+ ('04_오이도종합어시장', '03_오이도중앙로입구'): 0.4,
+ ('04_오이도종합어시장', '05_함상전망대'): 0.4,
+ ('04_오이도종합어시장', '06_오이도박물관'): 1.2,
+ ('04_오이도종합어시장', '07_대부도입구'): 1.6,
+ ('04_오이도종합어시장', '08_시화환경사업소'): 2.2,
+ ('04_오이도종합어시장', '09_시화염색단지입구'): 2.3,
+ ('04_오이도종합어시장', '10_삼양사'): 2.7,
+ ('04_오이도종합어시장', '11_열병합발전소'): 3.2,
+ ('04_오이도종합어시장', '12_우진플라스코'): 3.8,
+ ('04_오이도종합어시장', '13_대한통운.동화산업'): 3.6,
+ ('04_오이도종합어시장', '14_우석철강'): 3.5,
+ ('04_오이도종합어시장', '15_파워맥스'): 3.6,
+ ('04_오이도종합어시장', '16_삼화정공'): 3.9,
+ ('04_오이도종합어시장', '17_홈플러스'): 4.1,
+ ('04_오이도종합어시장', '18_청솔아파트'): 4.5,
+ ('04_오이도종합어시장', '19_계룡1차아파트'): 4.9,
+ ('04_오이도종합어시장', '20_중앙도서관'): 5.3,
+ ('04_오이도종합어시장', '21_이마트'): 5.5,
+ ('04_오이도종합어시장', '22_시화정형외과.이철신경외과'): 6.2,
+ ('04_오이도종합어시장', '23_소방서.군서고.여성비전센터'): 6.0,
+ ('04_오이도종합어시장', '24_정왕역'): 6.0,
+ ('04_오이도종합어시장', '25_정왕역환승센터'): 6.2,
+ ('04_오이도종합어시장', '26_소방서.군서고.여성비전센터'): 6.0,
+ ('04_오이도종합어시장', '27_군서미래국제학교'): 6.4,
+ ('04_오이도종합어시장', '28_시화정형외과'): 6.8,
+ ('04_오이도종합어시장', '29_금강아파트'): 6.1,
+ ('04_오이도종합어시장', '30_이마트'): 5.5,
+ ('04_오이도종합어시장', '31_중앙도서관'): 5.3,
+ ('04_오이도종합어시장', '32_세종3차아파트'): 4.7,
+ ('04_오이도종합어시장', '33_진로아파트'): 4.7,
+ ('04_오이도종합어시장', '34_홈플러스'): 4.1,
+ ('04_오이도종합어시장', '35_동국산업'): 4.4,
+ ('04_오이도종합어시장', '36_중앙알칸'): 3.9,
+ ('04_오이도종합어시장', '37_희망공원'): 3.5,
+ ('04_오이도종합어시장', '38_대한통운'): 3.3,
+ ('04_오이도종합어시장', '39_우진프라스코'): 3.5,
+ ('04_오이도종합어시장', '40_열병합발전소'): 3.2,
+ ('04_오이도종합어시장', '41_삼양사'): 2.7,
+ ('04_오이도종합어시장', '42_시화염색단지입구'): 2.3,
+ ('04_오이도종합어시장', '43_시화환경사업소'): 2.2,
+ ('04_오이도종합어시장', '44_오이도입구'): 2.4,
+ ('04_오이도종합어시장', '45_오이도박물관'): 1.2,
+ ('04_오이도종합어시장', '46_함상전망대'): 0.4,
+ ('04_오이도종합어시장', '47_오이도종합어시장'): 0.0,
+ ('04_오이도종합어시장', '48_오이도중앙로입구'): 0.4,
+ ('04_오이도종합어시장', '49_오이도해양단지.옥터초교입구'): 1.2,
+ ('04_오이도종합어시장', '50_오이도차고지'): 2.1,
+ ('05_함상전망대', '00_오이도차고지'): 2.5,
+ ('05_함상전망대', '02_오이도해양단지.옥터초교입구'): 1.5,
+ ('05_함상전망대', '03_오이도중앙로입구'): 0.7,
+ ('05_함상전망대', '04_오이도종합어시장'): 0.7,
+ ('05_함상전망대', '06_오이도박물관'): 0.9,
+ ('05_함상전망대', '07_대부도입구'): 1.2,
+ ('05_함상전망대', '08_시화환경사업소'): 1.8,
+ ('05_함상전망대', '09_시화염색단지입구'): 2.0,
+ ('05_함상전망대', '10_삼양사'): 2.4,
+ ('05_함상전망대', '11_열병합발전소'): 2.8,
+ ('05_함상전망대', '12_우진플라스코'): 3.4,
+ ('05_함상전망대', '13_대한통운.동화산업'): 3.7,
+ ('05_함상전망대', '14_우석철강'): 3.9,
+ ('05_함상전망대', '15_파워맥스'): 4.0,
+ ('05_함상전망대', '16_삼화정공'): 4.3,
+ ('05_함상전망대', '17_홈플러스'): 4.5,
+ ('05_함상전망대', '18_청솔아파트'): 4.9,
+ ('05_함상전망대', '19_계룡1차아파트'): 5.3,
+ ('05_함상전망대', '20_중앙도서관'): 5.6,
+ ('05_함상전망대', '21_이마트'): 5.9,
+ ('05_함상전망대', '22_시화정형외과.이철신경외과'): 6.6,
+ ('05_함상전망대', '23_소방서.군서고.여성비전센터'): 6.3,
+ ('05_함상전망대', '24_정왕역'): 6.4,
+ ('05_함상전망대', '25_정왕역환승센터'): 6.6,
+ ('05_함상전망대', '26_소방서.군서고.여성비전센터'): 6.3,
+ ('05_함상전망대', '27_군서미래국제학교'): 6.8,
+ ('05_함상전망대', '28_시화정형외과'): 7.1,
+ ('05_함상전망대', '29_금강아파트'): 6.5,
+ ('05_함상전망대', '30_이마트'): 5.9,
+ ('05_함상전망대', '31_중앙도서관'): 5.6,
+ ('05_함상전망대', '32_세종3차아파트'): 5.1,
+ ('05_함상전망대', '33_진로아파트'): 5.1,
+ ('05_함상전망대', '34_홈플러스'): 4.5,
+ ('05_함상전망대', '35_동국산업'): 4.8,
+ ('05_함상전망대', '36_중앙알칸'): 4.2,
+ ('05_함상전망대', '37_희망공원'): 3.9,
+ ('05_함상전망대', '38_대한통운'): 3.7,
+ ('05_함상전망대', '39_우진프라스코'): 3.6,
+ ('05_함상전망대', '40_열병합발전소'): 2.8,
+ ('05_함상전망대', '41_삼양사'): 2.4,
+ ('05_함상전망대', '42_시화염색단지입구'): 2.0,
+ ('05_함상전망대', '43_시화환경사업소'): 1.8,
+ ('05_함상전망대', '44_오이도입구'): 2.7,
+ ('05_함상전망대', '45_오이도박물관'): 0.9,
+ ('05_함상전망대', '46_함상전망대'): 0.0,
+ ('05_함상전망대', '47_오이도종합어시장'): 0.7,
+ ('05_함상전망대', '48_오이도중앙로입구'): 0.7,
+ ('05_함상전망대', '49_오이도해양단지.옥터초교입구'): 1.5,
+ ('05_함상전망대', '50_오이도차고지'): 2.5,
+ ('06_오이도박물관', '00_오이도차고지'): 1.9,
+ ('06_오이도박물관', '02_오이도해양단지.옥터초교입구'): 2.2,
+ ('06_오이도박물관', '03_오이도중앙로입구'): 1.6,
+ ('06_오이도박물관', '04_오이도종합어시장'): 1.5,
+ ('06_오이도박물관', '05_함상전망대'): 1.0,
+ ('06_오이도박물관', '07_대부도입구'): 0.4,
+ ('06_오이도박물관', '08_시화환경사업소'): 0.9,
+ ('06_오이도박물관', '09_시화염색단지입구'): 1.1,
+ ('06_오이도박물관', '10_삼양사'): 1.5,
+ ('06_오이도박물관', '11_열병합발전소'): 2.0,
+ ('06_오이도박물관', '12_우진플라스코'): 2.6,
+ ('06_오이도박물관', '13_대한통운.동화산업'): 2.8,
+ ('06_오이도박물관', '14_우석철강'): 3.2,
+ ('06_오이도박물관', '15_파워맥스'): 3.8,
+ ('06_오이도박물관', '16_삼화정공'): 4.2,
+ ('06_오이도박물관', '17_홈플러스'): 4.5,
+ ('06_오이도박물관', '18_청솔아파트'): 4.8,
+ ('06_오이도박물관', '19_계룡1차아파트'): 5.3,
+ ('06_오이도박물관', '20_중앙도서관'): 5.6,
+ ('06_오이도박물관', '21_이마트'): 5.9,
+ ('06_오이도박물관', '22_시화정형외과.이철신경외과'): 6.5,
+ ('06_오이도박물관', '23_소방서.군서고.여성비전센터'): 6.3,
+ ('06_오이도박물관', '24_정왕역'): 6.4,
+ ('06_오이도박물관', '25_정왕역환승센터'): 6.5,
+ ('06_오이도박물관', '26_소방서.군서고.여성비전센터'): 6.3,
+ ('06_오이도박물관', '27_군서미래국제학교'): 6.7,
+ ('06_오이도박물관', '28_시화정형외과'): 7.1,
+ ('06_오이도박물관', '29_금강아파트'): 6.5,
+ ('06_오이도박물관', '30_이마트'): 5.9,
+ ('06_오이도박물관', '31_중앙도서관'): 5.6,
+ ('06_오이도박물관', '32_세종3차아파트'): 5.1,
+ ('06_오이도박물관', '33_진로아파트'): 5.0,
+ ('06_오이도박물관', '34_홈플러스'): 4.5,
+ ('06_오이도박물관', '35_동국산업'): 4.7,
+ ('06_오이도박물관', '36_중앙알칸'): 4.1,
+ ('06_오이도박물관', '37_희망공원'): 3.7,
+ ('06_오이도박물관', '38_대한통운'): 3.0,
+ ('06_오이도박물관', '39_우진프라스코'): 2.7,
+ ('06_오이도박물관', '40_열병합발전소'): 2.0,
+ ('06_오이도박물관', '41_삼양사'): 1.5,
+ ('06_오이도박물관', '42_시화염색단지입구'): 1.1,
+ ('06_오이도박물관', '43_시화환경사업소'): 0.9,
+ ('06_오이도박물관', '44_오이도입구'): 1.9,
+ ('06_오이도박물관', '45_오이도박물관'): 0.0,
+ ('06_오이도박물관', '46_함상전망대'): 1.0,
+ ('06_오이도박물관', '47_오이도종합어시장'): 1.5,
+ ('06_오이도박물관', '48_오이도중앙로입구'): 1.6,
+ ('06_오이도박물관', '49_오이도해양단지.옥터초교입구'): 2.2,
+ ('06_오이도박물관', '50_오이도차고지'): 1.9,
+ ('07_대부도입구', '00_오이도차고지'): 1.5,
+ ('07_대부도입구', '02_오이도해양단지.옥터초교입구'): 1.8,
+ ('07_대부도입구', '03_오이도중앙로입구'): 2.1,
+ ('07_대부도입구', '04_오이도종합어시장'): 2.4,
+ ('07_대부도입구', '05_함상전망대'): 2.8,
+ ('07_대부도입구', '06_오이도박물관'): 3.3,
+ ('07_대부도입구', '08_시화환경사업소'): 0.5,
+ ('07_대부도입구', '09_시화염색단지입구'): 0.7,
+ ('07_대부도입구', '10_삼양사'): 1.1,
+ ('07_대부도입구', '11_열병합발전소'): 1.6,
+ ('07_대부도입구', '12_우진플라스코'): 2.2,
+ ('07_대부도입구', '13_대한통운.동화산업'): 2.4,
+ ('07_대부도입구', '14_우석철강'): 2.8,
+ ('07_대부도입구', '15_파워맥스'): 3.4,
+ ('07_대부도입구', '16_삼화정공'): 3.8,
+ ('07_대부도입구', '17_홈플러스'): 4.1,
+ ('07_대부도입구', '18_청솔아파트'): 4.5,
+ ('07_대부도입구', '19_계룡1차아파트'): 4.9,
+ ('07_대부도입구', '20_중앙도서관'): 5.2,
+ ('07_대부도입구', '21_이마트'): 5.5,
+ ('07_대부도입구', '22_시화정형외과.이철신경외과'): 6.1,
+ ('07_대부도입구', '23_소방서.군서고.여성비전센터'): 5.9,
+ ('07_대부도입구', '24_정왕역'): 6.0,
+ ('07_대부도입구', '25_정왕역환승센터'): 6.1,
+ ('07_대부도입구', '26_소방서.군서고.여성비전센터'): 5.9,
+ ('07_대부도입구', '27_군서미래국제학교'): 6.4,
+ ('07_대부도입구', '28_시화정형외과'): 6.7,
+ ('07_대부도입구', '29_금강아파트'): 6.1,
+ ('07_대부도입구', '30_이마트'): 5.5,
+ ('07_대부도입구', '31_중앙도서관'): 5.2,
+ ('07_대부도입구', '32_세종3차아파트'): 4.7,
+ ('07_대부도입구', '33_진로아파트'): 4.6,
+ ('07_대부도입구', '34_홈플러스'): 4.1,
+ ('07_대부도입구', '35_동국산업'): 4.4,
+ ('07_대부도입구', '36_중앙알칸'): 3.7,
+ ('07_대부도입구', '37_희망공원'): 3.3,
+ ('07_대부도입구', '38_대한통운'): 2.6,
+ ('07_대부도입구', '39_우진프라스코'): 2.3,
+ ('07_대부도입구', '40_열병합발전소'): 1.6,
+ ('07_대부도입구', '41_삼양사'): 1.1,
+ ('07_대부도입구', '42_시화염색단지입구'): 0.7,
+ ('07_대부도입구', '43_시화환경사업소'): 0.5,
+ ('07_대부도입구', '44_오이도입구'): 1.5,
+ ('07_대부도입구', '45_오이도박물관'): 3.3,
+ ('07_대부도입구', '46_함상전망대'): 2.8,
+ ('07_대부도입구', '47_오이도종합어시장'): 2.4,
+ ('07_대부도입구', '48_오이도중앙로입구'): 2.1,
+ ('07_대부도입구', '49_오이도해양단지.옥터초교입구'): 1.8,
+ ('07_대부도입구', '50_오이도차고지'): 1.5,
+ ('08_시화환경사업소', '00_오이도차고지'): 1.4,
+ ('08_시화환경사업소', '02_오이도해양단지.옥터초교입구'): 1.7,
+ ('08_시화환경사업소', '03_오이도중앙로입구'): 2.0,
+ ('08_시화환경사업소', '04_오이도종합어시장'): 2.3,
+ ('08_시화환경사업소', '05_함상전망대'): 2.5,
+ ('08_시화환경사업소', '06_오이도박물관'): 3.1,
+ ('08_시화환경사업소', '07_대부도입구'): 1.3,
+ ('08_시화환경사업소', '09_시화염색단지입구'): 0.2,
+ ('08_시화환경사업소', '10_삼양사'): 0.6,
+ ('08_시화환경사업소', '11_열병합발전소'): 1.0,
+ ('08_시화환경사업소', '12_우진플라스코'): 1.7,
+ ('08_시화환경사업소', '13_대한통운.동화산업'): 1.9,
+ ('08_시화환경사업소', '14_우석철강'): 2.3,
+ ('08_시화환경사업소', '15_파워맥스'): 2.8,
+ ('08_시화환경사업소', '16_삼화정공'): 3.2,
+ ('08_시화환경사업소', '17_홈플러스'): 3.6,
+ ('08_시화환경사업소', '18_청솔아파트'): 4.1,
+ ('08_시화환경사업소', '19_계룡1차아파트'): 4.5,
+ ('08_시화환경사업소', '20_중앙도서관'): 4.8,
+ ('08_시화환경사업소', '21_이마트'): 5.1,
+ ('08_시화환경사업소', '22_시화정형외과.이철신경외과'): 5.8,
+ ('08_시화환경사업소', '23_소방서.군서고.여성비전센터'): 5.6,
+ ('08_시화환경사업소', '24_정왕역'): 5.6,
+ ('08_시화환경사업소', '25_정왕역환승센터'): 5.8,
+ ('08_시화환경사업소', '26_소방서.군서고.여성비전센터'): 5.6,
+ ('08_시화환경사업소', '27_군서미래국제학교'): 6.0,
+ ('08_시화환경사업소', '28_시화정형외과'): 6.4,
+ ('08_시화환경사업소', '29_금강아파트'): 5.7,
+ ('08_시화환경사업소', '30_이마트'): 5.1,
+ ('08_시화환경사업소', '31_중앙도서관'): 4.8,
+ ('08_시화환경사업소', '32_세종3차아파트'): 4.3,
+ ('08_시화환경사업소', '33_진로아파트'): 4.2,
+ ('08_시화환경사업소', '34_홈플러스'): 3.6,
+ ('08_시화환경사업소', '35_동국산업'): 3.9,
+ ('08_시화환경사업소', '36_중앙알칸'): 3.2,
+ ('08_시화환경사업소', '37_희망공원'): 2.7,
+ ('08_시화환경사업소', '38_대한통운'): 2.1,
+ ('08_시화환경사업소', '39_우진프라스코'): 1.8,
+ ('08_시화환경사업소', '40_열병합발전소'): 1.0,
+ ('08_시화환경사업소', '41_삼양사'): 0.6,
+ ('08_시화환경사업소', '42_시화염색단지입구'): 0.2,
+ ('08_시화환경사업소', '43_시화환경사업소'): 0.0,
+ ('08_시화환경사업소', '44_오이도입구'): 1.2,
+ ('08_시화환경사업소', '45_오이도박물관'): 3.1,
+ ('08_시화환경사업소', '46_함상전망대'): 2.5,
+ ('08_시화환경사업소', '47_오이도종합어시장'): 2.3,
+ ('08_시화환경사업소', '48_오이도중앙로입구'): 2.0,
+ ('08_시화환경사업소', '49_오이도해양단지.옥터초교입구'): 1.7,
+ ('08_시화환경사업소', '50_오이도차고지'): 1.4,
+ ('09_시화염색단지입구', '00_오이도차고지'): 1.7,
+ ('09_시화염색단지입구', '02_오이도해양단지.옥터초교입구'): 2.0,
+ ('09_시화염색단지입구', '03_오이도중앙로입구'): 2.3,
+ ('09_시화염색단지입구', '04_오이도종합어시장'): 2.6,
+ ('09_시화염색단지입구', '05_함상전망대'): 2.3,
+ ('09_시화염색단지입구', '06_오이도박물관'): 2.9,
+ ('09_시화염색단지입구', '07_대부도입구'): 1.2,
+ ('09_시화염색단지입구', '08_시화환경사업소'): 0.8,
+ ('09_시화염색단지입구', '10_삼양사'): 0.4,
+ ('09_시화염색단지입구', '11_열병합발전소'): 0.8,
+ ('09_시화염색단지입구', '12_우진플라스코'): 1.5,
+ ('09_시화염색단지입구', '13_대한통운.동화산업'): 1.7,
+ ('09_시화염색단지입구', '14_우석철강'): 2.1,
+ ('09_시화염색단지입구', '15_파워맥스'): 2.6,
+ ('09_시화염색단지입구', '16_삼화정공'): 3.1,
+ ('09_시화염색단지입구', '17_홈플러스'): 3.4,
+ ('09_시화염색단지입구', '18_청솔아파트'): 3.9,
+ ('09_시화염색단지입구', '19_계룡1차아파트'): 4.3,
+ ('09_시화염색단지입구', '20_중앙도서관'): 4.7,
+ ('09_시화염색단지입구', '21_이마트'): 4.9,
+ ('09_시화염색단지입구', '22_시화정형외과.이철신경외과'): 5.6,
+ ('09_시화염색단지입구', '23_소방서.군서고.여성비전센터'): 5.4,
+ ('09_시화염색단지입구', '24_정왕역'): 5.4,
+ ('09_시화염색단지입구', '25_정왕역환승센터'): 5.6,
+ ('09_시화염색단지입구', '26_소방서.군서고.여성비전센터'): 5.4,
+ ('09_시화염색단지입구', '27_군서미래국제학교'): 5.8,
+ ('09_시화염색단지입구', '28_시화정형외과'): 6.2,
+ ('09_시화염색단지입구', '29_금강아파트'): 5.5,
+ ('09_시화염색단지입구', '30_이마트'): 4.9,
+ ('09_시화염색단지입구', '31_중앙도서관'): 4.7,
+ ('09_시화염색단지입구', '32_세종3차아파트'): 4.1,
+ ('09_시화염색단지입구', '33_진로아파트'): 4.1,
+ ('09_시화염색단지입구', '34_홈플러스'): 3.4,
+ ('09_시화염색단지입구', '35_동국산업'): 3.7,
+ ('09_시화염색단지입구', '36_중앙알칸'): 3.0,
+ ('09_시화염색단지입구', '37_희망공원'): 2.6,
+ ('09_시화염색단지입구', '38_대한통운'): 1.9,
+ ('09_시화염색단지입구', '39_우진프라스코'): 1.6,
+ ('09_시화염색단지입구', '40_열병합발전소'): 0.8,
+ ('09_시화염색단지입구', '41_삼양사'): 0.4,
+ ('09_시화염색단지입구', '42_시화염색단지입구'): 0.0,
+ ('09_시화염색단지입구', '43_시화환경사업소'): 0.8,
+ ('09_시화염색단지입구', '44_오이도입구'): 1.0,
+ ('09_시화염색단지입구', '45_오이도박물관'): 2.9,
+ ('09_시화염색단지입구', '46_함상전망대'): 2.3,
+ ('09_시화염색단지입구', '47_오이도종합어시장'): 2.6,
+ ('09_시화염색단지입구', '48_오이도중앙로입구'): 2.3,
+ ('09_시화염색단지입구', '49_오이도해양단지.옥터초교입구'): 2.0,
+ ('09_시화염색단지입구', '50_오이도차고지'): 1.7,
+ ('10_삼양사', '00_오이도차고지'): 1.9,
+ ('10_삼양사', '02_오이도해양단지.옥터초교입구'): 2.2,
+ ('10_삼양사', '03_오이도중앙로입구'): 2.5,
+ ('10_삼양사', '04_오이도종합어시장'): 2.8,
+ ('10_삼양사', '05_함상전망대'): 2.5,
+ ('10_삼양사', '06_오이도박물관'): 3.1,
+ ('10_삼양사', '07_대부도입구'): 1.3,
+ ('10_삼양사', '08_시화환경사업소'): 0.9,
+ ('10_삼양사', '09_시화염색단지입구'): 1.0,
+ ('10_삼양사', '11_열병합발전소'): 0.5,
+ ('10_삼양사', '12_우진플라스코'): 1.1,
+ ('10_삼양사', '13_대한통운.동화산업'): 1.3,
+ ('10_삼양사', '14_우석철강'): 1.7,
+ ('10_삼양사', '15_파워맥스'): 2.3,
+ ('10_삼양사', '16_삼화정공'): 2.7,
+ ('10_삼양사', '17_홈플러스'): 3.1,
+ ('10_삼양사', '18_청솔아파트'): 3.5,
+ ('10_삼양사', '19_계룡1차아파트'): 3.9,
+ ('10_삼양사', '20_중앙도서관'): 4.3,
+ ('10_삼양사', '21_이마트'): 4.6,
+ ('10_삼양사', '22_시화정형외과.이철신경외과'): 5.2,
+ ('10_삼양사', '23_소방서.군서고.여성비전센터'): 5.0,
+ ('10_삼양사', '24_정왕역'): 5.1,
+ ('10_삼양사', '25_정왕역환승센터'): 5.2,
+ ('10_삼양사', '26_소방서.군서고.여성비전센터'): 5.0,
+ ('10_삼양사', '27_군서미래국제학교'): 5.4,
+ ('10_삼양사', '28_시화정형외과'): 5.8,
+ ('10_삼양사', '29_금강아파트'): 5.1,
+ ('10_삼양사', '30_이마트'): 4.6,
+ ('10_삼양사', '31_중앙도서관'): 4.3,
+ ('10_삼양사', '32_세종3차아파트'): 3.8,
+ ('10_삼양사', '33_진로아파트'): 3.7,
+ ('10_삼양사', '34_홈플러스'): 3.1,
+ ('10_삼양사', '35_동국산업'): 3.3,
+ ('10_삼양사', '36_중앙알칸'): 2.7,
+ ('10_삼양사', '37_희망공원'): 2.2,
+ ('10_삼양사', '38_대한통운'): 1.5,
+ ('10_삼양사', '39_우진프라스코'): 1.2,
+ ('10_삼양사', '40_열병합발전소'): 0.5,
+ ('10_삼양사', '41_삼양사'): 0.0,
+ ('10_삼양사', '42_시화염색단지입구'): 1.0,
+ ('10_삼양사', '43_시화환경사업소'): 0.9,
+ ('10_삼양사', '44_오이도입구'): 1.1,
+ ('10_삼양사', '45_오이도박물관'): 3.1,
+ ('10_삼양사', '46_함상전망대'): 2.5,
+ ('10_삼양사', '47_오이도종합어시장'): 2.8,
+ ('10_삼양사', '48_오이도중앙로입구'): 2.5,
+ ('10_삼양사', '49_오이도해양단지.옥터초교입구'): 2.2,
+ ('10_삼양사', '50_오이도차고지'): 1.9,
+ ('11_열병합발전소', '00_오이도차고지'): 3.0,
+ ('11_열병합발전소', '02_오이도해양단지.옥터초교입구'): 3.3,
+ ('11_열병합발전소', '03_오이도중앙로입구'): 3.5,
+ ('11_열병합발전소', '04_오이도종합어시장'): 3.8,
+ ('11_열병합발전소', '05_함상전망대'): 3.6,
+ ('11_열병합발전소', '06_오이도박물관'): 4.2,
+ ('11_열병합발전소', '07_대부도입구'): 2.4,
+ ('11_열병합발전소', '08_시화환경사업소'): 2.0,
+ ('11_열병합발전소', '09_시화염색단지입구'): 2.0,
+ ('11_열병합발전소', '10_삼양사'): 1.1,
+ ('11_열병합발전소', '12_우진플라스코'): 0.6,
+ ('11_열병합발전소', '13_대한통운.동화산업'): 0.9,
+ ('11_열병합발전소', '14_우석철강'): 1.2,
+ ('11_열병합발전소', '15_파워맥스'): 1.8,
+ ('11_열병합발전소', '16_삼화정공'): 2.2,
+ ('11_열병합발전소', '17_홈플러스'): 2.6,
+ ('11_열병합발전소', '18_청솔아파트'): 3.0,
+ ('11_열병합발전소', '19_계룡1차아파트'): 3.4,
+ ('11_열병합발전소', '20_중앙도서관'): 3.8,
+ ('11_열병합발전소', '21_이마트'): 4.1,
+ ('11_열병합발전소', '22_시화정형외과.이철신경외과'): 4.7,
+ ('11_열병합발전소', '23_소방서.군서고.여성비전센터'): 4.5,
+ ('11_열병합발전소', '24_정왕역'): 4.7,
+ ('11_열병합발전소', '25_정왕역환승센터'): 4.8,
+ ('11_열병합발전소', '26_소방서.군서고.여성비전센터'): 4.5,
+ ('11_열병합발전소', '27_군서미래국제학교'): 4.9,
+ ('11_열병합발전소', '28_시화정형외과'): 5.3,
+ ('11_열병합발전소', '29_금강아파트'): 4.7,
+ ('11_열병합발전소', '30_이마트'): 4.1,
+ ('11_열병합발전소', '31_중앙도서관'): 3.8,
+ ('11_열병합발전소', '32_세종3차아파트'): 3.8,
+ ('11_열병합발전소', '33_진로아파트'): 3.4,
+ ('11_열병합발전소', '34_홈플러스'): 2.6,
+ ('11_열병합발전소', '35_동국산업'): 2.8,
+ ('11_열병합발전소', '36_중앙알칸'): 2.7,
+ ('11_열병합발전소', '37_희망공원'): 2.2,
+ ('11_열병합발전소', '38_대한통운'): 1.6,
+ ('11_열병합발전소', '39_우진프라스코'): 1.3,
+ ('11_열병합발전소', '40_열병합발전소'): 0.0,
+ ('11_열병합발전소', '41_삼양사'): 1.1,
+ ('11_열병합발전소', '42_시화염색단지입구'): 2.0,
+ ('11_열병합발전소', '43_시화환경사업소'): 2.0,
+ ('11_열병합발전소', '44_오이도입구'): 2.2,
+ ('11_열병합발전소', '45_오이도박물관'): 4.2,
+ ('11_열병합발전소', '46_함상전망대'): 3.6,
+ ('11_열병합발전소', '47_오이도종합어시장'): 3.8,
+ ('11_열병합발전소', '48_오이도중앙로입구'): 3.5,
+ ('11_열병합발전소', '49_오이도해양단지.옥터초교입구'): 3.3,
+ ('11_열병합발전소', '50_오이도차고지'): 3.0,
+ ('12_우진플라스코', '00_오이도차고지'): 2.6,
+ ('12_우진플라스코', '02_오이도해양단지.옥터초교입구'): 2.9,
+ ('12_우진플라스코', '03_오이도중앙로입구'): 3.2,
+ ('12_우진플라스코', '04_오이도종합어시장'): 3.5,
+ ('12_우진플라스코', '05_함상전망대'): 3.5,
+ ('12_우진플라스코', '06_오이도박물관'): 4.2,
+ ('12_우진플라스코', '07_대부도입구'): 2.4,
+ ('12_우진플라스코', '08_시화환경사업소'): 2.0,
+ ('12_우진플라스코', '09_시화염색단지입구'): 2.0,
+ ('12_우진플라스코', '10_삼양사'): 1.1,
+ ('12_우진플라스코', '11_열병합발전소'): 0.8,
+ ('12_우진플라스코', '13_대한통운.동화산업'): 0.2,
+ ('12_우진플라스코', '14_우석철강'): 0.6,
+ ('12_우진플라스코', '15_파워맥스'): 1.2,
+ ('12_우진플라스코', '16_삼화정공'): 1.6,
+ ('12_우진플라스코', '17_홈플러스'): 1.9,
+ ('12_우진플라스코', '18_청솔아파트'): 2.4,
+ ('12_우진플라스코', '19_계룡1차아파트'): 2.8,
+ ('12_우진플라스코', '20_중앙도서관'): 3.1,
+ ('12_우진플라스코', '21_이마트'): 3.4,
+ ('12_우진플라스코', '22_시화정형외과.이철신경외과'): 4.1,
+ ('12_우진플라스코', '23_소방서.군서고.여성비전센터'): 3.9,
+ ('12_우진플라스코', '24_정왕역'): 3.9,
+ ('12_우진플라스코', '25_정왕역환승센터'): 4.2,
+ ('12_우진플라스코', '26_소방서.군서고.여성비전센터'): 3.9,
+ ('12_우진플라스코', '27_군서미래국제학교'): 4.3,
+ ('12_우진플라스코', '28_시화정형외과'): 4.7,
+ ('12_우진플라스코', '29_금강아파트'): 4.0,
+ ('12_우진플라스코', '30_이마트'): 3.4,
+ ('12_우진플라스코', '31_중앙도서관'): 3.1,
+ ('12_우진플라스코', '32_세종3차아파트'): 3.2,
+ ('12_우진플라스코', '33_진로아파트'): 2.8,
+ ('12_우진플라스코', '34_홈플러스'): 1.9,
+ ('12_우진플라스코', '35_동국산업'): 2.2,
+ ('12_우진플라스코', '36_중앙알칸'): 2.1,
+ ('12_우진플라스코', '37_희망공원'): 1.6,
+ ('12_우진플라스코', '38_대한통운'): 0.9,
+ ('12_우진플라스코', '39_우진프라스코'): 0.0,
+ ('12_우진플라스코', '40_열병합발전소'): 0.8,
+ ('12_우진플라스코', '41_삼양사'): 1.1,
+ ('12_우진플라스코', '42_시화염색단지입구'): 2.0,
+ ('12_우진플라스코', '43_시화환경사업소'): 2.0,
+ ('12_우진플라스코', '44_오이도입구'): 2.2,
+ ('12_우진플라스코', '45_오이도박물관'): 4.2,
+ ('12_우진플라스코', '46_함상전망대'): 3.5,
+ ('12_우진플라스코', '47_오이도종합어시장'): 3.5,
+ ('12_우진플라스코', '48_오이도중앙로입구'): 3.2,
+ ('12_우진플라스코', '49_오이도해양단지.옥터초교입구'): 2.9,
+ ('12_우진플라스코', '50_오이도차고지'): 2.6,
+ ('13_대한통운.동화산업', '00_오이도차고지'): 2.4,
+ ('13_대한통운.동화산업', '02_오이도해양단지.옥터초교입구'): 2.7,
+ ('13_대한통운.동화산업', '03_오이도중앙로입구'): 3.0,
+ ('13_대한통운.동화산업', '04_오이도종합어시장'): 3.3,
+ ('13_대한통운.동화산업', '05_함상전망대'): 3.6,
+ ('13_대한통운.동화산업', '06_오이도박물관'): 4.2,
+ ('13_대한통운.동화산업', '07_대부도입구'): 2.6,
+ ('13_대한통운.동화산업', '08_시화환경사업소'): 2.2,
+ ('13_대한통운.동화산업', '09_시화염색단지입구'): 2.1,
+ ('13_대한통운.동화산업', '10_삼양사'): 1.3,
+ ('13_대한통운.동화산업', '11_열병합발전소'): 1.0,
+ ('13_대한통운.동화산업', '12_우진플라스코'): 1.1,
+ ('13_대한통운.동화산업', '14_우석철강'): 0.4,
+ ('13_대한통운.동화산업', '15_파워맥스'): 0.9,
+ ('13_대한통운.동화산업', '16_삼화정공'): 1.4,
+ ('13_대한통운.동화산업', '17_홈플러스'): 1.7,
+ ('13_대한통운.동화산업', '18_청솔아파트'): 2.2,
+ ('13_대한통운.동화산업', '19_계룡1차아파트'): 2.6,
+ ('13_대한통운.동화산업', '20_중앙도서관'): 2.9,
+ ('13_대한통운.동화산업', '21_이마트'): 3.2,
+ ('13_대한통운.동화산업', '22_시화정형외과.이철신경외과'): 3.9,
+ ('13_대한통운.동화산업', '23_소방서.군서고.여성비전센터'): 3.7,
+ ('13_대한통운.동화산업', '24_정왕역'): 3.7,
+ ('13_대한통운.동화산업', '25_정왕역환승센터'): 4.0,
+ ('13_대한통운.동화산업', '26_소방서.군서고.여성비전센터'): 3.7,
+ ('13_대한통운.동화산업', '27_군서미래국제학교'): 4.1,
+ ('13_대한통운.동화산업', '28_시화정형외과'): 4.5,
+ ('13_대한통운.동화산업', '29_금강아파트'): 3.8,
+ ('13_대한통운.동화산업', '30_이마트'): 3.2,
+ ('13_대한통운.동화산업', '31_중앙도서관'): 2.9,
+ ('13_대한통운.동화산업', '32_세종3차아파트'): 2.9,
+ ('13_대한통운.동화산업', '33_진로아파트'): 2.5,
+ ('13_대한통운.동화산업', '34_홈플러스'): 1.7,
+ ('13_대한통운.동화산업', '35_동국산업'): 2.0,
+ ('13_대한통운.동화산업', '36_중앙알칸'): 1.8,
+ ('13_대한통운.동화산업', '37_희망공원'): 1.4,
+ ('13_대한통운.동화산업', '38_대한통운'): 0.1,
+ ('13_대한통운.동화산업', '39_우진프라스코'): 0.2,
+ ('13_대한통운.동화산업', '40_열병합발전소'): 1.0,
+ ('13_대한통운.동화산업', '41_삼양사'): 1.3,
+ ('13_대한통운.동화산업', '42_시화염색단지입구'): 2.1,
+ ('13_대한통운.동화산업', '43_시화환경사업소'): 2.2,
+ ('13_대한통운.동화산업', '44_오이도입구'): 2.4,
+ ('13_대한통운.동화산업', '45_오이도박물관'): 4.2,
+ ('13_대한통운.동화산업', '46_함상전망대'): 3.6,
+ ('13_대한통운.동화산업', '47_오이도종합어시장'): 3.3,
+ ('13_대한통운.동화산업', '48_오이도중앙로입구'): 3.0,
+ ('13_대한통운.동화산업', '49_오이도해양단지.옥터초교입구'): 2.7,
+ ('13_대한통운.동화산업', '50_오이도차고지'): 2.4,
+ ('14_우석철강', '00_오이도차고지'): 2.6,
+ ('14_우석철강', '02_오이도해양단지.옥터초교입구'): 2.9,
+ ('14_우석철강', '03_오이도중앙로입구'): 3.2,
+ ('14_우석철강', '04_오이도종합어시장'): 3.5,
+ ('14_우석철강', '05_함상전망대'): 3.9,
+ ('14_우석철강', '06_오이도박물관'): 4.4,
+ ('14_우석철강', '07_대부도입구'): 3.0,
+ ('14_우석철강', '08_시화환경사업소'): 2.6,
+ ('14_우석철강', '09_시화염색단지입구'): 2.4,
+ ('14_우석철강', '10_삼양사'): 1.7,
+ ('14_우석철강', '11_열병합발전소'): 1.4,
+ ('14_우석철강', '12_우진플라스코'): 1.5,
+ ('14_우석철강', '13_대한통운.동화산업'): 1.2,
+ ('14_우석철강', '15_파워맥스'): 0.6,
+ ('14_우석철강', '16_삼화정공'): 1.0,
+ ('14_우석철강', '17_홈플러스'): 1.3,
+ ('14_우석철강', '18_청솔아파트'): 1.8,
+ ('14_우석철강', '19_계룡1차아파트'): 2.2,
+ ('14_우석철강', '20_중앙도서관'): 2.6,
+ ('14_우석철강', '21_이마트'): 2.8,
+ ('14_우석철강', '22_시화정형외과.이철신경외과'): 3.5,
+ ('14_우석철강', '23_소방서.군서고.여성비전센터'): 3.3,
+ ('14_우석철강', '24_정왕역'): 3.3,
+ ('14_우석철강', '25_정왕역환승센터'): 3.6,
+ ('14_우석철강', '26_소방서.군서고.여성비전센터'): 3.3,
+ ('14_우석철강', '27_군서미래국제학교'): 3.7,
+ ('14_우석철강', '28_시화정형외과'): 4.1,
+ ('14_우석철강', '29_금강아파트'): 3.4,
+ ('14_우석철강', '30_이마트'): 2.8,
+ ('14_우석철강', '31_중앙도서관'): 2.6,
+ ('14_우석철강', '32_세종3차아파트'): 2.6,
+ ('14_우석철강', '33_진로아파트'): 2.2,
+ ('14_우석철강', '34_홈플러스'): 1.3,
+ ('14_우석철강', '35_동국산업'): 1.6,
+ ('14_우석철강', '36_중앙알칸'): 1.5,
+ ('14_우석철강', '37_희망공원'): 0.0,
+ ('14_우석철강', '38_대한통운'): 0.4,
+ ('14_우석철강', '39_우진프라스코'): 0.6,
+ ('14_우석철강', '40_열병합발전소'): 1.4,
+ ('14_우석철강', '41_삼양사'): 1.7,
+ ('14_우석철강', '42_시화염색단지입구'): 2.4,
+ ('14_우석철강', '43_시화환경사업소'): 2.6,
+ ('14_우석철강', '44_오이도입구'): 2.8,
+ ('14_우석철강', '45_오이도박물관'): 4.4,
+ ('14_우석철강', '46_함상전망대'): 3.9,
+ ('14_우석철강', '47_오이도종합어시장'): 3.5,
+ ('14_우석철강', '48_오이도중앙로입구'): 3.2,
+ ('14_우석철강', '49_오이도해양단지.옥터초교입구'): 2.9,
+ ('14_우석철강', '50_오이도차고지'): 2.6,
+ ('15_파워맥스', '00_오이도차고지'): 3.2,
+ ('15_파워맥스', '02_오이도해양단지.옥터초교입구'): 3.0,
+ ('15_파워맥스', '03_오이도중앙로입구'): 3.3,
+ ('15_파워맥스', '04_오이도종합어시장'): 3.6,
+ ('15_파워맥스', '05_함상전망대'): 4.0,
+ ('15_파워맥스', '06_오이도박물관'): 4.6,
+ ('15_파워맥스', '07_대부도입구'): 3.6,
+ ('15_파워맥스', '08_시화환경사업소'): 3.2,
+ ('15_파워맥스', '09_시화염색단지입구'): 2.9,
+ ('15_파워맥스', '10_삼양사'): 2.3,
+ ('15_파워맥스', '11_열병합발전소'): 2.0,
+ ('15_파워맥스', '12_우진플라스코'): 2.1,
+ ('15_파워맥스', '13_대한통운.동화산업'): 1.8,
+ ('15_파워맥스', '14_우석철강'): 1.2,
+ ('15_파워맥스', '16_삼화정공'): 0.4,
+ ('15_파워맥스', '17_홈플러스'): 0.8,
+ ('15_파워맥스', '18_청솔아파트'): 1.2,
+ ('15_파워맥스', '19_계룡1차아파트'): 1.6,
+ ('15_파워맥스', '20_중앙도서관'): 2.0,
+ ('15_파워맥스', '21_이마트'): 2.3,
+ ('15_파워맥스', '22_시화정형외과.이철신경외과'): 2.9,
+ ('15_파워맥스', '23_소방서.군서고.여성비전센터'): 2.7,
+ ('15_파워맥스', '24_정왕역'): 2.8,
+ ('15_파워맥스', '25_정왕역환승센터'): 3.0,
+ ('15_파워맥스', '26_소방서.군서고.여성비전센터'): 2.7,
+ ('15_파워맥스', '27_군서미래국제학교'): 3.1,
+ ('15_파워맥스', '28_시화정형외과'): 3.5,
+ ('15_파워맥스', '29_금강아파트'): 2.9,
+ ('15_파워맥스', '30_이마트'): 2.3,
+ ('15_파워맥스', '31_중앙도서관'): 2.0,
+ ('15_파워맥스', '32_세종3차아파트'): 2.0,
+ ('15_파워맥스', '33_진로아파트'): 1.6,
+ ('15_파워맥스', '34_홈플러스'): 0.8,
+ ('15_파워맥스', '35_동국산업'): 1.0,
+ ('15_파워맥스', '36_중앙알칸'): 0.0,
+ ('15_파워맥스', '37_희망공원'): 0.6,
+ ('15_파워맥스', '38_대한통운'): 1.0,
+ ('15_파워맥스', '39_우진프라스코'): 1.2,
+ ('15_파워맥스', '40_열병합발전소'): 2.0,
+ ('15_파워맥스', '41_삼양사'): 2.3,
+ ('15_파워맥스', '42_시화염색단지입구'): 2.9,
+ ('15_파워맥스', '43_시화환경사업소'): 3.2,
+ ('15_파워맥스', '44_오이도입구'): 3.4,
+ ('15_파워맥스', '45_오이도박물관'): 4.6,
+ ('15_파워맥스', '46_함상전망대'): 4.0,
+ ('15_파워맥스', '47_오이도종합어시장'): 3.6,
+ ('15_파워맥스', '48_오이도중앙로입구'): 3.3,
+ ('15_파워맥스', '49_오이도해양단지.옥터초교입구'): 3.0,
+ ('15_파워맥스', '50_오이도차고지'): 3.2,
+ ('16_삼화정공', '00_오이도차고지'): 3.6,
+ ('16_삼화정공', '02_오이도해양단지.옥터초교입구'): 3.3,
+ ('16_삼화정공', '03_오이도중앙로입구'): 3.6,
+ ('16_삼화정공', '04_오이도종합어시장'): 3.9,
+ ('16_삼화정공', '05_함상전망대'): 4.3,
+ ('16_삼화정공', '06_오이도박물관'): 4.9,
+ ('16_삼화정공', '07_대부도입구'): 4.0,
+ ('16_삼화정공', '08_시화환경사업소'): 3.6,
+ ('16_삼화정공', '09_시화염색단지입구'): 3.3,
+ ('16_삼화정공', '10_삼양사'): 2.7,
+ ('16_삼화정공', '11_열병합발전소'): 2.4,
+ ('16_삼화정공', '12_우진플라스코'): 2.5,
+ ('16_삼화정공', '13_대한통운.동화산업'): 2.2,
+ ('16_삼화정공', '14_우석철강'): 1.6,
+ ('16_삼화정공', '15_파워맥스'): 1.1,
+ ('16_삼화정공', '17_홈플러스'): 0.4,
+ ('16_삼화정공', '18_청솔아파트'): 0.8,
+ ('16_삼화정공', '19_계룡1차아파트'): 1.2,
+ ('16_삼화정공', '20_중앙도서관'): 1.6,
+ ('16_삼화정공', '21_이마트'): 1.8,
+ ('16_삼화정공', '22_시화정형외과.이철신경외과'): 2.5,
+ ('16_삼화정공', '23_소방서.군서고.여성비전센터'): 2.3,
+ ('16_삼화정공', '24_정왕역'): 2.3,
+ ('16_삼화정공', '25_정왕역환승센터'): 2.5,
+ ('16_삼화정공', '26_소방서.군서고.여성비전센터'): 2.3,
+ ('16_삼화정공', '27_군서미래국제학교'): 2.7,
+ ('16_삼화정공', '28_시화정형외과'): 3.1,
+ ('16_삼화정공', '29_금강아파트'): 2.4,
+ ('16_삼화정공', '30_이마트'): 1.8,
+ ('16_삼화정공', '31_중앙도서관'): 1.6,
+ ('16_삼화정공', '32_세종3차아파트'): 1.6,
+ ('16_삼화정공', '33_진로아파트'): 1.2,
+ ('16_삼화정공', '34_홈플러스'): 0.4,
+ ('16_삼화정공', '35_동국산업'): 0.0,
+ ('16_삼화정공', '36_중앙알칸'): 0.4,
+ ('16_삼화정공', '37_희망공원'): 1.0,
+ ('16_삼화정공', '38_대한통운'): 1.4,
+ ('16_삼화정공', '39_우진프라스코'): 1.6,
+ ('16_삼화정공', '40_열병합발전소'): 2.4,
+ ('16_삼화정공', '41_삼양사'): 2.7,
+ ('16_삼화정공', '42_시화염색단지입구'): 3.3,
+ ('16_삼화정공', '43_시화환경사업소'): 3.6,
+ ('16_삼화정공', '44_오이도입구'): 3.8,
+ ('16_삼화정공', '45_오이도박물관'): 4.9,
+ ('16_삼화정공', '46_함상전망대'): 4.3,
+ ('16_삼화정공', '47_오이도종합어시장'): 3.9,
+ ('16_삼화정공', '48_오이도중앙로입구'): 3.6,
+ ('16_삼화정공', '49_오이도해양단지.옥터초교입구'): 3.3,
+ ('16_삼화정공', '50_오이도차고지'): 3.6,
+ ('17_홈플러스', '00_오이도차고지'): 3.8,
+ ('17_홈플러스', '02_오이도해양단지.옥터초교입구'): 3.6,
+ ('17_홈플러스', '03_오이도중앙로입구'): 3.8,
+ ('17_홈플러스', '04_오이도종합어시장'): 4.1,
+ ('17_홈플러스', '05_함상전망대'): 4.5,
+ ('17_홈플러스', '06_오이도박물관'): 5.1,
+ ('17_홈플러스', '07_대부도입구'): 4.3,
+ ('17_홈플러스', '08_시화환경사업소'): 3.9,
+ ('17_홈플러스', '09_시화염색단지입구'): 3.7,
+ ('17_홈플러스', '10_삼양사'): 3.1,
+ ('17_홈플러스', '11_열병합발전소'): 2.7,
+ ('17_홈플러스', '12_우진플라스코'): 2.8,
+ ('17_홈플러스', '13_대한통운.동화산업'): 2.5,
+ ('17_홈플러스', '14_우석철강'): 1.9,
+ ('17_홈플러스', '15_파워맥스'): 1.4,
+ ('17_홈플러스', '16_삼화정공'): 1.3,
+ ('17_홈플러스', '18_청솔아파트'): 0.5,
+ ('17_홈플러스', '19_계룡1차아파트'): 0.9,
+ ('17_홈플러스', '20_중앙도서관'): 1.2,
+ ('17_홈플러스', '21_이마트'): 1.5,
+ ('17_홈플러스', '22_시화정형외과.이철신경외과'): 2.1,
+ ('17_홈플러스', '23_소방서.군서고.여성비전센터'): 2.0,
+ ('17_홈플러스', '24_정왕역'): 2.0,
+ ('17_홈플러스', '25_정왕역환승센터'): 2.2,
+ ('17_홈플러스', '26_소방서.군서고.여성비전센터'): 2.0,
+ ('17_홈플러스', '27_군서미래국제학교'): 2.3,
+ ('17_홈플러스', '28_시화정형외과'): 2.7,
+ ('17_홈플러스', '29_금강아파트'): 2.1,
+ ('17_홈플러스', '30_이마트'): 1.5,
+ ('17_홈플러스', '31_중앙도서관'): 1.2,
+ ('17_홈플러스', '32_세종3차아파트'): 1.2,
+ ('17_홈플러스', '33_진로아파트'): 0.8,
+ ('17_홈플러스', '34_홈플러스'): 0.0,
+ ('17_홈플러스', '35_동국산업'): 0.4,
+ ('17_홈플러스', '36_중앙알칸'): 0.8,
+ ('17_홈플러스', '37_희망공원'): 1.3,
+ ('17_홈플러스', '38_대한통운'): 1.8,
+ ('17_홈플러스', '39_우진프라스코'): 1.9,
+ ('17_홈플러스', '40_열병합발전소'): 2.7,
+ ('17_홈플러스', '41_삼양사'): 3.1,
+ ('17_홈플러스', '42_시화염색단지입구'): 3.7,
+ ('17_홈플러스', '43_시화환경사업소'): 3.9,
+ ('17_홈플러스', '44_오이도입구'): 4.1,
+ ('17_홈플러스', '45_오이도박물관'): 5.1,
+ ('17_홈플러스', '46_함상전망대'): 4.5,
+ ('17_홈플러스', '47_오이도종합어시장'): 4.1,
+ ('17_홈플러스', '48_오이도중앙로입구'): 3.8,
+ ('17_홈플러스', '49_오이도해양단지.옥터초교입구'): 3.6,
+ ('17_홈플러스', '50_오이도차고지'): 3.8,
+ ('18_청솔아파트', '00_오이도차고지'): 4.4,
+ ('18_청솔아파트', '02_오이도해양단지.옥터초교입구'): 4.2,
+ ('18_청솔아파트', '03_오이도중앙로입구'): 4.4,
+ ('18_청솔아파트', '04_오이도종합어시장'): 4.7,
+ ('18_청솔아파트', '05_함상전망대'): 5.1,
+ ('18_청솔아파트', '06_오이도박물관'): 5.7,
+ ('18_청솔아파트', '07_대부도입구'): 4.8,
+ ('18_청솔아파트', '08_시화환경사업소'): 4.5,
+ ('18_청솔아파트', '09_시화염색단지입구'): 4.4,
+ ('18_청솔아파트', '10_삼양사'): 3.7,
+ ('18_청솔아파트', '11_열병합발전소'): 3.4,
+ ('18_청솔아파트', '12_우진플라스코'): 3.5,
+ ('18_청솔아파트', '13_대한통운.동화산업'): 3.2,
+ ('18_청솔아파트', '14_우석철강'): 2.6,
+ ('18_청솔아파트', '15_파워맥스'): 2.1,
+ ('18_청솔아파트', '16_삼화정공'): 2.0,
+ ('18_청솔아파트', '17_홈플러스'): 1.8,
+ ('18_청솔아파트', '19_계룡1차아파트'): 0.4,
+ ('18_청솔아파트', '20_중앙도서관'): 0.8,
+ ('18_청솔아파트', '21_이마트'): 1.0,
+ ('18_청솔아파트', '22_시화정형외과.이철신경외과'): 1.7,
+ ('18_청솔아파트', '23_소방서.군서고.여성비전센터'): 1.5,
+ ('18_청솔아파트', '24_정왕역'): 1.5,
+ ('18_청솔아파트', '25_정왕역환승센터'): 1.7,
+ ('18_청솔아파트', '26_소방서.군서고.여성비전센터'): 1.5,
+ ('18_청솔아파트', '27_군서미래국제학교'): 1.9,
+ ('18_청솔아파트', '28_시화정형외과'): 2.3,
+ ('18_청솔아파트', '29_금강아파트'): 1.6,
+ ('18_청솔아파트', '30_이마트'): 1.0,
+ ('18_청솔아파트', '31_중앙도서관'): 0.8,
+ ('18_청솔아파트', '32_세종3차아파트'): 0.8,
+ ('18_청솔아파트', '33_진로아파트'): 0.4,
+ ('18_청솔아파트', '34_홈플러스'): 1.8,
+ ('18_청솔아파트', '35_동국산업'): 1.1,
+ ('18_청솔아파트', '36_중앙알칸'): 1.5,
+ ('18_청솔아파트', '37_희망공원'): 2.0,
+ ('18_청솔아파트', '38_대한통운'): 2.5,
+ ('18_청솔아파트', '39_우진프라스코'): 2.6,
+ ('18_청솔아파트', '40_열병합발전소'): 3.4,
+ ('18_청솔아파트', '41_삼양사'): 3.7,
+ ('18_청솔아파트', '42_시화염색단지입구'): 4.4,
+ ('18_청솔아파트', '43_시화환경사업소'): 4.5,
+ ('18_청솔아파트', '44_오이도입구'): 4.6,
+ ('18_청솔아파트', '45_오이도박물관'): 5.7,
+ ('18_청솔아파트', '46_함상전망대'): 5.1,
+ ('18_청솔아파트', '47_오이도종합어시장'): 4.7,
+ ('18_청솔아파트', '48_오이도중앙로입구'): 4.4,
+ ('18_청솔아파트', '49_오이도해양단지.옥터초교입구'): 4.2,
+ ('18_청솔아파트', '50_오이도차고지'): 4.4,
+ ('19_계룡1차아파트', '00_오이도차고지'): 5.0,
+ ('19_계룡1차아파트', '02_오이도해양단지.옥터초교입구'): 4.7,
+ ('19_계룡1차아파트', '03_오이도중앙로입구'): 5.0,
+ ('19_계룡1차아파트', '04_오이도종합어시장'): 5.3,
+ ('19_계룡1차아파트', '05_함상전망대'): 5.6,
+ ('19_계룡1차아파트', '06_오이도박물관'): 6.2,
+ ('19_계룡1차아파트', '07_대부도입구'): 5.4,
+ ('19_계룡1차아파트', '08_시화환경사업소'): 5.0,
+ ('19_계룡1차아파트', '09_시화염색단지입구'): 4.9,
+ ('19_계룡1차아파트', '10_삼양사'): 4.3,
+ ('19_계룡1차아파트', '11_열병합발전소'): 4.0,
+ ('19_계룡1차아파트', '12_우진플라스코'): 4.2,
+ ('19_계룡1차아파트', '13_대한통운.동화산업'): 3.8,
+ ('19_계룡1차아파트', '14_우석철강'): 3.2,
+ ('19_계룡1차아파트', '15_파워맥스'): 2.7,
+ ('19_계룡1차아파트', '16_삼화정공'): 2.6,
+ ('19_계룡1차아파트', '17_홈플러스'): 1.8,
+ ('19_계룡1차아파트', '18_청솔아파트'): 0.8,
+ ('19_계룡1차아파트', '20_중앙도서관'): 0.4,
+ ('19_계룡1차아파트', '21_이마트'): 0.6,
+ ('19_계룡1차아파트', '22_시화정형외과.이철신경외과'): 1.3,
+ ('19_계룡1차아파트', '23_소방서.군서고.여성비전센터'): 1.1,
+ ('19_계룡1차아파트', '24_정왕역'): 1.1,
+ ('19_계룡1차아파트', '25_정왕역환승센터'): 1.3,
+ ('19_계룡1차아파트', '26_소방서.군서고.여성비전센터'): 1.1,
+ ('19_계룡1차아파트', '27_군서미래국제학교'): 1.5,
+ ('19_계룡1차아파트', '28_시화정형외과'): 1.9,
+ ('19_계룡1차아파트', '29_금강아파트'): 1.2,
+ ('19_계룡1차아파트', '30_이마트'): 0.6,
+ ('19_계룡1차아파트', '31_중앙도서관'): 0.4,
+ ('19_계룡1차아파트', '32_세종3차아파트'): 0.9,
+ ('19_계룡1차아파트', '33_진로아파트'): 0.9,
+ ('19_계룡1차아파트', '34_홈플러스'): 1.8,
+ ('19_계룡1차아파트', '35_동국산업'): 1.6,
+ ('19_계룡1차아파트', '36_중앙알칸'): 2.0,
+ ('19_계룡1차아파트', '37_희망공원'): 2.6,
+ ('19_계룡1차아파트', '38_대한통운'): 3.0,
+ ('19_계룡1차아파트', '39_우진프라스코'): 3.2,
+ ('19_계룡1차아파트', '40_열병합발전소'): 4.0,
+ ('19_계룡1차아파트', '41_삼양사'): 4.3,
+ ('19_계룡1차아파트', '42_시화염색단지입구'): 4.9,
+ ('19_계룡1차아파트', '43_시화환경사업소'): 5.0,
+ ('19_계룡1차아파트', '44_오이도입구'): 5.2,
+ ('19_계룡1차아파트', '45_오이도박물관'): 6.2,
+ ('19_계룡1차아파트', '46_함상전망대'): 5.6,
+ ('19_계룡1차아파트', '47_오이도종합어시장'): 5.3,
+ ('19_계룡1차아파트', '48_오이도중앙로입구'): 5.0,
+ ('19_계룡1차아파트', '49_오이도해양단지.옥터초교입구'): 4.7,
+ ('19_계룡1차아파트', '50_오이도차고지'): 5.0,
+ ('20_중앙도서관', '00_오이도차고지'): 5.1,
+ ('20_중앙도서관', '02_오이도해양단지.옥터초교입구'): 4.8,
+ ('20_중앙도서관', '03_오이도중앙로입구'): 5.1,
+ ('20_중앙도서관', '04_오이도종합어시장'): 5.4,
+ ('20_중앙도서관', '05_함상전망대'): 5.8,
+ ('20_중앙도서관', '06_오이도박물관'): 6.4,
+ ('20_중앙도서관', '07_대부도입구'): 5.5,
+ ('20_중앙도서관', '08_시화환경사업소'): 5.1,
+ ('20_중앙도서관', '09_시화염색단지입구'): 5.1,
+ ('20_중앙도서관', '10_삼양사'): 4.4,
+ ('20_중앙도서관', '11_열병합발전소'): 4.1,
+ ('20_중앙도서관', '12_우진플라스코'): 3.8,
+ ('20_중앙도서관', '13_대한통운.동화산업'): 3.6,
+ ('20_중앙도서관', '14_우석철강'): 2.9,
+ ('20_중앙도서관', '15_파워맥스'): 2.3,
+ ('20_중앙도서관', '16_삼화정공'): 2.2,
+ ('20_중앙도서관', '17_홈플러스'): 1.5,
+ ('20_중앙도서관', '18_청솔아파트'): 0.9,
+ ('20_중앙도서관', '19_계룡1차아파트'): 0.6,
+ ('20_중앙도서관', '21_이마트'): 0.3,
+ ('20_중앙도서관', '22_시화정형외과.이철신경외과'): 0.9,
+ ('20_중앙도서관', '23_소방서.군서고.여성비전센터'): 0.7,
+ ('20_중앙도서관', '24_정왕역'): 0.9,
+ ('20_중앙도서관', '25_정왕역환승센터'): 1.0,
+ ('20_중앙도서관', '26_소방서.군서고.여성비전센터'): 0.7,
+ ('20_중앙도서관', '27_군서미래국제학교'): 1.1,
+ ('20_중앙도서관', '28_시화정형외과'): 1.5,
+ ('20_중앙도서관', '29_금강아파트'): 0.8,
+ ('20_중앙도서관', '30_이마트'): 0.3,
+ ('20_중앙도서관', '31_중앙도서관'): 0.0,
+ ('20_중앙도서관', '32_세종3차아파트'): 1.0,
+ ('20_중앙도서관', '33_진로아파트'): 1.1,
+ ('20_중앙도서관', '34_홈플러스'): 1.5,
+ ('20_중앙도서관', '35_동국산업'): 1.7,
+ ('20_중앙도서관', '36_중앙알칸'): 2.2,
+ ('20_중앙도서관', '37_희망공원'): 2.7,
+ ('20_중앙도서관', '38_대한통운'): 3.1,
+ ('20_중앙도서관', '39_우진프라스코'): 3.3,
+ ('20_중앙도서관', '40_열병합발전소'): 4.1,
+ ('20_중앙도서관', '41_삼양사'): 4.4,
+ ('20_중앙도서관', '42_시화염색단지입구'): 5.1,
+ ('20_중앙도서관', '43_시화환경사업소'): 5.1,
+ ('20_중앙도서관', '44_오이도입구'): 5.3,
+ ('20_중앙도서관', '45_오이도박물관'): 6.4,
+ ('20_중앙도서관', '46_함상전망대'): 5.8,
+ ('20_중앙도서관', '47_오이도종합어시장'): 5.4,
+ ('20_중앙도서관', '48_오이도중앙로입구'): 5.1,
+ ('20_중앙도서관', '49_오이도해양단지.옥터초교입구'): 4.8,
+ ('20_중앙도서관', '50_오이도차고지'): 5.1,
+ ('21_이마트', '00_오이도차고지'): 5.6,
+ ('21_이마트', '02_오이도해양단지.옥터초교입구'): 5.4,
+ ('21_이마트', '03_오이도중앙로입구'): 5.6,
+ ('21_이마트', '04_오이도종합어시장'): 5.9,
+ ('21_이마트', '05_함상전망대'): 6.3,
+ ('21_이마트', '06_오이도박물관'): 6.9,
+ ('21_이마트', '07_대부도입구'): 6.0,
+ ('21_이마트', '08_시화환경사업소'): 5.7,
+ ('21_이마트', '09_시화염색단지입구'): 5.6,
+ ('21_이마트', '10_삼양사'): 5.0,
+ ('21_이마트', '11_열병합발전소'): 4.7,
+ ('21_이마트', '12_우진플라스코'): 4.2,
+ ('21_이마트', '13_대한통운.동화산업'): 3.9,
+ ('21_이마트', '14_우석철강'): 3.3,
+ ('21_이마트', '15_파워맥스'): 2.8,
+ ('21_이마트', '16_삼화정공'): 2.7,
+ ('21_이마트', '17_홈플러스'): 2.0,
+ ('21_이마트', '18_청솔아파트'): 1.4,
+ ('21_이마트', '19_계룡1차아파트'): 1.2,
+ ('21_이마트', '20_중앙도서관'): 1.0,
+ ('21_이마트', '22_시화정형외과.이철신경외과'): 0.7,
+ ('21_이마트', '23_소방서.군서고.여성비전센터'): 0.9,
+ ('21_이마트', '24_정왕역'): 1.2,
+ ('21_이마트', '25_정왕역환승센터'): 1.2,
+ ('21_이마트', '26_소방서.군서고.여성비전센터'): 0.9,
+ ('21_이마트', '27_군서미래국제학교'): 0.9,
+ ('21_이마트', '28_시화정형외과'): 1.2,
+ ('21_이마트', '29_금강아파트'): 0.6,
+ ('21_이마트', '30_이마트'): 0.0,
+ ('21_이마트', '31_중앙도서관'): 1.0,
+ ('21_이마트', '32_세종3차아파트'): 1.5,
+ ('21_이마트', '33_진로아파트'): 1.6,
+ ('21_이마트', '34_홈플러스'): 2.0,
+ ('21_이마트', '35_동국산업'): 2.3,
+ ('21_이마트', '36_중앙알칸'): 2.7,
+ ('21_이마트', '37_희망공원'): 3.2,
+ ('21_이마트', '38_대한통운'): 3.7,
+ ('21_이마트', '39_우진프라스코'): 3.8,
+ ('21_이마트', '40_열병합발전소'): 4.7,
+ ('21_이마트', '41_삼양사'): 5.0,
+ ('21_이마트', '42_시화염색단지입구'): 5.6,
+ ('21_이마트', '43_시화환경사업소'): 5.7,
+ ('21_이마트', '44_오이도입구'): 5.9,
+ ('21_이마트', '45_오이도박물관'): 6.9,
+ ('21_이마트', '46_함상전망대'): 6.3,
+ ('21_이마트', '47_오이도종합어시장'): 5.9,
+ ('21_이마트', '48_오이도중앙로입구'): 5.6,
+ ('21_이마트', '49_오이도해양단지.옥터초교입구'): 5.4,
+ ('21_이마트', '50_오이도차고지'): 5.6,
+ ('22_시화정형외과.이철신경외과', '00_오이도차고지'): 6.5,
+ ('22_시화정형외과.이철신경외과', '02_오이도해양단지.옥터초교입구'): 6.2,
+ ('22_시화정형외과.이철신경외과', '03_오이도중앙로입구'): 6.5,
+ ('22_시화정형외과.이철신경외과', '04_오이도종합어시장'): 6.8,
+ ('22_시화정형외과.이철신경외과', '05_함상전망대'): 7.1,
+ ('22_시화정형외과.이철신경외과', '06_오이도박물관'): 7.7,
+ ('22_시화정형외과.이철신경외과', '07_대부도입구'): 6.9,
+ ('22_시화정형외과.이철신경외과', '08_시화환경사업소'): 6.5,
+ ('22_시화정형외과.이철신경외과', '09_시화염색단지입구'): 6.5,
+ ('22_시화정형외과.이철신경외과', '10_삼양사'): 5.8,
+ ('22_시화정형외과.이철신경외과', '11_열병합발전소'): 5.5,
+ ('22_시화정형외과.이철신경외과', '12_우진플라스코'): 5.1,
+ ('22_시화정형외과.이철신경외과', '13_대한통운.동화산업'): 4.8,
+ ('22_시화정형외과.이철신경외과', '14_우석철강'): 4.2,
+ ('22_시화정형외과.이철신경외과', '15_파워맥스'): 3.7,
+ ('22_시화정형외과.이철신경외과', '16_삼화정공'): 3.6,
+ ('22_시화정형외과.이철신경외과', '17_홈플러스'): 2.9,
+ ('22_시화정형외과.이철신경외과', '18_청솔아파트'): 2.3,
+ ('22_시화정형외과.이철신경외과', '19_계룡1차아파트'): 2.0,
+ ('22_시화정형외과.이철신경외과', '20_중앙도서관'): 1.9,
+ ('22_시화정형외과.이철신경외과', '21_이마트'): 1.5,
+ ('22_시화정형외과.이철신경외과', '23_소방서.군서고.여성비전센터'): 0.8,
+ ('22_시화정형외과.이철신경외과', '24_정왕역'): 1.2,
+ ('22_시화정형외과.이철신경외과', '25_정왕역환승센터'): 1.1,
+ ('22_시화정형외과.이철신경외과', '26_소방서.군서고.여성비전센터'): 0.8,
+ ('22_시화정형외과.이철신경외과', '27_군서미래국제학교'): 0.2,
+ ('22_시화정형외과.이철신경외과', '28_시화정형외과'): 0.6,
+ ('22_시화정형외과.이철신경외과', '29_금강아파트'): 0.8,
+ ('22_시화정형외과.이철신경외과', '30_이마트'): 1.5,
+ ('22_시화정형외과.이철신경외과', '31_중앙도서관'): 1.9,
+ ('22_시화정형외과.이철신경외과', '32_세종3차아파트'): 2.4,
+ ('22_시화정형외과.이철신경외과', '33_진로아파트'): 2.5,
+ ('22_시화정형외과.이철신경외과', '34_홈플러스'): 2.9,
+ ('22_시화정형외과.이철신경외과', '35_동국산업'): 3.1,
+ ('22_시화정형외과.이철신경외과', '36_중앙알칸'): 3.6,
+ ('22_시화정형외과.이철신경외과', '37_희망공원'): 4.1,
+ ('22_시화정형외과.이철신경외과', '38_대한통운'): 4.5,
+ ('22_시화정형외과.이철신경외과', '39_우진프라스코'): 4.7,
+ ('22_시화정형외과.이철신경외과', '40_열병합발전소'): 5.5,
+ ('22_시화정형외과.이철신경외과', '41_삼양사'): 5.8,
+ ('22_시화정형외과.이철신경외과', '42_시화염색단지입구'): 6.5,
+ ('22_시화정형외과.이철신경외과', '43_시화환경사업소'): 6.5,
+ ('22_시화정형외과.이철신경외과', '44_오이도입구'): 6.7,
+ ('22_시화정형외과.이철신경외과', '45_오이도박물관'): 7.7,
+ ('22_시화정형외과.이철신경외과', '46_함상전망대'): 7.1,
+ ('22_시화정형외과.이철신경외과', '47_오이도종합어시장'): 6.8,
+ ('22_시화정형외과.이철신경외과', '48_오이도중앙로입구'): 6.5,
+ ('22_시화정형외과.이철신경외과', '49_오이도해양단지.옥터초교입구'): 6.2,
+ ('22_시화정형외과.이철신경외과', '50_오이도차고지'): 6.5,
+ ('23_소방서.군서고.여성비전센터', '00_오이도차고지'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '02_오이도해양단지.옥터초교입구'): 5.7,
+ ('23_소방서.군서고.여성비전센터', '03_오이도중앙로입구'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '04_오이도종합어시장'): 6.3,
+ ('23_소방서.군서고.여성비전센터', '05_함상전망대'): 6.7,
+ ('23_소방서.군서고.여성비전센터', '06_오이도박물관'): 7.3,
+ ('23_소방서.군서고.여성비전센터', '07_대부도입구'): 6.4,
+ ('23_소방서.군서고.여성비전센터', '08_시화환경사업소'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '09_시화염색단지입구'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '10_삼양사'): 5.4,
+ ('23_소방서.군서고.여성비전센터', '11_열병합발전소'): 5.1,
+ ('23_소방서.군서고.여성비전센터', '12_우진플라스코'): 4.6,
+ ('23_소방서.군서고.여성비전센터', '13_대한통운.동화산업'): 4.3,
+ ('23_소방서.군서고.여성비전센터', '14_우석철강'): 3.7,
+ ('23_소방서.군서고.여성비전센터', '15_파워맥스'): 3.2,
+ ('23_소방서.군서고.여성비전센터', '16_삼화정공'): 3.1,
+ ('23_소방서.군서고.여성비전센터', '17_홈플러스'): 2.4,
+ ('23_소방서.군서고.여성비전센터', '18_청솔아파트'): 1.8,
+ ('23_소방서.군서고.여성비전센터', '19_계룡1차아파트'): 1.6,
+ ('23_소방서.군서고.여성비전센터', '20_중앙도서관'): 1.4,
+ ('23_소방서.군서고.여성비전센터', '21_이마트'): 1.0,
+ ('23_소방서.군서고.여성비전센터', '22_시화정형외과.이철신경외과'): 1.1,
+ ('23_소방서.군서고.여성비전센터', '24_정왕역'): 0.4,
+ ('23_소방서.군서고.여성비전센터', '25_정왕역환승센터'): 0.5,
+ ('23_소방서.군서고.여성비전센터', '26_소방서.군서고.여성비전센터'): 0.0,
+ ('23_소방서.군서고.여성비전센터', '27_군서미래국제학교'): 1.3,
+ ('23_소방서.군서고.여성비전센터', '28_시화정형외과'): 0.9,
+ ('23_소방서.군서고.여성비전센터', '29_금강아파트'): 1.1,
+ ('23_소방서.군서고.여성비전센터', '30_이마트'): 1.0,
+ ('23_소방서.군서고.여성비전센터', '31_중앙도서관'): 1.4,
+ ('23_소방서.군서고.여성비전센터', '32_세종3차아파트'): 1.9,
+ ('23_소방서.군서고.여성비전센터', '33_진로아파트'): 2.0,
+ ('23_소방서.군서고.여성비전센터', '34_홈플러스'): 2.4,
+ ('23_소방서.군서고.여성비전센터', '35_동국산업'): 2.7,
+ ('23_소방서.군서고.여성비전센터', '36_중앙알칸'): 3.1,
+ ('23_소방서.군서고.여성비전센터', '37_희망공원'): 3.6,
+ ('23_소방서.군서고.여성비전센터', '38_대한통운'): 4.1,
+ ('23_소방서.군서고.여성비전센터', '39_우진프라스코'): 4.2,
+ ('23_소방서.군서고.여성비전센터', '40_열병합발전소'): 5.1,
+ ('23_소방서.군서고.여성비전센터', '41_삼양사'): 5.4,
+ ('23_소방서.군서고.여성비전센터', '42_시화염색단지입구'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '43_시화환경사업소'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '44_오이도입구'): 6.2,
+ ('23_소방서.군서고.여성비전센터', '45_오이도박물관'): 7.3,
+ ('23_소방서.군서고.여성비전센터', '46_함상전망대'): 6.7,
+ ('23_소방서.군서고.여성비전센터', '47_오이도종합어시장'): 6.3,
+ ('23_소방서.군서고.여성비전센터', '48_오이도중앙로입구'): 6.0,
+ ('23_소방서.군서고.여성비전센터', '49_오이도해양단지.옥터초교입구'): 5.7,
+ ('23_소방서.군서고.여성비전센터', '50_오이도차고지'): 6.0,
+ ('24_정왕역', '00_오이도차고지'): 5.8,
+ ('24_정왕역', '02_오이도해양단지.옥터초교입구'): 5.5,
+ ('24_정왕역', '03_오이도중앙로입구'): 5.8,
+ ('24_정왕역', '04_오이도종합어시장'): 6.1,
+ ('24_정왕역', '05_함상전망대'): 6.5,
+ ('24_정왕역', '06_오이도박물관'): 7.1,
+ ('24_정왕역', '07_대부도입구'): 6.2,
+ ('24_정왕역', '08_시화환경사업소'): 5.9,
+ ('24_정왕역', '09_시화염색단지입구'): 5.8,
+ ('24_정왕역', '10_삼양사'): 5.2,
+ ('24_정왕역', '11_열병합발전소'): 4.9,
+ ('24_정왕역', '12_우진플라스코'): 4.4,
+ ('24_정왕역', '13_대한통운.동화산업'): 4.1,
+ ('24_정왕역', '14_우석철강'): 3.5,
+ ('24_정왕역', '15_파워맥스'): 3.0,
+ ('24_정왕역', '16_삼화정공'): 2.9,
+ ('24_정왕역', '17_홈플러스'): 2.2,
+ ('24_정왕역', '18_청솔아파트'): 1.6,
+ ('24_정왕역', '19_계룡1차아파트'): 1.4,
+ ('24_정왕역', '20_중앙도서관'): 1.2,
+ ('24_정왕역', '21_이마트'): 0.8,
+ ('24_정왕역', '22_시화정형외과.이철신경외과'): 1.4,
+ ('24_정왕역', '23_소방서.군서고.여성비전센터'): 0.4,
+ ('24_정왕역', '25_정왕역환승센터'): 0.3,
+ ('24_정왕역', '26_소방서.군서고.여성비전센터'): 0.4,
+ ('24_정왕역', '27_군서미래국제학교'): 1.6,
+ ('24_정왕역', '28_시화정형외과'): 1.2,
+ ('24_정왕역', '29_금강아파트'): 1.4,
+ ('24_정왕역', '30_이마트'): 0.8,
+ ('24_정왕역', '31_중앙도서관'): 1.2,
+ ('24_정왕역', '32_세종3차아파트'): 1.7,
+ ('24_정왕역', '33_진로아파트'): 1.8,
+ ('24_정왕역', '34_홈플러스'): 2.2,
+ ('24_정왕역', '35_동국산업'): 2.5,
+ ('24_정왕역', '36_중앙알칸'): 2.9,
+ ('24_정왕역', '37_희망공원'): 3.4,
+ ('24_정왕역', '38_대한통운'): 3.9,
+ ('24_정왕역', '39_우진프라스코'): 4.0,
+ ('24_정왕역', '40_열병합발전소'): 4.9,
+ ('24_정왕역', '41_삼양사'): 5.2,
+ ('24_정왕역', '42_시화염색단지입구'): 5.8,
+ ('24_정왕역', '43_시화환경사업소'): 5.9,
+ ('24_정왕역', '44_오이도입구'): 6.0,
+ ('24_정왕역', '45_오이도박물관'): 7.1,
+ ('24_정왕역', '46_함상전망대'): 6.5,
+ ('24_정왕역', '47_오이도종합어시장'): 6.1,
+ ('24_정왕역', '48_오이도중앙로입구'): 5.8,
+ ('24_정왕역', '49_오이도해양단지.옥터초교입구'): 5.5,
+ ('24_정왕역', '50_오이도차고지'): 5.8,
+ ('25_정왕역환승센터', '00_오이도차고지'): 6.0,
+ ('25_정왕역환승센터', '02_오이도해양단지.옥터초교입구'): 5.7,
+ ('25_정왕역환승센터', '03_오이도중앙로입구'): 6.0,
+ ('25_정왕역환승센터', '04_오이도종합어시장'): 6.3,
+ ('25_정왕역환승센터', '05_함상전망대'): 6.7,
+ ('25_정왕역환승센터', '06_오이도박물관'): 7.2,
+ ('25_정왕역환승센터', '07_대부도입구'): 6.4,
+ ('25_정왕역환승센터', '08_시화환경사업소'): 6.0,
+ ('25_정왕역환승센터', '09_시화염색단지입구'): 6.0,
+ ('25_정왕역환승센터', '10_삼양사'): 5.3,
+ ('25_정왕역환승센터', '11_열병합발전소'): 5.0,
+ ('25_정왕역환승센터', '12_우진플라스코'): 4.6,
+ ('25_정왕역환승센터', '13_대한통운.동화산업'): 4.3,
+ ('25_정왕역환승센터', '14_우석철강'): 3.7,
+ ('25_정왕역환승센터', '15_파워맥스'): 3.2,
+ ('25_정왕역환승센터', '16_삼화정공'): 3.1,
+ ('25_정왕역환승센터', '17_홈플러스'): 2.4,
+ ('25_정왕역환승센터', '18_청솔아파트'): 1.8,
+ ('25_정왕역환승센터', '19_계룡1차아파트'): 1.6,
+ ('25_정왕역환승센터', '20_중앙도서관'): 1.4,
+ ('25_정왕역환승센터', '21_이마트'): 1.0,
+ ('25_정왕역환승센터', '22_시화정형외과.이철신경외과'): 1.4,
+ ('25_정왕역환승센터', '23_소방서.군서고.여성비전센터'): 0.6,
+ ('25_정왕역환승센터', '24_정왕역'): 0.3,
+ ('25_정왕역환승센터', '26_소방서.군서고.여성비전센터'): 0.6,
+ ('25_정왕역환승센터', '27_군서미래국제학교'): 1.6,
+ ('25_정왕역환승센터', '28_시화정형외과'): 1.2,
+ ('25_정왕역환승센터', '29_금강아파트'): 1.4,
+ ('25_정왕역환승센터', '30_이마트'): 1.0,
+ ('25_정왕역환승센터', '31_중앙도서관'): 1.4,
+ ('25_정왕역환승센터', '32_세종3차아파트'): 1.9,
+ ('25_정왕역환승센터', '33_진로아파트'): 2.0,
+ ('25_정왕역환승센터', '34_홈플러스'): 2.4,
+ ('25_정왕역환승센터', '35_동국산업'): 2.7,
+ ('25_정왕역환승센터', '36_중앙알칸'): 3.1,
+ ('25_정왕역환승센터', '37_희망공원'): 3.6,
+ ('25_정왕역환승센터', '38_대한통운'): 4.0,
+ ('25_정왕역환승센터', '39_우진프라스코'): 4.2,
+ ('25_정왕역환승센터', '40_열병합발전소'): 5.0,
+ ('25_정왕역환승센터', '41_삼양사'): 5.3,
+ ('25_정왕역환승센터', '42_시화염색단지입구'): 6.0,
+ ('25_정왕역환승센터', '43_시화환경사업소'): 6.0,
+ ('25_정왕역환승센터', '44_오이도입구'): 6.2,
+ ('25_정왕역환승센터', '45_오이도박물관'): 7.2,
+ ('25_정왕역환승센터', '46_함상전망대'): 6.7,
+ ('25_정왕역환승센터', '47_오이도종합어시장'): 6.3,
+ ('25_정왕역환승센터', '48_오이도중앙로입구'): 6.0,
+ ('25_정왕역환승센터', '49_오이도해양단지.옥터초교입구'): 5.7,
+ ('25_정왕역환승센터', '50_오이도차고지'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '00_오이도차고지'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '02_오이도해양단지.옥터초교입구'): 5.7,
+ ('26_소방서.군서고.여성비전센터', '03_오이도중앙로입구'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '04_오이도종합어시장'): 6.3,
+ ('26_소방서.군서고.여성비전센터', '05_함상전망대'): 6.7,
+ ('26_소방서.군서고.여성비전센터', '06_오이도박물관'): 7.3,
+ ('26_소방서.군서고.여성비전센터', '07_대부도입구'): 6.4,
+ ('26_소방서.군서고.여성비전센터', '08_시화환경사업소'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '09_시화염색단지입구'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '10_삼양사'): 5.4,
+ ('26_소방서.군서고.여성비전센터', '11_열병합발전소'): 5.1,
+ ('26_소방서.군서고.여성비전센터', '12_우진플라스코'): 4.6,
+ ('26_소방서.군서고.여성비전센터', '13_대한통운.동화산업'): 4.3,
+ ('26_소방서.군서고.여성비전센터', '14_우석철강'): 3.7,
+ ('26_소방서.군서고.여성비전센터', '15_파워맥스'): 3.2,
+ ('26_소방서.군서고.여성비전센터', '16_삼화정공'): 3.1,
+ ('26_소방서.군서고.여성비전센터', '17_홈플러스'): 2.4,
+ ('26_소방서.군서고.여성비전센터', '18_청솔아파트'): 1.8,
+ ('26_소방서.군서고.여성비전센터', '19_계룡1차아파트'): 1.6,
+ ('26_소방서.군서고.여성비전센터', '20_중앙도서관'): 1.4,
+ ('26_소방서.군서고.여성비전센터', '21_이마트'): 1.0,
+ ('26_소방서.군서고.여성비전센터', '22_시화정형외과.이철신경외과'): 1.1,
+ ('26_소방서.군서고.여성비전센터', '23_소방서.군서고.여성비전센터'): 0.0,
+ ('26_소방서.군서고.여성비전센터', '24_정왕역'): 0.4,
+ ('26_소방서.군서고.여성비전센터', '25_정왕역환승센터'): 0.5,
+ ('26_소방서.군서고.여성비전센터', '27_군서미래국제학교'): 1.3,
+ ('26_소방서.군서고.여성비전센터', '28_시화정형외과'): 0.9,
+ ('26_소방서.군서고.여성비전센터', '29_금강아파트'): 1.1,
+ ('26_소방서.군서고.여성비전센터', '30_이마트'): 1.0,
+ ('26_소방서.군서고.여성비전센터', '31_중앙도서관'): 1.4,
+ ('26_소방서.군서고.여성비전센터', '32_세종3차아파트'): 1.9,
+ ('26_소방서.군서고.여성비전센터', '33_진로아파트'): 2.0,
+ ('26_소방서.군서고.여성비전센터', '34_홈플러스'): 2.4,
+ ('26_소방서.군서고.여성비전센터', '35_동국산업'): 2.7,
+ ('26_소방서.군서고.여성비전센터', '36_중앙알칸'): 3.1,
+ ('26_소방서.군서고.여성비전센터', '37_희망공원'): 3.6,
+ ('26_소방서.군서고.여성비전센터', '38_대한통운'): 4.1,
+ ('26_소방서.군서고.여성비전센터', '39_우진프라스코'): 4.2,
+ ('26_소방서.군서고.여성비전센터', '40_열병합발전소'): 5.1,
+ ('26_소방서.군서고.여성비전센터', '41_삼양사'): 5.4,
+ ('26_소방서.군서고.여성비전센터', '42_시화염색단지입구'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '43_시화환경사업소'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '44_오이도입구'): 6.2,
+ ('26_소방서.군서고.여성비전센터', '45_오이도박물관'): 7.3,
+ ('26_소방서.군서고.여성비전센터', '46_함상전망대'): 6.7,
+ ('26_소방서.군서고.여성비전센터', '47_오이도종합어시장'): 6.3,
+ ('26_소방서.군서고.여성비전센터', '48_오이도중앙로입구'): 6.0,
+ ('26_소방서.군서고.여성비전센터', '49_오이도해양단지.옥터초교입구'): 5.7,
+ ('26_소방서.군서고.여성비전센터', '50_오이도차고지'): 6.0,
+ ('27_군서미래국제학교', '00_오이도차고지'): 6.3,
+ ('27_군서미래국제학교', '02_오이도해양단지.옥터초교입구'): 6.0,
+ ('27_군서미래국제학교', '03_오이도중앙로입구'): 6.3,
+ ('27_군서미래국제학교', '04_오이도종합어시장'): 6.6,
+ ('27_군서미래국제학교', '05_함상전망대'): 6.9,
+ ('27_군서미래국제학교', '06_오이도박물관'): 7.5,
+ ('27_군서미래국제학교', '07_대부도입구'): 6.7,
+ ('27_군서미래국제학교', '08_시화환경사업소'): 6.3,
+ ('27_군서미래국제학교', '09_시화염색단지입구'): 6.2,
+ ('27_군서미래국제학교', '10_삼양사'): 5.6,
+ ('27_군서미래국제학교', '11_열병합발전소'): 5.3,
+ ('27_군서미래국제학교', '12_우진플라스코'): 4.9,
+ ('27_군서미래국제학교', '13_대한통운.동화산업'): 4.6,
+ ('27_군서미래국제학교', '14_우석철강'): 4.0,
+ ('27_군서미래국제학교', '15_파워맥스'): 3.5,
+ ('27_군서미래국제학교', '16_삼화정공'): 3.4,
+ ('27_군서미래국제학교', '17_홈플러스'): 2.7,
+ ('27_군서미래국제학교', '18_청솔아파트'): 2.1,
+ ('27_군서미래국제학교', '19_계룡1차아파트'): 1.8,
+ ('27_군서미래국제학교', '20_중앙도서관'): 1.7,
+ ('27_군서미래국제학교', '21_이마트'): 1.3,
+ ('27_군서미래국제학교', '22_시화정형외과.이철신경외과'): 0.7,
+ ('27_군서미래국제학교', '23_소방서.군서고.여성비전센터'): 0.6,
+ ('27_군서미래국제학교', '24_정왕역'): 1.0,
+ ('27_군서미래국제학교', '25_정왕역환승센터'): 0.9,
+ ('27_군서미래국제학교', '26_소방서.군서고.여성비전센터'): 0.6,
+ ('27_군서미래국제학교', '28_시화정형외과'): 0.4,
+ ('27_군서미래국제학교', '29_금강아파트'): 0.6,
+ ('27_군서미래국제학교', '30_이마트'): 1.3,
+ ('27_군서미래국제학교', '31_중앙도서관'): 1.7,
+ ('27_군서미래국제학교', '32_세종3차아파트'): 2.2,
+ ('27_군서미래국제학교', '33_진로아파트'): 2.2,
+ ('27_군서미래국제학교', '34_홈플러스'): 2.7,
+ ('27_군서미래국제학교', '35_동국산업'): 2.9,
+ ('27_군서미래국제학교', '36_중앙알칸'): 3.3,
+ ('27_군서미래국제학교', '37_희망공원'): 3.9,
+ ('27_군서미래국제학교', '38_대한통운'): 4.3,
+ ('27_군서미래국제학교', '39_우진프라스코'): 4.5,
+ ('27_군서미래국제학교', '40_열병합발전소'): 5.3,
+ ('27_군서미래국제학교', '41_삼양사'): 5.6,
+ ('27_군서미래국제학교', '42_시화염색단지입구'): 6.2,
+ ('27_군서미래국제학교', '43_시화환경사업소'): 6.3,
+ ('27_군서미래국제학교', '44_오이도입구'): 6.5,
+ ('27_군서미래국제학교', '45_오이도박물관'): 7.5,
+ ('27_군서미래국제학교', '46_함상전망대'): 6.9,
+ ('27_군서미래국제학교', '47_오이도종합어시장'): 6.6,
+ ('27_군서미래국제학교', '48_오이도중앙로입구'): 6.3,
+ ('27_군서미래국제학교', '49_오이도해양단지.옥터초교입구'): 6.0,
+ ('27_군서미래국제학교', '50_오이도차고지'): 6.3,
+ ('28_시화정형외과', '00_오이도차고지'): 5.9,
+ ('28_시화정형외과', '02_오이도해양단지.옥터초교입구'): 5.6,
+ ('28_시화정형외과', '03_오이도중앙로입구'): 5.9,
+ ('28_시화정형외과', '04_오이도종합어시장'): 6.2,
+ ('28_시화정형외과', '05_함상전망대'): 6.6,
+ ('28_시화정형외과', '06_오이도박물관'): 7.1,
+ ('28_시화정형외과', '07_대부도입구'): 6.3,
+ ('28_시화정형외과', '08_시화환경사업소'): 5.9,
+ ('28_시화정형외과', '09_시화염색단지입구'): 5.8,
+ ('28_시화정형외과', '10_삼양사'): 5.2,
+ ('28_시화정형외과', '11_열병합발전소'): 4.9,
+ ('28_시화정형외과', '12_우진플라스코'): 4.5,
+ ('28_시화정형외과', '13_대한통운.동화산업'): 4.2,
+ ('28_시화정형외과', '14_우석철강'): 3.6,
+ ('28_시화정형외과', '15_파워맥스'): 3.1,
+ ('28_시화정형외과', '16_삼화정공'): 3.0,
+ ('28_시화정형외과', '17_홈플러스'): 2.3,
+ ('28_시화정형외과', '18_청솔아파트'): 1.7,
+ ('28_시화정형외과', '19_계룡1차아파트'): 1.4,
+ ('28_시화정형외과', '20_중앙도서관'): 1.3,
+ ('28_시화정형외과', '21_이마트'): 0.9,
+ ('28_시화정형외과', '22_시화정형외과.이철신경외과'): 0.3,
+ ('28_시화정형외과', '23_소방서.군서고.여성비전센터'): 1.0,
+ ('28_시화정형외과', '24_정왕역'): 1.4,
+ ('28_시화정형외과', '25_정왕역환승센터'): 1.3,
+ ('28_시화정형외과', '26_소방서.군서고.여성비전센터'): 1.0,
+ ('28_시화정형외과', '27_군서미래국제학교'): 0.5,
+ ('28_시화정형외과', '29_금강아파트'): 0.2,
+ ('28_시화정형외과', '30_이마트'): 0.9,
+ ('28_시화정형외과', '31_중앙도서관'): 1.3,
+ ('28_시화정형외과', '32_세종3차아파트'): 1.8,
+ ('28_시화정형외과', '33_진로아파트'): 1.8,
+ ('28_시화정형외과', '34_홈플러스'): 2.3,
+ ('28_시화정형외과', '35_동국산업'): 2.5,
+ ('28_시화정형외과', '36_중앙알칸'): 2.9,
+ ('28_시화정형외과', '37_희망공원'): 3.5,
+ ('28_시화정형외과', '38_대한통운'): 3.9,
+ ('28_시화정형외과', '39_우진프라스코'): 4.1,
+ ('28_시화정형외과', '40_열병합발전소'): 4.9,
+ ('28_시화정형외과', '41_삼양사'): 5.2,
+ ('28_시화정형외과', '42_시화염색단지입구'): 5.8,
+ ('28_시화정형외과', '43_시화환경사업소'): 5.9,
+ ('28_시화정형외과', '44_오이도입구'): 6.1,
+ ('28_시화정형외과', '45_오이도박물관'): 7.1,
+ ('28_시화정형외과', '46_함상전망대'): 6.6,
+ ('28_시화정형외과', '47_오이도종합어시장'): 6.2,
+ ('28_시화정형외과', '48_오이도중앙로입구'): 5.9,
+ ('28_시화정형외과', '49_오이도해양단지.옥터초교입구'): 5.6,
+ ('28_시화정형외과', '50_오이도차고지'): 5.9,
+ ('29_금강아파트', '00_오이도차고지'): 5.7,
+ ('29_금강아파트', '02_오이도해양단지.옥터초교입구'): 5.4,
+ ('29_금강아파트', '03_오이도중앙로입구'): 5.7,
+ ('29_금강아파트', '04_오이도종합어시장'): 6.0,
+ ('29_금강아파트', '05_함상전망대'): 6.4,
+ ('29_금강아파트', '06_오이도박물관'): 6.9,
+ ('29_금강아파트', '07_대부도입구'): 6.1,
+ ('29_금강아파트', '08_시화환경사업소'): 5.7,
+ ('29_금강아파트', '09_시화염색단지입구'): 5.6,
+ ('29_금강아파트', '10_삼양사'): 5.0,
+ ('29_금강아파트', '11_열병합발전소'): 4.7,
+ ('29_금강아파트', '12_우진플라스코'): 4.3,
+ ('29_금강아파트', '13_대한통운.동화산업'): 4.0,
+ ('29_금강아파트', '14_우석철강'): 3.4,
+ ('29_금강아파트', '15_파워맥스'): 2.9,
+ ('29_금강아파트', '16_삼화정공'): 2.8,
+ ('29_금강아파트', '17_홈플러스'): 2.1,
+ ('29_금강아파트', '18_청솔아파트'): 1.5,
+ ('29_금강아파트', '19_계룡1차아파트'): 1.2,
+ ('29_금강아파트', '20_중앙도서관'): 1.1,
+ ('29_금강아파트', '21_이마트'): 0.7,
+ ('29_금강아파트', '22_시화정형외과.이철신경외과'): 0.7,
+ ('29_금강아파트', '23_소방서.군서고.여성비전센터'): 0.9,
+ ('29_금강아파트', '24_정왕역'): 1.3,
+ ('29_금강아파트', '25_정왕역환승센터'): 1.2,
+ ('29_금강아파트', '26_소방서.군서고.여성비전센터'): 0.9,
+ ('29_금강아파트', '27_군서미래국제학교'): 0.9,
+ ('29_금강아파트', '28_시화정형외과'): 1.3,
+ ('29_금강아파트', '30_이마트'): 0.7,
+ ('29_금강아파트', '31_중앙도서관'): 1.1,
+ ('29_금강아파트', '32_세종3차아파트'): 1.6,
+ ('29_금강아파트', '33_진로아파트'): 1.6,
+ ('29_금강아파트', '34_홈플러스'): 2.1,
+ ('29_금강아파트', '35_동국산업'): 2.3,
+ ('29_금강아파트', '36_중앙알칸'): 2.7,
+ ('29_금강아파트', '37_희망공원'): 3.3,
+ ('29_금강아파트', '38_대한통운'): 3.7,
+ ('29_금강아파트', '39_우진프라스코'): 3.9,
+ ('29_금강아파트', '40_열병합발전소'): 4.7,
+ ('29_금강아파트', '41_삼양사'): 5.0,
+ ('29_금강아파트', '42_시화염색단지입구'): 5.6,
+ ('29_금강아파트', '43_시화환경사업소'): 5.7,
+ ('29_금강아파트', '44_오이도입구'): 5.9,
+ ('29_금강아파트', '45_오이도박물관'): 6.9,
+ ('29_금강아파트', '46_함상전망대'): 6.4,
+ ('29_금강아파트', '47_오이도종합어시장'): 6.0,
+ ('29_금강아파트', '48_오이도중앙로입구'): 5.7,
+ ('29_금강아파트', '49_오이도해양단지.옥터초교입구'): 5.4,
+ ('29_금강아파트', '50_오이도차고지'): 5.7,
+ ('30_이마트', '00_오이도차고지'): 5.6,
+ ('30_이마트', '02_오이도해양단지.옥터초교입구'): 5.4,
+ ('30_이마트', '03_오이도중앙로입구'): 5.6,
+ ('30_이마트', '04_오이도종합어시장'): 5.9,
+ ('30_이마트', '05_함상전망대'): 6.3,
+ ('30_이마트', '06_오이도박물관'): 6.9,
+ ('30_이마트', '07_대부도입구'): 6.0,
+ ('30_이마트', '08_시화환경사업소'): 5.7,
+ ('30_이마트', '09_시화염색단지입구'): 5.6,
+ ('30_이마트', '10_삼양사'): 5.0,
+ ('30_이마트', '11_열병합발전소'): 4.7,
+ ('30_이마트', '12_우진플라스코'): 4.2,
+ ('30_이마트', '13_대한통운.동화산업'): 3.9,
+ ('30_이마트', '14_우석철강'): 3.3,
+ ('30_이마트', '15_파워맥스'): 2.8,
+ ('30_이마트', '16_삼화정공'): 2.7,
+ ('30_이마트', '17_홈플러스'): 2.0,
+ ('30_이마트', '18_청솔아파트'): 1.4,
+ ('30_이마트', '19_계룡1차아파트'): 1.2,
+ ('30_이마트', '20_중앙도서관'): 1.0,
+ ('30_이마트', '21_이마트'): 0.0,
+ ('30_이마트', '22_시화정형외과.이철신경외과'): 0.7,
+ ('30_이마트', '23_소방서.군서고.여성비전센터'): 0.9,
+ ('30_이마트', '24_정왕역'): 1.2,
+ ('30_이마트', '25_정왕역환승센터'): 1.2,
+ ('30_이마트', '26_소방서.군서고.여성비전센터'): 0.9,
+ ('30_이마트', '27_군서미래국제학교'): 0.9,
+ ('30_이마트', '28_시화정형외과'): 1.2,
+ ('30_이마트', '29_금강아파트'): 0.6,
+ ('30_이마트', '31_중앙도서관'): 1.0,
+ ('30_이마트', '32_세종3차아파트'): 1.5,
+ ('30_이마트', '33_진로아파트'): 1.6,
+ ('30_이마트', '34_홈플러스'): 2.0,
+ ('30_이마트', '35_동국산업'): 2.3,
+ ('30_이마트', '36_중앙알칸'): 2.7,
+ ('30_이마트', '37_희망공원'): 3.2,
+ ('30_이마트', '38_대한통운'): 3.7,
+ ('30_이마트', '39_우진프라스코'): 3.8,
+ ('30_이마트', '40_열병합발전소'): 4.7,
+ ('30_이마트', '41_삼양사'): 5.0,
+ ('30_이마트', '42_시화염색단지입구'): 5.6,
+ ('30_이마트', '43_시화환경사업소'): 5.7,
+ ('30_이마트', '44_오이도입구'): 5.9,
+ ('30_이마트', '45_오이도박물관'): 6.9,
+ ('30_이마트', '46_함상전망대'): 6.3,
+ ('30_이마트', '47_오이도종합어시장'): 5.9,
+ ('30_이마트', '48_오이도중앙로입구'): 5.6,
+ ('30_이마트', '49_오이도해양단지.옥터초교입구'): 5.4,
+ ('30_이마트', '50_오이도차고지'): 5.6,
+ ('31_중앙도서관', '00_오이도차고지'): 5.1,
+ ('31_중앙도서관', '02_오이도해양단지.옥터초교입구'): 4.8,
+ ('31_중앙도서관', '03_오이도중앙로입구'): 5.1,
+ ('31_중앙도서관', '04_오이도종합어시장'): 5.4,
+ ('31_중앙도서관', '05_함상전망대'): 5.8,
+ ('31_중앙도서관', '06_오이도박물관'): 6.4,
+ ('31_중앙도서관', '07_대부도입구'): 5.5,
+ ('31_중앙도서관', '08_시화환경사업소'): 5.1,
+ ('31_중앙도서관', '09_시화염색단지입구'): 5.1,
+ ('31_중앙도서관', '10_삼양사'): 4.4,
+ ('31_중앙도서관', '11_열병합발전소'): 4.1,
+ ('31_중앙도서관', '12_우진플라스코'): 3.8,
+ ('31_중앙도서관', '13_대한통운.동화산업'): 3.6,
+ ('31_중앙도서관', '14_우석철강'): 2.8,
+ ('31_중앙도서관', '15_파워맥스'): 2.3,
+ ('31_중앙도서관', '16_삼화정공'): 2.2,
+ ('31_중앙도서관', '17_홈플러스'): 1.5,
+ ('31_중앙도서관', '18_청솔아파트'): 0.9,
+ ('31_중앙도서관', '19_계룡1차아파트'): 0.6,
+ ('31_중앙도서관', '20_중앙도서관'): 0.0,
+ ('31_중앙도서관', '21_이마트'): 0.3,
+ ('31_중앙도서관', '22_시화정형외과.이철신경외과'): 0.9,
+ ('31_중앙도서관', '23_소방서.군서고.여성비전센터'): 0.7,
+ ('31_중앙도서관', '24_정왕역'): 0.9,
+ ('31_중앙도서관', '25_정왕역환승센터'): 1.0,
+ ('31_중앙도서관', '26_소방서.군서고.여성비전센터'): 0.7,
+ ('31_중앙도서관', '27_군서미래국제학교'): 1.1,
+ ('31_중앙도서관', '28_시화정형외과'): 1.5,
+ ('31_중앙도서관', '29_금강아파트'): 0.8,
+ ('31_중앙도서관', '30_이마트'): 0.3,
+ ('31_중앙도서관', '32_세종3차아파트'): 1.0,
+ ('31_중앙도서관', '33_진로아파트'): 1.1,
+ ('31_중앙도서관', '34_홈플러스'): 1.5,
+ ('31_중앙도서관', '35_동국산업'): 1.7,
+ ('31_중앙도서관', '36_중앙알칸'): 2.2,
+ ('31_중앙도서관', '37_희망공원'): 2.7,
+ ('31_중앙도서관', '38_대한통운'): 3.1,
+ ('31_중앙도서관', '39_우진프라스코'): 3.3,
+ ('31_중앙도서관', '40_열병합발전소'): 4.1,
+ ('31_중앙도서관', '41_삼양사'): 4.4,
+ ('31_중앙도서관', '42_시화염색단지입구'): 5.1,
+ ('31_중앙도서관', '43_시화환경사업소'): 5.1,
+ ('31_중앙도서관', '44_오이도입구'): 5.3,
+ ('31_중앙도서관', '45_오이도박물관'): 6.4,
+ ('31_중앙도서관', '46_함상전망대'): 5.8,
+ ('31_중앙도서관', '47_오이도종합어시장'): 5.4,
+ ('31_중앙도서관', '48_오이도중앙로입구'): 5.1,
+ ('31_중앙도서관', '49_오이도해양단지.옥터초교입구'): 4.8,
+ ('31_중앙도서관', '50_오이도차고지'): 5.1,
+ ('32_세종3차아파트', '00_오이도차고지'): 4.6,
+ ('32_세종3차아파트', '02_오이도해양단지.옥터초교입구'): 4.3,
+ ('32_세종3차아파트', '03_오이도중앙로입구'): 4.6,
+ ('32_세종3차아파트', '04_오이도종합어시장'): 4.9,
+ ('32_세종3차아파트', '05_함상전망대'): 5.3,
+ ('32_세종3차아파트', '06_오이도박물관'): 5.9,
+ ('32_세종3차아파트', '07_대부도입구'): 5.0,
+ ('32_세종3차아파트', '08_시화환경사업소'): 4.7,
+ ('32_세종3차아파트', '09_시화염색단지입구'): 4.6,
+ ('32_세종3차아파트', '10_삼양사'): 3.9,
+ ('32_세종3차아파트', '11_열병합발전소'): 3.6,
+ ('32_세종3차아파트', '12_우진플라스코'): 3.7,
+ ('32_세종3차아파트', '13_대한통운.동화산업'): 3.4,
+ ('32_세종3차아파트', '14_우석철강'): 2.8,
+ ('32_세종3차아파트', '15_파워맥스'): 2.3,
+ ('32_세종3차아파트', '16_삼화정공'): 2.2,
+ ('32_세종3차아파트', '17_홈플러스'): 2.0,
+ ('32_세종3차아파트', '18_청솔아파트'): 0.6,
+ ('32_세종3차아파트', '19_계룡1차아파트'): 0.2,
+ ('32_세종3차아파트', '20_중앙도서관'): 0.5,
+ ('32_세종3차아파트', '21_이마트'): 0.8,
+ ('32_세종3차아파트', '22_시화정형외과.이철신경외과'): 1.5,
+ ('32_세종3차아파트', '23_소방서.군서고.여성비전센터'): 1.3,
+ ('32_세종3차아파트', '24_정왕역'): 1.3,
+ ('32_세종3차아파트', '25_정왕역환승센터'): 1.5,
+ ('32_세종3차아파트', '26_소방서.군서고.여성비전센터'): 1.3,
+ ('32_세종3차아파트', '27_군서미래국제학교'): 1.7,
+ ('32_세종3차아파트', '28_시화정형외과'): 2.1,
+ ('32_세종3차아파트', '29_금강아파트'): 1.4,
+ ('32_세종3차아파트', '30_이마트'): 0.8,
+ ('32_세종3차아파트', '31_중앙도서관'): 0.5,
+ ('32_세종3차아파트', '33_진로아파트'): 0.6,
+ ('32_세종3차아파트', '34_홈플러스'): 2.0,
+ ('32_세종3차아파트', '35_동국산업'): 1.3,
+ ('32_세종3차아파트', '36_중앙알칸'): 1.7,
+ ('32_세종3차아파트', '37_희망공원'): 2.2,
+ ('32_세종3차아파트', '38_대한통운'): 2.6,
+ ('32_세종3차아파트', '39_우진프라스코'): 2.8,
+ ('32_세종3차아파트', '40_열병합발전소'): 3.6,
+ ('32_세종3차아파트', '41_삼양사'): 3.9,
+ ('32_세종3차아파트', '42_시화염색단지입구'): 4.6,
+ ('32_세종3차아파트', '43_시화환경사업소'): 4.7,
+ ('32_세종3차아파트', '44_오이도입구'): 4.8,
+ ('32_세종3차아파트', '45_오이도박물관'): 5.9,
+ ('32_세종3차아파트', '46_함상전망대'): 5.3,
+ ('32_세종3차아파트', '47_오이도종합어시장'): 4.9,
+ ('32_세종3차아파트', '48_오이도중앙로입구'): 4.6,
+ ('32_세종3차아파트', '49_오이도해양단지.옥터초교입구'): 4.3,
+ ('32_세종3차아파트', '50_오이도차고지'): 4.6,
+ ('33_진로아파트', '00_오이도차고지'): 4.4,
+ ('33_진로아파트', '02_오이도해양단지.옥터초교입구'): 4.1,
+ ('33_진로아파트', '03_오이도중앙로입구'): 4.4,
+ ('33_진로아파트', '04_오이도종합어시장'): 4.7,
+ ('33_진로아파트', '05_함상전망대'): 5.1,
+ ('33_진로아파트', '06_오이도박물관'): 5.6,
+ ('33_진로아파트', '07_대부도입구'): 4.8,
+ ('33_진로아파트', '08_시화환경사업소'): 4.4,
+ ('33_진로아파트', '09_시화염색단지입구'): 4.4,
+ ('33_진로아파트', '10_삼양사'): 3.7,
+ ('33_진로아파트', '11_열병합발전소'): 3.4,
+ ('33_진로아파트', '12_우진플라스코'): 3.7,
+ ('33_진로아파트', '13_대한통운.동화산업'): 3.4,
+ ('33_진로아파트', '14_우석철강'): 2.8,
+ ('33_진로아파트', '15_파워맥스'): 2.3,
+ ('33_진로아파트', '16_삼화정공'): 2.2,
+ ('33_진로아파트', '17_홈플러스'): 1.8,
+ ('33_진로아파트', '18_청솔아파트'): 0.6,
+ ('33_진로아파트', '19_계룡1차아파트'): 0.6,
+ ('33_진로아파트', '20_중앙도서관'): 0.9,
+ ('33_진로아파트', '21_이마트'): 1.2,
+ ('33_진로아파트', '22_시화정형외과.이철신경외과'): 1.8,
+ ('33_진로아파트', '23_소방서.군서고.여성비전센터'): 1.6,
+ ('33_진로아파트', '24_정왕역'): 1.7,
+ ('33_진로아파트', '25_정왕역환승센터'): 1.8,
+ ('33_진로아파트', '26_소방서.군서고.여성비전센터'): 1.6,
+ ('33_진로아파트', '27_군서미래국제학교'): 2.0,
+ ('33_진로아파트', '28_시화정형외과'): 2.4,
+ ('33_진로아파트', '29_금강아파트'): 1.8,
+ ('33_진로아파트', '30_이마트'): 1.2,
+ ('33_진로아파트', '31_중앙도서관'): 0.9,
+ ('33_진로아파트', '32_세종3차아파트'): 0.8,
+ ('33_진로아파트', '34_홈플러스'): 1.8,
+ ('33_진로아파트', '35_동국산업'): 1.2,
+ ('33_진로아파트', '36_중앙알칸'): 1.6,
+ ('33_진로아파트', '37_희망공원'): 2.2,
+ ('33_진로아파트', '38_대한통운'): 2.6,
+ ('33_진로아파트', '39_우진프라스코'): 2.8,
+ ('33_진로아파트', '40_열병합발전소'): 3.4,
+ ('33_진로아파트', '41_삼양사'): 3.7,
+ ('33_진로아파트', '42_시화염색단지입구'): 4.4,
+ ('33_진로아파트', '43_시화환경사업소'): 4.4,
+ ('33_진로아파트', '44_오이도입구'): 4.6,
+ ('33_진로아파트', '45_오이도박물관'): 5.6,
+ ('33_진로아파트', '46_함상전망대'): 5.1,
+ ('33_진로아파트', '47_오이도종합어시장'): 4.7,
+ ('33_진로아파트', '48_오이도중앙로입구'): 4.4,
+ ('33_진로아파트', '49_오이도해양단지.옥터초교입구'): 4.1,
+ ('33_진로아파트', '50_오이도차고지'): 4.4,
+ ('34_홈플러스', '00_오이도차고지'): 3.8,
+ ('34_홈플러스', '02_오이도해양단지.옥터초교입구'): 3.6,
+ ('34_홈플러스', '03_오이도중앙로입구'): 3.8,
+ ('34_홈플러스', '04_오이도종합어시장'): 4.1,
+ ('34_홈플러스', '05_함상전망대'): 4.5,
+ ('34_홈플러스', '06_오이도박물관'): 5.1,
+ ('34_홈플러스', '07_대부도입구'): 4.3,
+ ('34_홈플러스', '08_시화환경사업소'): 3.9,
+ ('34_홈플러스', '09_시화염색단지입구'): 3.7,
+ ('34_홈플러스', '10_삼양사'): 3.1,
+ ('34_홈플러스', '11_열병합발전소'): 2.7,
+ ('34_홈플러스', '12_우진플라스코'): 2.8,
+ ('34_홈플러스', '13_대한통운.동화산업'): 2.5,
+ ('34_홈플러스', '14_우석철강'): 1.9,
+ ('34_홈플러스', '15_파워맥스'): 1.4,
+ ('34_홈플러스', '16_삼화정공'): 1.3,
+ ('34_홈플러스', '17_홈플러스'): 0.0,
+ ('34_홈플러스', '18_청솔아파트'): 0.5,
+ ('34_홈플러스', '19_계룡1차아파트'): 0.9,
+ ('34_홈플러스', '20_중앙도서관'): 1.2,
+ ('34_홈플러스', '21_이마트'): 1.5,
+ ('34_홈플러스', '22_시화정형외과.이철신경외과'): 2.1,
+ ('34_홈플러스', '23_소방서.군서고.여성비전센터'): 2.0,
+ ('34_홈플러스', '24_정왕역'): 2.0,
+ ('34_홈플러스', '25_정왕역환승센터'): 2.2,
+ ('34_홈플러스', '26_소방서.군서고.여성비전센터'): 2.0,
+ ('34_홈플러스', '27_군서미래국제학교'): 2.3,
+ ('34_홈플러스', '28_시화정형외과'): 2.7,
+ ('34_홈플러스', '29_금강아파트'): 2.1,
+ ('34_홈플러스', '30_이마트'): 1.5,
+ ('34_홈플러스', '31_중앙도서관'): 1.2,
+ ('34_홈플러스', '32_세종3차아파트'): 1.2,
+ ('34_홈플러스', '33_진로아파트'): 0.8,
+ ('34_홈플러스', '35_동국산업'): 0.4,
+ ('34_홈플러스', '36_중앙알칸'): 0.8,
+ ('34_홈플러스', '37_희망공원'): 1.3,
+ ('34_홈플러스', '38_대한통운'): 1.8,
+ ('34_홈플러스', '39_우진프라스코'): 1.9,
+ ('34_홈플러스', '40_열병합발전소'): 2.7,
+ ('34_홈플러스', '41_삼양사'): 3.1,
+ ('34_홈플러스', '42_시화염색단지입구'): 3.7,
+ ('34_홈플러스', '43_시화환경사업소'): 3.9,
+ ('34_홈플러스', '44_오이도입구'): 4.1,
+ ('34_홈플러스', '45_오이도박물관'): 5.1,
+ ('34_홈플러스', '46_함상전망대'): 4.5,
+ ('34_홈플러스', '47_오이도종합어시장'): 4.1,
+ ('34_홈플러스', '48_오이도중앙로입구'): 3.8,
+ ('34_홈플러스', '49_오이도해양단지.옥터초교입구'): 3.6,
+ ('34_홈플러스', '50_오이도차고지'): 3.8,
+ ('35_동국산업', '00_오이도차고지'): 3.6,
+ ('35_동국산업', '02_오이도해양단지.옥터초교입구'): 3.3,
+ ('35_동국산업', '03_오이도중앙로입구'): 3.6,
+ ('35_동국산업', '04_오이도종합어시장'): 3.9,
+ ('35_동국산업', '05_함상전망대'): 4.2,
+ ('35_동국산업', '06_오이도박물관'): 4.8,
+ ('35_동국산업', '07_대부도입구'): 4.0,
+ ('35_동국산업', '08_시화환경사업소'): 3.6,
+ ('35_동국산업', '09_시화염색단지입구'): 3.3,
+ ('35_동국산업', '10_삼양사'): 2.7,
+ ('35_동국산업', '11_열병합발전소'): 2.4,
+ ('35_동국산업', '12_우진플라스코'): 2.5,
+ ('35_동국산업', '13_대한통운.동화산업'): 2.2,
+ ('35_동국산업', '14_우석철강'): 1.5,
+ ('35_동국산업', '15_파워맥스'): 1.0,
+ ('35_동국산업', '16_삼화정공'): 0.0,
+ ('35_동국산업', '17_홈플러스'): 0.4,
+ ('35_동국산업', '18_청솔아파트'): 0.9,
+ ('35_동국산업', '19_계룡1차아파트'): 1.2,
+ ('35_동국산업', '20_중앙도서관'): 1.6,
+ ('35_동국산업', '21_이마트'): 1.9,
+ ('35_동국산업', '22_시화정형외과.이철신경외과'): 2.5,
+ ('35_동국산업', '23_소방서.군서고.여성비전센터'): 2.3,
+ ('35_동국산업', '24_정왕역'): 2.4,
+ ('35_동국산업', '25_정왕역환승센터'): 2.5,
+ ('35_동국산업', '26_소방서.군서고.여성비전센터'): 2.3,
+ ('35_동국산업', '27_군서미래국제학교'): 2.7,
+ ('35_동국산업', '28_시화정형외과'): 3.1,
+ ('35_동국산업', '29_금강아파트'): 2.4,
+ ('35_동국산업', '30_이마트'): 1.9,
+ ('35_동국산업', '31_중앙도서관'): 1.6,
+ ('35_동국산업', '32_세종3차아파트'): 1.6,
+ ('35_동국산업', '33_진로아파트'): 1.2,
+ ('35_동국산업', '34_홈플러스'): 0.4,
+ ('35_동국산업', '36_중앙알칸'): 0.4,
+ ('35_동국산업', '37_희망공원'): 1.0,
+ ('35_동국산업', '38_대한통운'): 1.4,
+ ('35_동국산업', '39_우진프라스코'): 1.5,
+ ('35_동국산업', '40_열병합발전소'): 2.4,
+ ('35_동국산업', '41_삼양사'): 2.7,
+ ('35_동국산업', '42_시화염색단지입구'): 3.3,
+ ('35_동국산업', '43_시화환경사업소'): 3.6,
+ ('35_동국산업', '44_오이도입구'): 3.8,
+ ('35_동국산업', '45_오이도박물관'): 4.8,
+ ('35_동국산업', '46_함상전망대'): 4.2,
+ ('35_동국산업', '47_오이도종합어시장'): 3.9,
+ ('35_동국산업', '48_오이도중앙로입구'): 3.6,
+ ('35_동국산업', '49_오이도해양단지.옥터초교입구'): 3.3,
+ ('35_동국산업', '50_오이도차고지'): 3.6,
+ ('36_중앙알칸', '00_오이도차고지'): 3.2,
+ ('36_중앙알칸', '02_오이도해양단지.옥터초교입구'): 3.0,
+ ('36_중앙알칸', '03_오이도중앙로입구'): 3.3,
+ ('36_중앙알칸', '04_오이도종합어시장'): 3.6,
+ ('36_중앙알칸', '05_함상전망대'): 3.9,
+ ('36_중앙알칸', '06_오이도박물관'): 4.5,
+ ('36_중앙알칸', '07_대부도입구'): 3.5,
+ ('36_중앙알칸', '08_시화환경사업소'): 3.2,
+ ('36_중앙알칸', '09_시화염색단지입구'): 2.9,
+ ('36_중앙알칸', '10_삼양사'): 2.2,
+ ('36_중앙알칸', '11_열병합발전소'): 1.9,
+ ('36_중앙알칸', '12_우진플라스코'): 2.0,
+ ('36_중앙알칸', '13_대한통운.동화산업'): 1.7,
+ ('36_중앙알칸', '14_우석철강'): 1.1,
+ ('36_중앙알칸', '15_파워맥스'): 0.0,
+ ('36_중앙알칸', '16_삼화정공'): 0.4,
+ ('36_중앙알칸', '17_홈플러스'): 0.8,
+ ('36_중앙알칸', '18_청솔아파트'): 1.3,
+ ('36_중앙알칸', '19_계룡1차아파트'): 1.7,
+ ('36_중앙알칸', '20_중앙도서관'): 2.0,
+ ('36_중앙알칸', '21_이마트'): 2.3,
+ ('36_중앙알칸', '22_시화정형외과.이철신경외과'): 3.0,
+ ('36_중앙알칸', '23_소방서.군서고.여성비전센터'): 2.8,
+ ('36_중앙알칸', '24_정왕역'): 2.8,
+ ('36_중앙알칸', '25_정왕역환승센터'): 3.1,
+ ('36_중앙알칸', '26_소방서.군서고.여성비전센터'): 2.8,
+ ('36_중앙알칸', '27_군서미래국제학교'): 3.2,
+ ('36_중앙알칸', '28_시화정형외과'): 3.6,
+ ('36_중앙알칸', '29_금강아파트'): 2.9,
+ ('36_중앙알칸', '30_이마트'): 2.3,
+ ('36_중앙알칸', '31_중앙도서관'): 2.0,
+ ('36_중앙알칸', '32_세종3차아파트'): 2.0,
+ ('36_중앙알칸', '33_진로아파트'): 1.6,
+ ('36_중앙알칸', '34_홈플러스'): 0.8,
+ ('36_중앙알칸', '35_동국산업'): 1.1,
+ ('36_중앙알칸', '37_희망공원'): 0.5,
+ ('36_중앙알칸', '38_대한통운'): 1.0,
+ ('36_중앙알칸', '39_우진프라스코'): 1.1,
+ ('36_중앙알칸', '40_열병합발전소'): 1.9,
+ ('36_중앙알칸', '41_삼양사'): 2.2,
+ ('36_중앙알칸', '42_시화염색단지입구'): 2.9,
+ ('36_중앙알칸', '43_시화환경사업소'): 3.2,
+ ('36_중앙알칸', '44_오이도입구'): 3.3,
+ ('36_중앙알칸', '45_오이도박물관'): 4.5,
+ ('36_중앙알칸', '46_함상전망대'): 3.9,
+ ('36_중앙알칸', '47_오이도종합어시장'): 3.6,
+ ('36_중앙알칸', '48_오이도중앙로입구'): 3.3,
+ ('36_중앙알칸', '49_오이도해양단지.옥터초교입구'): 3.0,
+ ('36_중앙알칸', '50_오이도차고지'): 3.2,
+ ('37_희망공원', '00_오이도차고지'): 2.6,
+ ('37_희망공원', '02_오이도해양단지.옥터초교입구'): 2.9,
+ ('37_희망공원', '03_오이도중앙로입구'): 3.2,
+ ('37_희망공원', '04_오이도종합어시장'): 3.5,
+ ('37_희망공원', '05_함상전망대'): 3.9,
+ ('37_희망공원', '06_오이도박물관'): 4.4,
+ ('37_희망공원', '07_대부도입구'): 3.0,
+ ('37_희망공원', '08_시화환경사업소'): 2.6,
+ ('37_희망공원', '09_시화염색단지입구'): 2.3,
+ ('37_희망공원', '10_삼양사'): 1.7,
+ ('37_희망공원', '11_열병합발전소'): 1.4,
+ ('37_희망공원', '12_우진플라스코'): 1.5,
+ ('37_희망공원', '13_대한통운.동화산업'): 1.2,
+ ('37_희망공원', '14_우석철강'): 0.0,
+ ('37_희망공원', '15_파워맥스'): 0.6,
+ ('37_희망공원', '16_삼화정공'): 1.0,
+ ('37_희망공원', '17_홈플러스'): 1.3,
+ ('37_희망공원', '18_청솔아파트'): 1.8,
+ ('37_희망공원', '19_계룡1차아파트'): 2.2,
+ ('37_희망공원', '20_중앙도서관'): 2.6,
+ ('37_희망공원', '21_이마트'): 2.8,
+ ('37_희망공원', '22_시화정형외과.이철신경외과'): 3.5,
+ ('37_희망공원', '23_소방서.군서고.여성비전센터'): 3.3,
+ ('37_희망공원', '24_정왕역'): 3.3,
+ ('37_희망공원', '25_정왕역환승센터'): 3.6,
+ ('37_희망공원', '26_소방서.군서고.여성비전센터'): 3.3,
+ ('37_희망공원', '27_군서미래국제학교'): 3.7,
+ ('37_희망공원', '28_시화정형외과'): 4.1,
+ ('37_희망공원', '29_금강아파트'): 3.4,
+ ('37_희망공원', '30_이마트'): 2.8,
+ ('37_희망공원', '31_중앙도서관'): 2.6,
+ ('37_희망공원', '32_세종3차아파트'): 2.6,
+ ('37_희망공원', '33_진로아파트'): 2.2,
+ ('37_희망공원', '34_홈플러스'): 1.3,
+ ('37_희망공원', '35_동국산업'): 1.6,
+ ('37_희망공원', '36_중앙알칸'): 1.5,
+ ('37_희망공원', '38_대한통운'): 0.4,
+ ('37_희망공원', '39_우진프라스코'): 0.6,
+ ('37_희망공원', '40_열병합발전소'): 1.4,
+ ('37_희망공원', '41_삼양사'): 1.7,
+ ('37_희망공원', '42_시화염색단지입구'): 2.3,
+ ('37_희망공원', '43_시화환경사업소'): 2.6,
+ ('37_희망공원', '44_오이도입구'): 2.8,
+ ('37_희망공원', '45_오이도박물관'): 4.4,
+ ('37_희망공원', '46_함상전망대'): 3.9,
+ ('37_희망공원', '47_오이도종합어시장'): 3.5,
+ ('37_희망공원', '48_오이도중앙로입구'): 3.2,
+ ('37_희망공원', '49_오이도해양단지.옥터초교입구'): 2.9,
+ ('37_희망공원', '50_오이도차고지'): 2.6,
+ ('38_대한통운', '00_오이도차고지'): 2.4,
+ ('38_대한통운', '02_오이도해양단지.옥터초교입구'): 2.7,
+ ('38_대한통운', '03_오이도중앙로입구'): 3.0,
+ ('38_대한통운', '04_오이도종합어시장'): 3.3,
+ ('38_대한통운', '05_함상전망대'): 3.7,
+ ('38_대한통운', '06_오이도박물관'): 4.3,
+ ('38_대한통운', '07_대부도입구'): 2.6,
+ ('38_대한통운', '08_시화환경사업소'): 2.2,
+ ('38_대한통운', '09_시화염색단지입구'): 2.2,
+ ('38_대한통운', '10_삼양사'): 1.3,
+ ('38_대한통운', '11_열병합발전소'): 1.0,
+ ('38_대한통운', '12_우진플라스코'): 1.1,
+ ('38_대한통운', '13_대한통운.동화산업'): 0.1,
+ ('38_대한통운', '14_우석철강'): 0.4,
+ ('38_대한통운', '15_파워맥스'): 1.0,
+ ('38_대한통운', '16_삼화정공'): 1.4,
+ ('38_대한통운', '17_홈플러스'): 1.8,
+ ('38_대한통운', '18_청솔아파트'): 2.3,
+ ('38_대한통운', '19_계룡1차아파트'): 2.6,
+ ('38_대한통운', '20_중앙도서관'): 3.0,
+ ('38_대한통운', '21_이마트'): 3.3,
+ ('38_대한통운', '22_시화정형외과.이철신경외과'): 3.9,
+ ('38_대한통운', '23_소방서.군서고.여성비전센터'): 3.7,
+ ('38_대한통운', '24_정왕역'): 3.8,
+ ('38_대한통운', '25_정왕역환승센터'): 4.0,
+ ('38_대한통운', '26_소방서.군서고.여성비전센터'): 3.7,
+ ('38_대한통운', '27_군서미래국제학교'): 4.1,
+ ('38_대한통운', '28_시화정형외과'): 4.5,
+ ('38_대한통운', '29_금강아파트'): 3.9,
+ ('38_대한통운', '30_이마트'): 3.3,
+ ('38_대한통운', '31_중앙도서관'): 3.0,
+ ('38_대한통운', '32_세종3차아파트'): 3.0,
+ ('38_대한통운', '33_진로아파트'): 2.6,
+ ('38_대한통운', '34_홈플러스'): 1.8,
+ ('38_대한통운', '35_동국산업'): 2.0,
+ ('38_대한통운', '36_중앙알칸'): 1.9,
+ ('38_대한통운', '37_희망공원'): 1.4,
+ ('38_대한통운', '39_우진프라스코'): 0.2,
+ ('38_대한통운', '40_열병합발전소'): 1.0,
+ ('38_대한통운', '41_삼양사'): 1.3,
+ ('38_대한통운', '42_시화염색단지입구'): 2.2,
+ ('38_대한통운', '43_시화환경사업소'): 2.2,
+ ('38_대한통운', '44_오이도입구'): 2.4,
+ ('38_대한통운', '45_오이도박물관'): 4.3,
+ ('38_대한통운', '46_함상전망대'): 3.7,
+ ('38_대한통운', '47_오이도종합어시장'): 3.3,
+ ('38_대한통운', '48_오이도중앙로입구'): 3.0,
+ ('38_대한통운', '49_오이도해양단지.옥터초교입구'): 2.7,
+ ('38_대한통운', '50_오이도차고지'): 2.4,
+ ('39_우진프라스코', '00_오이도차고지'): 2.6,
+ ('39_우진프라스코', '02_오이도해양단지.옥터초교입구'): 2.9,
+ ('39_우진프라스코', '03_오이도중앙로입구'): 3.2,
+ ('39_우진프라스코', '04_오이도종합어시장'): 3.5,
+ ('39_우진프라스코', '05_함상전망대'): 3.6,
+ ('39_우진프라스코', '06_오이도박물관'): 4.2,
+ ('39_우진프라스코', '07_대부도입구'): 2.4,
+ ('39_우진프라스코', '08_시화환경사업소'): 2.0,
+ ('39_우진프라스코', '09_시화염색단지입구'): 2.0,
+ ('39_우진프라스코', '10_삼양사'): 1.1,
+ ('39_우진프라스코', '11_열병합발전소'): 0.8,
+ ('39_우진프라스코', '12_우진플라스코'): 0.0,
+ ('39_우진프라스코', '13_대한통운.동화산업'): 0.2,
+ ('39_우진프라스코', '14_우석철강'): 0.6,
+ ('39_우진프라스코', '15_파워맥스'): 1.2,
+ ('39_우진프라스코', '16_삼화정공'): 1.6,
+ ('39_우진프라스코', '17_홈플러스'): 1.9,
+ ('39_우진프라스코', '18_청솔아파트'): 2.4,
+ ('39_우진프라스코', '19_계룡1차아파트'): 2.8,
+ ('39_우진프라스코', '20_중앙도서관'): 3.1,
+ ('39_우진프라스코', '21_이마트'): 3.4,
+ ('39_우진프라스코', '22_시화정형외과.이철신경외과'): 4.1,
+ ('39_우진프라스코', '23_소방서.군서고.여성비전센터'): 3.9,
+ ('39_우진프라스코', '24_정왕역'): 3.9,
+ ('39_우진프라스코', '25_정왕역환승센터'): 4.2,
+ ('39_우진프라스코', '26_소방서.군서고.여성비전센터'): 3.9,
+ ('39_우진프라스코', '27_군서미래국제학교'): 4.3,
+ ('39_우진프라스코', '28_시화정형외과'): 4.7,
+ ('39_우진프라스코', '29_금강아파트'): 4.0,
+ ('39_우진프라스코', '30_이마트'): 3.4,
+ ('39_우진프라스코', '31_중앙도서관'): 3.1,
+ ('39_우진프라스코', '32_세종3차아파트'): 3.2,
+ ('39_우진프라스코', '33_진로아파트'): 2.8,
+ ('39_우진프라스코', '34_홈플러스'): 1.9,
+ ('39_우진프라스코', '35_동국산업'): 2.2,
+ ('39_우진프라스코', '36_중앙알칸'): 2.0,
+ ('39_우진프라스코', '37_희망공원'): 1.6,
+ ('39_우진프라스코', '38_대한통운'): 0.9,
+ ('39_우진프라스코', '40_열병합발전소'): 0.8,
+ ('39_우진프라스코', '41_삼양사'): 1.1,
+ ('39_우진프라스코', '42_시화염색단지입구'): 2.0,
+ ('39_우진프라스코', '43_시화환경사업소'): 2.0,
+ ('39_우진프라스코', '44_오이도입구'): 2.2,
+ ('39_우진프라스코', '45_오이도박물관'): 4.2,
+ ('39_우진프라스코', '46_함상전망대'): 3.6,
+ ('39_우진프라스코', '47_오이도종합어시장'): 3.5,
+ ('39_우진프라스코', '48_오이도중앙로입구'): 3.2,
+ ('39_우진프라스코', '49_오이도해양단지.옥터초교입구'): 2.9,
+ ('39_우진프라스코', '50_오이도차고지'): 2.6,
+ ('40_열병합발전소', '00_오이도차고지'): 3.0,
+ ('40_열병합발전소', '02_오이도해양단지.옥터초교입구'): 3.3,
+ ('40_열병합발전소', '03_오이도중앙로입구'): 3.5,
+ ('40_열병합발전소', '04_오이도종합어시장'): 3.8,
+ ('40_열병합발전소', '05_함상전망대'): 3.6,
+ ('40_열병합발전소', '06_오이도박물관'): 4.2,
+ ('40_열병합발전소', '07_대부도입구'): 2.4,
+ ('40_열병합발전소', '08_시화환경사업소'): 2.0,
+ ('40_열병합발전소', '09_시화염색단지입구'): 2.0,
+ ('40_열병합발전소', '10_삼양사'): 1.1,
+ ('40_열병합발전소', '11_열병합발전소'): 0.0,
+ ('40_열병합발전소', '12_우진플라스코'): 0.6,
+ ('40_열병합발전소', '13_대한통운.동화산업'): 0.9,
+ ('40_열병합발전소', '14_우석철강'): 1.2,
+ ('40_열병합발전소', '15_파워맥스'): 1.8,
+ ('40_열병합발전소', '16_삼화정공'): 2.2,
+ ('40_열병합발전소', '17_홈플러스'): 2.6,
+ ('40_열병합발전소', '18_청솔아파트'): 3.0,
+ ('40_열병합발전소', '19_계룡1차아파트'): 3.4,
+ ('40_열병합발전소', '20_중앙도서관'): 3.8,
+ ('40_열병합발전소', '21_이마트'): 4.1,
+ ('40_열병합발전소', '22_시화정형외과.이철신경외과'): 4.7,
+ ('40_열병합발전소', '23_소방서.군서고.여성비전센터'): 4.5,
+ ('40_열병합발전소', '24_정왕역'): 4.7,
+ ('40_열병합발전소', '25_정왕역환승센터'): 4.8,
+ ('40_열병합발전소', '26_소방서.군서고.여성비전센터'): 4.5,
+ ('40_열병합발전소', '27_군서미래국제학교'): 4.9,
+ ('40_열병합발전소', '28_시화정형외과'): 5.3,
+ ('40_열병합발전소', '29_금강아파트'): 4.7,
+ ('40_열병합발전소', '30_이마트'): 4.1,
+ ('40_열병합발전소', '31_중앙도서관'): 3.8,
+ ('40_열병합발전소', '32_세종3차아파트'): 3.8,
+ ('40_열병합발전소', '33_진로아파트'): 3.4,
+ ('40_열병합발전소', '34_홈플러스'): 2.6,
+ ('40_열병합발전소', '35_동국산업'): 2.8,
+ ('40_열병합발전소', '36_중앙알칸'): 2.7,
+ ('40_열병합발전소', '37_희망공원'): 2.2,
+ ('40_열병합발전소', '38_대한통운'): 1.6,
+ ('40_열병합발전소', '39_우진프라스코'): 1.3,
+ ('40_열병합발전소', '41_삼양사'): 1.1,
+ ('40_열병합발전소', '42_시화염색단지입구'): 2.0,
+ ('40_열병합발전소', '43_시화환경사업소'): 2.0,
+ ('40_열병합발전소', '44_오이도입구'): 2.2,
+ ('40_열병합발전소', '45_오이도박물관'): 4.2,
+ ('40_열병합발전소', '46_함상전망대'): 3.6,
+ ('40_열병합발전소', '47_오이도종합어시장'): 3.8,
+ ('40_열병합발전소', '48_오이도중앙로입구'): 3.5,
+ ('40_열병합발전소', '49_오이도해양단지.옥터초교입구'): 3.3,
+ ('40_열병합발전소', '50_오이도차고지'): 3.0,
+ ('41_삼양사', '00_오이도차고지'): 1.9,
+ ('41_삼양사', '02_오이도해양단지.옥터초교입구'): 2.2,
+ ('41_삼양사', '03_오이도중앙로입구'): 2.5,
+ ('41_삼양사', '04_오이도종합어시장'): 2.8,
+ ('41_삼양사', '05_함상전망대'): 2.5,
+ ('41_삼양사', '06_오이도박물관'): 3.1,
+ ('41_삼양사', '07_대부도입구'): 1.3,
+ ('41_삼양사', '08_시화환경사업소'): 0.9,
+ ('41_삼양사', '09_시화염색단지입구'): 1.0,
+ ('41_삼양사', '10_삼양사'): 0.0,
+ ('41_삼양사', '11_열병합발전소'): 0.5,
+ ('41_삼양사', '12_우진플라스코'): 1.1,
+ ('41_삼양사', '13_대한통운.동화산업'): 1.3,
+ ('41_삼양사', '14_우석철강'): 1.7,
+ ('41_삼양사', '15_파워맥스'): 2.3,
+ ('41_삼양사', '16_삼화정공'): 2.7,
+ ('41_삼양사', '17_홈플러스'): 3.1,
+ ('41_삼양사', '18_청솔아파트'): 3.5,
+ ('41_삼양사', '19_계룡1차아파트'): 3.9,
+ ('41_삼양사', '20_중앙도서관'): 4.3,
+ ('41_삼양사', '21_이마트'): 4.6,
+ ('41_삼양사', '22_시화정형외과.이철신경외과'): 5.2,
+ ('41_삼양사', '23_소방서.군서고.여성비전센터'): 5.0,
+ ('41_삼양사', '24_정왕역'): 5.1,
+ ('41_삼양사', '25_정왕역환승센터'): 5.2,
+ ('41_삼양사', '26_소방서.군서고.여성비전센터'): 5.0,
+ ('41_삼양사', '27_군서미래국제학교'): 5.4,
+ ('41_삼양사', '28_시화정형외과'): 5.8,
+ ('41_삼양사', '29_금강아파트'): 5.1,
+ ('41_삼양사', '30_이마트'): 4.6,
+ ('41_삼양사', '31_중앙도서관'): 4.3,
+ ('41_삼양사', '32_세종3차아파트'): 3.8,
+ ('41_삼양사', '33_진로아파트'): 3.7,
+ ('41_삼양사', '34_홈플러스'): 3.1,
+ ('41_삼양사', '35_동국산업'): 3.3,
+ ('41_삼양사', '36_중앙알칸'): 2.7,
+ ('41_삼양사', '37_희망공원'): 2.2,
+ ('41_삼양사', '38_대한통운'): 1.5,
+ ('41_삼양사', '39_우진프라스코'): 1.2,
+ ('41_삼양사', '40_열병합발전소'): 0.5,
+ ('41_삼양사', '42_시화염색단지입구'): 1.0,
+ ('41_삼양사', '43_시화환경사업소'): 0.9,
+ ('41_삼양사', '44_오이도입구'): 1.1,
+ ('41_삼양사', '45_오이도박물관'): 3.1,
+ ('41_삼양사', '46_함상전망대'): 2.5,
+ ('41_삼양사', '47_오이도종합어시장'): 2.8,
+ ('41_삼양사', '48_오이도중앙로입구'): 2.5,
+ ('41_삼양사', '49_오이도해양단지.옥터초교입구'): 2.2,
+ ('41_삼양사', '50_오이도차고지'): 1.9,
+ ('42_시화염색단지입구', '00_오이도차고지'): 1.7,
+ ('42_시화염색단지입구', '02_오이도해양단지.옥터초교입구'): 2.0,
+ ('42_시화염색단지입구', '03_오이도중앙로입구'): 2.3,
+ ('42_시화염색단지입구', '04_오이도종합어시장'): 2.6,
+ ('42_시화염색단지입구', '05_함상전망대'): 2.3,
+ ('42_시화염색단지입구', '06_오이도박물관'): 2.9,
+ ('42_시화염색단지입구', '07_대부도입구'): 1.2,
+ ('42_시화염색단지입구', '08_시화환경사업소'): 0.8,
+ ('42_시화염색단지입구', '09_시화염색단지입구'): 0.0,
+ ('42_시화염색단지입구', '10_삼양사'): 0.4,
+ ('42_시화염색단지입구', '11_열병합발전소'): 0.8,
+ ('42_시화염색단지입구', '12_우진플라스코'): 1.5,
+ ('42_시화염색단지입구', '13_대한통운.동화산업'): 1.7,
+ ('42_시화염색단지입구', '14_우석철강'): 2.1,
+ ('42_시화염색단지입구', '15_파워맥스'): 2.6,
+ ('42_시화염색단지입구', '16_삼화정공'): 3.1,
+ ('42_시화염색단지입구', '17_홈플러스'): 3.4,
+ ('42_시화염색단지입구', '18_청솔아파트'): 3.9,
+ ('42_시화염색단지입구', '19_계룡1차아파트'): 4.3,
+ ('42_시화염색단지입구', '20_중앙도서관'): 4.7,
+ ('42_시화염색단지입구', '21_이마트'): 4.9,
+ ('42_시화염색단지입구', '22_시화정형외과.이철신경외과'): 5.6,
+ ('42_시화염색단지입구', '23_소방서.군서고.여성비전센터'): 5.4,
+ ('42_시화염색단지입구', '24_정왕역'): 5.4,
+ ('42_시화염색단지입구', '25_정왕역환승센터'): 5.6,
+ ('42_시화염색단지입구', '26_소방서.군서고.여성비전센터'): 5.4,
+ ('42_시화염색단지입구', '27_군서미래국제학교'): 5.8,
+ ('42_시화염색단지입구', '28_시화정형외과'): 6.2,
+ ('42_시화염색단지입구', '29_금강아파트'): 5.5,
+ ('42_시화염색단지입구', '30_이마트'): 4.9,
+ ('42_시화염색단지입구', '31_중앙도서관'): 4.7,
+ ('42_시화염색단지입구', '32_세종3차아파트'): 4.1,
+ ('42_시화염색단지입구', '33_진로아파트'): 4.1,
+ ('42_시화염색단지입구', '34_홈플러스'): 3.4,
+ ('42_시화염색단지입구', '35_동국산업'): 3.7,
+ ('42_시화염색단지입구', '36_중앙알칸'): 3.0,
+ ('42_시화염색단지입구', '37_희망공원'): 2.6,
+ ('42_시화염색단지입구', '38_대한통운'): 1.9,
+ ('42_시화염색단지입구', '39_우진프라스코'): 1.6,
+ ('42_시화염색단지입구', '40_열병합발전소'): 0.8,
+ ('42_시화염색단지입구', '41_삼양사'): 0.4,
+ ('42_시화염색단지입구', '43_시화환경사업소'): 0.8,
+ ('42_시화염색단지입구', '44_오이도입구'): 1.0,
+ ('42_시화염색단지입구', '45_오이도박물관'): 2.9,
+ ('42_시화염색단지입구', '46_함상전망대'): 2.3,
+ ('42_시화염색단지입구', '47_오이도종합어시장'): 2.6,
+ ('42_시화염색단지입구', '48_오이도중앙로입구'): 2.3,
+ ('42_시화염색단지입구', '49_오이도해양단지.옥터초교입구'): 2.0,
+ ('42_시화염색단지입구', '50_오이도차고지'): 1.7,
+ ('43_시화환경사업소', '00_오이도차고지'): 1.4,
+ ('43_시화환경사업소', '02_오이도해양단지.옥터초교입구'): 1.7,
+ ('43_시화환경사업소', '03_오이도중앙로입구'): 2.0,
+ ('43_시화환경사업소', '04_오이도종합어시장'): 2.3,
+ ('43_시화환경사업소', '05_함상전망대'): 2.5,
+ ('43_시화환경사업소', '06_오이도박물관'): 3.1,
+ ('43_시화환경사업소', '07_대부도입구'): 1.3,
+ ('43_시화환경사업소', '08_시화환경사업소'): 0.0,
+ ('43_시화환경사업소', '09_시화염색단지입구'): 0.2,
+ ('43_시화환경사업소', '10_삼양사'): 0.6,
+ ('43_시화환경사업소', '11_열병합발전소'): 1.0,
+ ('43_시화환경사업소', '12_우진플라스코'): 1.7,
+ ('43_시화환경사업소', '13_대한통운.동화산업'): 1.9,
+ ('43_시화환경사업소', '14_우석철강'): 2.3,
+ ('43_시화환경사업소', '15_파워맥스'): 2.8,
+ ('43_시화환경사업소', '16_삼화정공'): 3.2,
+ ('43_시화환경사업소', '17_홈플러스'): 3.6,
+ ('43_시화환경사업소', '18_청솔아파트'): 4.1,
+ ('43_시화환경사업소', '19_계룡1차아파트'): 4.5,
+ ('43_시화환경사업소', '20_중앙도서관'): 4.8,
+ ('43_시화환경사업소', '21_이마트'): 5.1,
+ ('43_시화환경사업소', '22_시화정형외과.이철신경외과'): 5.8,
+ ('43_시화환경사업소', '23_소방서.군서고.여성비전센터'): 5.6,
+ ('43_시화환경사업소', '24_정왕역'): 5.6,
+ ('43_시화환경사업소', '25_정왕역환승센터'): 5.8,
+ ('43_시화환경사업소', '26_소방서.군서고.여성비전센터'): 5.6,
+ ('43_시화환경사업소', '27_군서미래국제학교'): 6.0,
+ ('43_시화환경사업소', '28_시화정형외과'): 6.4,
+ ('43_시화환경사업소', '29_금강아파트'): 5.7,
+ ('43_시화환경사업소', '30_이마트'): 5.1,
+ ('43_시화환경사업소', '31_중앙도서관'): 4.8,
+ ('43_시화환경사업소', '32_세종3차아파트'): 4.3,
+ ('43_시화환경사업소', '33_진로아파트'): 4.2,
+ ('43_시화환경사업소', '34_홈플러스'): 3.6,
+ ('43_시화환경사업소', '35_동국산업'): 3.9,
+ ('43_시화환경사업소', '36_중앙알칸'): 3.2,
+ ('43_시화환경사업소', '37_희망공원'): 2.7,
+ ('43_시화환경사업소', '38_대한통운'): 2.1,
+ ('43_시화환경사업소', '39_우진프라스코'): 1.8,
+ ('43_시화환경사업소', '40_열병합발전소'): 1.0,
+ ('43_시화환경사업소', '41_삼양사'): 0.6,
+ ('43_시화환경사업소', '42_시화염색단지입구'): 0.2,
+ ('43_시화환경사업소', '44_오이도입구'): 1.2,
+ ('43_시화환경사업소', '45_오이도박물관'): 3.1,
+ ('43_시화환경사업소', '46_함상전망대'): 2.5,
+ ('43_시화환경사업소', '47_오이도종합어시장'): 2.3,
+ ('43_시화환경사업소', '48_오이도중앙로입구'): 2.0,
+ ('43_시화환경사업소', '49_오이도해양단지.옥터초교입구'): 1.7,
+ ('43_시화환경사업소', '50_오이도차고지'): 1.4,
+ ('44_오이도입구', '00_오이도차고지'): 1.7,
+ ('44_오이도입구', '02_오이도해양단지.옥터초교입구'): 2.0,
+ ('44_오이도입구', '03_오이도중앙로입구'): 2.0,
+ ('44_오이도입구', '04_오이도종합어시장'): 1.9,
+ ('44_오이도입구', '05_함상전망대'): 1.3,
+ ('44_오이도입구', '06_오이도박물관'): 2.0,
+ ('44_오이도입구', '07_대부도입구'): 0.2,
+ ('44_오이도입구', '08_시화환경사업소'): 0.7,
+ ('44_오이도입구', '09_시화염색단지입구'): 0.9,
+ ('44_오이도입구', '10_삼양사'): 1.3,
+ ('44_오이도입구', '11_열병합발전소'): 1.8,
+ ('44_오이도입구', '12_우진플라스코'): 2.4,
+ ('44_오이도입구', '13_대한통운.동화산업'): 2.6,
+ ('44_오이도입구', '14_우석철강'): 3.0,
+ ('44_오이도입구', '15_파워맥스'): 3.6,
+ ('44_오이도입구', '16_삼화정공'): 4.0,
+ ('44_오이도입구', '17_홈플러스'): 4.3,
+ ('44_오이도입구', '18_청솔아파트'): 4.7,
+ ('44_오이도입구', '19_계룡1차아파트'): 5.1,
+ ('44_오이도입구', '20_중앙도서관'): 5.4,
+ ('44_오이도입구', '21_이마트'): 5.7,
+ ('44_오이도입구', '22_시화정형외과.이철신경외과'): 6.3,
+ ('44_오이도입구', '23_소방서.군서고.여성비전센터'): 6.1,
+ ('44_오이도입구', '24_정왕역'): 6.2,
+ ('44_오이도입구', '25_정왕역환승센터'): 6.3,
+ ('44_오이도입구', '26_소방서.군서고.여성비전센터'): 6.1,
+ ('44_오이도입구', '27_군서미래국제학교'): 6.5,
+ ('44_오이도입구', '28_시화정형외과'): 6.9,
+ ('44_오이도입구', '29_금강아파트'): 6.3,
+ ('44_오이도입구', '30_이마트'): 5.7,
+ ('44_오이도입구', '31_중앙도서관'): 5.4,
+ ('44_오이도입구', '32_세종3차아파트'): 4.9,
+ ('44_오이도입구', '33_진로아파트'): 4.8,
+ ('44_오이도입구', '34_홈플러스'): 4.3,
+ ('44_오이도입구', '35_동국산업'): 4.5,
+ ('44_오이도입구', '36_중앙알칸'): 3.9,
+ ('44_오이도입구', '37_희망공원'): 3.5,
+ ('44_오이도입구', '38_대한통운'): 2.8,
+ ('44_오이도입구', '39_우진프라스코'): 2.5,
+ ('44_오이도입구', '40_열병합발전소'): 1.8,
+ ('44_오이도입구', '41_삼양사'): 1.3,
+ ('44_오이도입구', '42_시화염색단지입구'): 0.9,
+ ('44_오이도입구', '43_시화환경사업소'): 0.7,
+ ('44_오이도입구', '45_오이도박물관'): 2.0,
+ ('44_오이도입구', '46_함상전망대'): 1.3,
+ ('44_오이도입구', '47_오이도종합어시장'): 1.9,
+ ('44_오이도입구', '48_오이도중앙로입구'): 2.0,
+ ('44_오이도입구', '49_오이도해양단지.옥터초교입구'): 2.0,
+ ('44_오이도입구', '50_오이도차고지'): 1.7,
+ ('45_오이도박물관', '00_오이도차고지'): 1.9,
+ ('45_오이도박물관', '02_오이도해양단지.옥터초교입구'): 2.2,
+ ('45_오이도박물관', '03_오이도중앙로입구'): 1.6,
+ ('45_오이도박물관', '04_오이도종합어시장'): 1.5,
+ ('45_오이도박물관', '05_함상전망대'): 1.0,
+ ('45_오이도박물관', '06_오이도박물관'): 0.0,
+ ('45_오이도박물관', '07_대부도입구'): 0.4,
+ ('45_오이도박물관', '08_시화환경사업소'): 0.9,
+ ('45_오이도박물관', '09_시화염색단지입구'): 1.1,
+ ('45_오이도박물관', '10_삼양사'): 1.5,
+ ('45_오이도박물관', '11_열병합발전소'): 2.0,
+ ('45_오이도박물관', '12_우진플라스코'): 2.6,
+ ('45_오이도박물관', '13_대한통운.동화산업'): 2.8,
+ ('45_오이도박물관', '14_우석철강'): 3.2,
+ ('45_오이도박물관', '15_파워맥스'): 3.8,
+ ('45_오이도박물관', '16_삼화정공'): 4.2,
+ ('45_오이도박물관', '17_홈플러스'): 4.5,
+ ('45_오이도박물관', '18_청솔아파트'): 4.8,
+ ('45_오이도박물관', '19_계룡1차아파트'): 5.3,
+ ('45_오이도박물관', '20_중앙도서관'): 5.6,
+ ('45_오이도박물관', '21_이마트'): 5.9,
+ ('45_오이도박물관', '22_시화정형외과.이철신경외과'): 6.5,
+ ('45_오이도박물관', '23_소방서.군서고.여성비전센터'): 6.3,
+ ('45_오이도박물관', '24_정왕역'): 6.4,
+ ('45_오이도박물관', '25_정왕역환승센터'): 6.5,
+ ('45_오이도박물관', '26_소방서.군서고.여성비전센터'): 6.3,
+ ('45_오이도박물관', '27_군서미래국제학교'): 6.7,
+ ('45_오이도박물관', '28_시화정형외과'): 7.1,
+ ('45_오이도박물관', '29_금강아파트'): 6.5,
+ ('45_오이도박물관', '30_이마트'): 5.9,
+ ('45_오이도박물관', '31_중앙도서관'): 5.6,
+ ('45_오이도박물관', '32_세종3차아파트'): 5.1,
+ ('45_오이도박물관', '33_진로아파트'): 5.0,
+ ('45_오이도박물관', '34_홈플러스'): 4.5,
+ ('45_오이도박물관', '35_동국산업'): 4.7,
+ ('45_오이도박물관', '36_중앙알칸'): 4.1,
+ ('45_오이도박물관', '37_희망공원'): 3.7,
+ ('45_오이도박물관', '38_대한통운'): 3.0,
+ ('45_오이도박물관', '39_우진프라스코'): 2.7,
+ ('45_오이도박물관', '40_열병합발전소'): 2.0,
+ ('45_오이도박물관', '41_삼양사'): 1.5,
+ ('45_오이도박물관', '42_시화염색단지입구'): 1.1,
+ ('45_오이도박물관', '43_시화환경사업소'): 0.9,
+ ('45_오이도박물관', '44_오이도입구'): 1.9,
+ ('45_오이도박물관', '46_함상전망대'): 1.0,
+ ('45_오이도박물관', '47_오이도종합어시장'): 1.5,
+ ('45_오이도박물관', '48_오이도중앙로입구'): 1.6,
+ ('45_오이도박물관', '49_오이도해양단지.옥터초교입구'): 2.2,
+ ('45_오이도박물관', '50_오이도차고지'): 1.9,
+ ('46_함상전망대', '00_오이도차고지'): 2.5,
+ ('46_함상전망대', '02_오이도해양단지.옥터초교입구'): 1.5,
+ ('46_함상전망대', '03_오이도중앙로입구'): 0.7,
+ ('46_함상전망대', '04_오이도종합어시장'): 0.7,
+ ('46_함상전망대', '05_함상전망대'): 0.0,
+ ('46_함상전망대', '06_오이도박물관'): 0.9,
+ ('46_함상전망대', '07_대부도입구'): 1.2,
+ ('46_함상전망대', '08_시화환경사업소'): 1.8,
+ ('46_함상전망대', '09_시화염색단지입구'): 2.0,
+ ('46_함상전망대', '10_삼양사'): 2.4,
+ ('46_함상전망대', '11_열병합발전소'): 2.8,
+ ('46_함상전망대', '12_우진플라스코'): 3.4,
+ ('46_함상전망대', '13_대한통운.동화산업'): 3.7,
+ ('46_함상전망대', '14_우석철강'): 3.9,
+ ('46_함상전망대', '15_파워맥스'): 4.0,
+ ('46_함상전망대', '16_삼화정공'): 4.3,
+ ('46_함상전망대', '17_홈플러스'): 4.5,
+ ('46_함상전망대', '18_청솔아파트'): 4.9,
+ ('46_함상전망대', '19_계룡1차아파트'): 5.3,
+ ('46_함상전망대', '20_중앙도서관'): 5.6,
+ ('46_함상전망대', '21_이마트'): 5.9,
+ ('46_함상전망대', '22_시화정형외과.이철신경외과'): 6.6,
+ ('46_함상전망대', '23_소방서.군서고.여성비전센터'): 6.3,
+ ('46_함상전망대', '24_정왕역'): 6.4,
+ ('46_함상전망대', '25_정왕역환승센터'): 6.6,
+ ('46_함상전망대', '26_소방서.군서고.여성비전센터'): 6.3,
+ ('46_함상전망대', '27_군서미래국제학교'): 6.8,
+ ('46_함상전망대', '28_시화정형외과'): 7.1,
+ ('46_함상전망대', '29_금강아파트'): 6.5,
+ ('46_함상전망대', '30_이마트'): 5.9,
+ ('46_함상전망대', '31_중앙도서관'): 5.6,
+ ('46_함상전망대', '32_세종3차아파트'): 5.1,
+ ('46_함상전망대', '33_진로아파트'): 5.1,
+ ('46_함상전망대', '34_홈플러스'): 4.5,
+ ('46_함상전망대', '35_동국산업'): 4.8,
+ ('46_함상전망대', '36_중앙알칸'): 4.2,
+ ('46_함상전망대', '37_희망공원'): 3.9,
+ ('46_함상전망대', '38_대한통운'): 3.7,
+ ('46_함상전망대', '39_우진프라스코'): 3.6,
+ ('46_함상전망대', '40_열병합발전소'): 2.8,
+ ('46_함상전망대', '41_삼양사'): 2.4,
+ ('46_함상전망대', '42_시화염색단지입구'): 2.0,
+ ('46_함상전망대', '43_시화환경사업소'): 1.8,
+ ('46_함상전망대', '44_오이도입구'): 2.7,
+ ('46_함상전망대', '45_오이도박물관'): 0.9,
+ ('46_함상전망대', '47_오이도종합어시장'): 0.7,
+ ('46_함상전망대', '48_오이도중앙로입구'): 0.7,
+ ('46_함상전망대', '49_오이도해양단지.옥터초교입구'): 1.5,
+ ('46_함상전망대', '50_오이도차고지'): 2.5,
+ ('47_오이도종합어시장', '00_오이도차고지'): 2.1,
+ ('47_오이도종합어시장', '02_오이도해양단지.옥터초교입구'): 1.2,
+ ('47_오이도종합어시장', '03_오이도중앙로입구'): 0.4,
+ ('47_오이도종합어시장', '04_오이도종합어시장'): 0.0,
+ ('47_오이도종합어시장', '05_함상전망대'): 0.4,
+ ('47_오이도종합어시장', '06_오이도박물관'): 1.2,
+ ('47_오이도종합어시장', '07_대부도입구'): 1.6,
+ ('47_오이도종합어시장', '08_시화환경사업소'): 2.2,
+ ('47_오이도종합어시장', '09_시화염색단지입구'): 2.3,
+ ('47_오이도종합어시장', '10_삼양사'): 2.7,
+ ('47_오이도종합어시장', '11_열병합발전소'): 3.2,
+ ('47_오이도종합어시장', '12_우진플라스코'): 3.8,
+ ('47_오이도종합어시장', '13_대한통운.동화산업'): 3.6,
+ ('47_오이도종합어시장', '14_우석철강'): 3.5,
+ ('47_오이도종합어시장', '15_파워맥스'): 3.6,
+ ('47_오이도종합어시장', '16_삼화정공'): 3.9,
+ ('47_오이도종합어시장', '17_홈플러스'): 4.1,
+ ('47_오이도종합어시장', '18_청솔아파트'): 4.5,
+ ('47_오이도종합어시장', '19_계룡1차아파트'): 4.9,
+ ('47_오이도종합어시장', '20_중앙도서관'): 5.3,
+ ('47_오이도종합어시장', '21_이마트'): 5.5,
+ ('47_오이도종합어시장', '22_시화정형외과.이철신경외과'): 6.2,
+ ('47_오이도종합어시장', '23_소방서.군서고.여성비전센터'): 6.0,
+ ('47_오이도종합어시장', '24_정왕역'): 6.0,
+ ('47_오이도종합어시장', '25_정왕역환승센터'): 6.2,
+ ('47_오이도종합어시장', '26_소방서.군서고.여성비전센터'): 6.0,
+ ('47_오이도종합어시장', '27_군서미래국제학교'): 6.4,
+ ('47_오이도종합어시장', '28_시화정형외과'): 6.8,
+ ('47_오이도종합어시장', '29_금강아파트'): 6.1,
+ ('47_오이도종합어시장', '30_이마트'): 5.5,
+ ('47_오이도종합어시장', '31_중앙도서관'): 5.3,
+ ('47_오이도종합어시장', '32_세종3차아파트'): 4.7,
+ ('47_오이도종합어시장', '33_진로아파트'): 4.7,
+ ('47_오이도종합어시장', '34_홈플러스'): 4.1,
+ ('47_오이도종합어시장', '35_동국산업'): 4.4,
+ ('47_오이도종합어시장', '36_중앙알칸'): 3.9,
+ ('47_오이도종합어시장', '37_희망공원'): 3.5,
+ ('47_오이도종합어시장', '38_대한통운'): 3.3,
+ ('47_오이도종합어시장', '39_우진프라스코'): 3.5,
+ ('47_오이도종합어시장', '40_열병합발전소'): 3.2,
+ ('47_오이도종합어시장', '41_삼양사'): 2.7,
+ ('47_오이도종합어시장', '42_시화염색단지입구'): 2.3,
+ ('47_오이도종합어시장', '43_시화환경사업소'): 2.2,
+ ('47_오이도종합어시장', '44_오이도입구'): 2.4,
+ ('47_오이도종합어시장', '45_오이도박물관'): 1.2,
+ ('47_오이도종합어시장', '46_함상전망대'): 0.4,
+ ('47_오이도종합어시장', '48_오이도중앙로입구'): 0.4,
+ ('47_오이도종합어시장', '49_오이도해양단지.옥터초교입구'): 1.2,
+ ('47_오이도종합어시장', '50_오이도차고지'): 2.1,
+ ('48_오이도중앙로입구', '00_오이도차고지'): 2.1,
+ ('48_오이도중앙로입구', '02_오이도해양단지.옥터초교입구'): 1.1,
+ ('48_오이도중앙로입구', '03_오이도중앙로입구'): 0.0,
+ ('48_오이도중앙로입구', '04_오이도종합어시장'): 0.3,
+ ('48_오이도중앙로입구', '05_함상전망대'): 0.7,
+ ('48_오이도중앙로입구', '06_오이도박물관'): 1.5,
+ ('48_오이도중앙로입구', '07_대부도입구'): 1.9,
+ ('48_오이도중앙로입구', '08_시화환경사업소'): 2.1,
+ ('48_오이도중앙로입구', '09_시화염색단지입구'): 2.3,
+ ('48_오이도중앙로입구', '10_삼양사'): 2.7,
+ ('48_오이도중앙로입구', '11_열병합발전소'): 3.1,
+ ('48_오이도중앙로입구', '12_우진플라스코'): 3.8,
+ ('48_오이도중앙로입구', '13_대한통운.동화산업'): 3.5,
+ ('48_오이도중앙로입구', '14_우석철강'): 3.4,
+ ('48_오이도중앙로입구', '15_파워맥스'): 3.5,
+ ('48_오이도중앙로입구', '16_삼화정공'): 3.8,
+ ('48_오이도중앙로입구', '17_홈플러스'): 4.1,
+ ('48_오이도중앙로입구', '18_청솔아파트'): 4.5,
+ ('48_오이도중앙로입구', '19_계룡1차아파트'): 4.9,
+ ('48_오이도중앙로입구', '20_중앙도서관'): 5.2,
+ ('48_오이도중앙로입구', '21_이마트'): 5.5,
+ ('48_오이도중앙로입구', '22_시화정형외과.이철신경외과'): 6.1,
+ ('48_오이도중앙로입구', '23_소방서.군서고.여성비전센터'): 5.9,
+ ('48_오이도중앙로입구', '24_정왕역'): 6.0,
+ ('48_오이도중앙로입구', '25_정왕역환승센터'): 6.1,
+ ('48_오이도중앙로입구', '26_소방서.군서고.여성비전센터'): 5.9,
+ ('48_오이도중앙로입구', '27_군서미래국제학교'): 6.3,
+ ('48_오이도중앙로입구', '28_시화정형외과'): 6.7,
+ ('48_오이도중앙로입구', '29_금강아파트'): 6.1,
+ ('48_오이도중앙로입구', '30_이마트'): 5.5,
+ ('48_오이도중앙로입구', '31_중앙도서관'): 5.2,
+ ('48_오이도중앙로입구', '32_세종3차아파트'): 4.7,
+ ('48_오이도중앙로입구', '33_진로아파트'): 4.6,
+ ('48_오이도중앙로입구', '34_홈플러스'): 4.1,
+ ('48_오이도중앙로입구', '35_동국산업'): 4.3,
+ ('48_오이도중앙로입구', '36_중앙알칸'): 3.8,
+ ('48_오이도중앙로입구', '37_희망공원'): 3.4,
+ ('48_오이도중앙로입구', '38_대한통운'): 3.3,
+ ('48_오이도중앙로입구', '39_우진프라스코'): 3.4,
+ ('48_오이도중앙로입구', '40_열병합발전소'): 3.1,
+ ('48_오이도중앙로입구', '41_삼양사'): 2.7,
+ ('48_오이도중앙로입구', '42_시화염색단지입구'): 2.3,
+ ('48_오이도중앙로입구', '43_시화환경사업소'): 2.1,
+ ('48_오이도중앙로입구', '44_오이도입구'): 2.3,
+ ('48_오이도중앙로입구', '45_오이도박물관'): 1.5,
+ ('48_오이도중앙로입구', '46_함상전망대'): 0.7,
+ ('48_오이도중앙로입구', '47_오이도종합어시장'): 0.3,
+ ('48_오이도중앙로입구', '49_오이도해양단지.옥터초교입구'): 1.1,
+ ('48_오이도중앙로입구', '50_오이도차고지'): 2.1,
+ ('49_오이도해양단지.옥터초교입구', '00_오이도차고지'): 1.6,
+ ('49_오이도해양단지.옥터초교입구', '02_오이도해양단지.옥터초교입구'): 0.0,
+ ('49_오이도해양단지.옥터초교입구', '03_오이도중앙로입구'): 0.3,
+ ('49_오이도해양단지.옥터초교입구', '04_오이도종합어시장'): 0.6,
+ ('49_오이도해양단지.옥터초교입구', '05_함상전망대'): 0.9,
+ ('49_오이도해양단지.옥터초교입구', '06_오이도박물관'): 1.5,
+ ('49_오이도해양단지.옥터초교입구', '07_대부도입구'): 2.0,
+ ('49_오이도해양단지.옥터초교입구', '08_시화환경사업소'): 1.6,
+ ('49_오이도해양단지.옥터초교입구', '09_시화염색단지입구'): 1.8,
+ ('49_오이도해양단지.옥터초교입구', '10_삼양사'): 2.2,
+ ('49_오이도해양단지.옥터초교입구', '11_열병합발전소'): 2.6,
+ ('49_오이도해양단지.옥터초교입구', '12_우진플라스코'): 3.3,
+ ('49_오이도해양단지.옥터초교입구', '13_대한통운.동화산업'): 3.0,
+ ('49_오이도해양단지.옥터초교입구', '14_우석철강'): 2.9,
+ ('49_오이도해양단지.옥터초교입구', '15_파워맥스'): 3.0,
+ ('49_오이도해양단지.옥터초교입구', '16_삼화정공'): 3.3,
+ ('49_오이도해양단지.옥터초교입구', '17_홈플러스'): 3.6,
+ ('49_오이도해양단지.옥터초교입구', '18_청솔아파트'): 3.9,
+ ('49_오이도해양단지.옥터초교입구', '19_계룡1차아파트'): 4.3,
+ ('49_오이도해양단지.옥터초교입구', '20_중앙도서관'): 4.7,
+ ('49_오이도해양단지.옥터초교입구', '21_이마트'): 5.0,
+ ('49_오이도해양단지.옥터초교입구', '22_시화정형외과.이철신경외과'): 5.6,
+ ('49_오이도해양단지.옥터초교입구', '23_소방서.군서고.여성비전센터'): 5.4,
+ ('49_오이도해양단지.옥터초교입구', '24_정왕역'): 5.4,
+ ('49_오이도해양단지.옥터초교입구', '25_정왕역환승센터'): 5.6,
+ ('49_오이도해양단지.옥터초교입구', '26_소방서.군서고.여성비전센터'): 5.4,
+ ('49_오이도해양단지.옥터초교입구', '27_군서미래국제학교'): 5.8,
+ ('49_오이도해양단지.옥터초교입구', '28_시화정형외과'): 6.2,
+ ('49_오이도해양단지.옥터초교입구', '29_금강아파트'): 5.6,
+ ('49_오이도해양단지.옥터초교입구', '30_이마트'): 5.0,
+ ('49_오이도해양단지.옥터초교입구', '31_중앙도서관'): 4.7,
+ ('49_오이도해양단지.옥터초교입구', '32_세종3차아파트'): 4.2,
+ ('49_오이도해양단지.옥터초교입구', '33_진로아파트'): 4.1,
+ ('49_오이도해양단지.옥터초교입구', '34_홈플러스'): 3.6,
+ ('49_오이도해양단지.옥터초교입구', '35_동국산업'): 3.8,
+ ('49_오이도해양단지.옥터초교입구', '36_중앙알칸'): 3.3,
+ ('49_오이도해양단지.옥터초교입구', '37_희망공원'): 2.9,
+ ('49_오이도해양단지.옥터초교입구', '38_대한통운'): 2.7,
+ ('49_오이도해양단지.옥터초교입구', '39_우진프라스코'): 2.9,
+ ('49_오이도해양단지.옥터초교입구', '40_열병합발전소'): 2.6,
+ ('49_오이도해양단지.옥터초교입구', '41_삼양사'): 2.2,
+ ('49_오이도해양단지.옥터초교입구', '42_시화염색단지입구'): 1.8,
+ ('49_오이도해양단지.옥터초교입구', '43_시화환경사업소'): 1.6,
+ ('49_오이도해양단지.옥터초교입구', '44_오이도입구'): 1.8,
+ ('49_오이도해양단지.옥터초교입구', '45_오이도박물관'): 1.5,
+ ('49_오이도해양단지.옥터초교입구', '46_함상전망대'): 0.9,
+ ('49_오이도해양단지.옥터초교입구', '47_오이도종합어시장'): 0.6,
+ ('49_오이도해양단지.옥터초교입구', '48_오이도중앙로입구'): 0.3,
+ ('49_오이도해양단지.옥터초교입구', '50_오이도차고지'): 1.6,
+ ('50_오이도차고지', '00_오이도차고지'): 0.0,
+ ('50_오이도차고지', '02_오이도해양단지.옥터초교입구'): 0.9,
+ ('50_오이도차고지', '03_오이도중앙로입구'): 1.2,
+ ('50_오이도차고지', '04_오이도종합어시장'): 1.5,
+ ('50_오이도차고지', '05_함상전망대'): 1.9,
+ ('50_오이도차고지', '06_오이도박물관'): 2.5,
+ ('50_오이도차고지', '07_대부도입구'): 1.1,
+ ('50_오이도차고지', '08_시화환경사업소'): 0.7,
+ ('50_오이도차고지', '09_시화염색단지입구'): 0.9,
+ ('50_오이도차고지', '10_삼양사'): 1.3,
+ ('50_오이도차고지', '11_열병합발전소'): 1.7,
+ ('50_오이도차고지', '12_우진플라스코'): 2.3,
+ ('50_오이도차고지', '13_대한통운.동화산업'): 2.6,
+ ('50_오이도차고지', '14_우석철강'): 2.4,
+ ('50_오이도차고지', '15_파워맥스'): 3.0,
+ ('50_오이도차고지', '16_삼화정공'): 3.4,
+ ('50_오이도차고지', '17_홈플러스'): 3.6,
+ ('50_오이도차고지', '18_청솔아파트'): 4.0,
+ ('50_오이도차고지', '19_계룡1차아파트'): 4.4,
+ ('50_오이도차고지', '20_중앙도서관'): 4.8,
+ ('50_오이도차고지', '21_이마트'): 5.0,
+ ('50_오이도차고지', '22_시화정형외과.이철신경외과'): 5.7,
+ ('50_오이도차고지', '23_소방서.군서고.여성비전센터'): 5.4,
+ ('50_오이도차고지', '24_정왕역'): 5.5,
+ ('50_오이도차고지', '25_정왕역환승센터'): 5.7,
+ ('50_오이도차고지', '26_소방서.군서고.여성비전센터'): 5.4,
+ ('50_오이도차고지', '27_군서미래국제학교'): 5.9,
+ ('50_오이도차고지', '28_시화정형외과'): 6.3,
+ ('50_오이도차고지', '29_금강아파트'): 5.6,
+ ('50_오이도차고지', '30_이마트'): 5.0,
+ ('50_오이도차고지', '31_중앙도서관'): 4.8,
+ ('50_오이도차고지', '32_세종3차아파트'): 4.2,
+ ('50_오이도차고지', '33_진로아파트'): 4.2,
+ ('50_오이도차고지', '34_홈플러스'): 3.6,
+ ('50_오이도차고지', '35_동국산업'): 3.9,
+ ('50_오이도차고지', '36_중앙알칸'): 3.4,
+ ('50_오이도차고지', '37_희망공원'): 2.9,
+ ('50_오이도차고지', '38_대한통운'): 2.2,
+ ('50_오이도차고지', '39_우진프라스코'): 2.4,
+ ('50_오이도차고지', '40_열병합발전소'): 1.7,
+ ('50_오이도차고지', '41_삼양사'): 1.3,
+ ('50_오이도차고지', '42_시화염색단지입구'): 0.9,
+ ('50_오이도차고지', '43_시화환경사업소'): 0.7,
+ ('50_오이도차고지', '44_오이도입구'): 0.9,
+ ('50_오이도차고지', '45_오이도박물관'): 2.5,
+ ('50_오이도차고지', '46_함상전망대'): 1.9,
+ ('50_오이도차고지', '47_오이도종합어시장'): 1.5,
+ ('50_오이도차고지', '48_오이도중앙로입구'): 1.2,
+ ('50_오이도차고지', '49_오이도해양단지.옥터초교입구'): 0.9}
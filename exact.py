@@ -0,0 +1,115 @@
+import time
+
+import numpy as np
+
+from precedence import instance_stops
+from routing import RouteResult, prepare_instance, route_totals, print_summary, solution_stats
+
+# 정류장 수가 이 값 이하이면 GA 대신 정확해 (상태 수 2^n * n)
+EXACT_MAX_STOPS = 10
+
+
+def held_karp(dist, graph, load_delta=None, capacity=None):
+    """승차 -> 하차 제약을 둔 Held–Karp 동적 계획법으로 최단 방문 순서 계산
+
+    dp[mask, v]: mask의 정류장을 모두 방문하고 v에서 끝나는 최단 길이.
+    v의 승차 정류장이 모두 mask에 있을 때만 v로 확장한다. GA와 같이 복귀 거리는 제외.
+    capacity를 주면 방문한 정류장 집합만으로 탑승 인원(load_delta 합)이 정해지므로
+    인원이 정원을 넘는 mask로는 확장하지 않는다 (정원을 지키는 경로가 없으면 None 반환).
+    반환값: (로컬 인덱스 경로, 길이)
+    """
+    n = len(dist)
+    if n == 1:
+        return [0], 0.0
+    bits = 1 << np.arange(n)
+    pred_mask = np.array([sum(1 << p for p in graph.preds[v]) for v in range(n)], dtype=np.int64)
+
+    full = (1 << n) - 1
+    if capacity is None:
+        within_capacity = np.ones(full + 1, dtype=bool)
+    else:
+        visited = (np.arange(full + 1)[:, None] >> np.arange(n)) & 1
+        within_capacity = visited @ np.asarray(load_delta) <= capacity
+    dp = np.full((full + 1, n), np.inf)
+    parent = np.full((full + 1, n), -1, dtype=np.int8)
+    starts = np.flatnonzero((pred_mask == 0) & within_capacity[bits])
+    dp[bits[starts], starts] = 0.0
+
+    for mask in range(1, full):
+        row = dp[mask]
+        if not np.isfinite(row).any():
+            continue
+        allowed = ((bits & mask) == 0) & ((pred_mask & ~mask) == 0) & within_capacity[mask | bits]
+        if not allowed.any():
+            continue
+        targets = np.flatnonzero(allowed)
+        via = row[:, None] + dist[:, targets]
+        best_from = np.argmin(via, axis=0)
+        cost = via[best_from, np.arange(len(targets))]
+        next_masks = mask | bits[targets]
+        better = cost < dp[next_masks, targets]
+        dp[next_masks[better], targets[better]] = cost[better]
+        parent[next_masks[better], targets[better]] = best_from[better]
+
+    last = int(np.argmin(dp[full]))
+    length = float(dp[full, last])
+    if not np.isfinite(length):
+        return None
+    route, mask = [], full
+    while last >= 0:
+        route.append(last)
+        prev = int(parent[mask, last])
+        mask ^= 1 << last
+        last = prev
+    return route[::-1], length
+
+
+class ExactSolver:
+    """held_karp를 다른 솔버와 같은 solve(pairs) 형태로 감싼 것 (정류장이 max_stops보다 많으면 ValueError)"""
+
+    def __init__(self, max_stops=16, seed=None, verbose=False, capacity=None):
+        self.max_stops = max_stops
+        self.seed = seed  # 결정적 알고리즘이라 쓰지 않음 (솔버 공통 인자)
+        self.verbose = verbose
+        self.capacity = capacity
+
+    def solve(self, pairs, memo=None, seed_routes=None, load_deltas=None):
+        # 시작 경로가 필요 없는 정확해 솔버라 seed_routes는 무시
+        n_stops = len(instance_stops(pairs))
+        if n_stops > self.max_stops:
+            raise ValueError(f"정류장 {n_stops}개는 정확해 솔버로 풀기에 너무 많습니다 (최대 {self.max_stops}개).")
+        return solve_exact(pairs, self.verbose, load_deltas, self.capacity)
+
+
+def solve_if_small(solver, pairs, load_deltas=None):
+    """GA/SA/ALNS 공통: 정류장 수가 solver.exact_threshold 이하이면 solve_exact 결과, 아니면 None"""
+    if solver.exact_threshold is not None and len(instance_stops(pairs)) <= solver.exact_threshold:
+        return solve_exact(pairs, solver.verbose, load_deltas, solver.capacity)
+    return None
+
+
+def solve_exact(pairs, verbose=False, load_deltas=None, capacity=None):
+    """작은 인스턴스의 최적 경로를 run_ga와 같은 RouteResult 형태로 반환 (stop_reason="exact")
+
+    capacity를 지키는 경로가 없으면 정원 제약 없이 푼 최단 경로를 반환한다 (stats의 capacity_overload > 0).
+    """
+    started = time.perf_counter()
+    stops, engine, graph = prepare_instance(pairs, load_deltas, capacity)
+    solution = held_karp(engine.dist, graph, engine.load_delta, capacity)
+    if solution is None:
+        solution = held_karp(engine.dist, graph)
+    order, length = solution
+    best = [stops[i] for i in order]
+    stats = {
+        "evaluations": 0,
+        "states": (1 << len(stops)) * len(stops),
+        "elapsed_ms": (time.perf_counter() - started) * 1000,
+        **solution_stats(engine, order, length),  # 최적해이므로 하한 = 길이, gap = 0
+    }
+    total_distance, total_minutes = route_totals(best, verbose)
+    fitness_with_return = [length + float(engine.ret[order[-1]])]
+    result = RouteResult(best, fitness_with_return, total_distance, total_minutes, stats, "exact",
+                         fitness_with_return[:])
+    if verbose:
+        print_summary(result, label="DP")
+    return result
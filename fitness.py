@@ -0,0 +1,132 @@
+import numpy as np
+from utils import get_distance_matrix, get_stop_registry
+
+DEPOT = "00_오이도차고지"
+
+
+def encode_instance(stops, depot=DEPOT):
+    """정류장 목록을 GA 내부용 로컬 거리 행렬로 변환
+
+    반환값: (로컬 거리 행렬 dist[i, j], 각 정류장에서 차고지까지 복귀 거리 ret[i])
+    로컬 인덱스 i는 stops[i]를 가리킨다.
+    """
+    ids = get_stop_registry().encode(stops)
+    matrix = get_distance_matrix()
+    dist = np.asarray(matrix[np.ix_(ids, ids)], dtype=np.float64)
+    ret = np.asarray(matrix[ids, get_stop_registry().index(depot)], dtype=np.float64)
+    return dist, ret
+
+
+def route_lengths(dist, population):
+    """(pop_size, n_stops) 정수 배열의 모든 경로 길이를 한 번에 계산"""
+    return dist[population[:, :-1], population[:, 1:]].sum(axis=1)
+
+
+class FitnessEngine:
+    """인스턴스별 로컬 거리 행렬을 들고 개체군을 세대당 한 번만 평가
+
+    evaluate_missing()이 경로 길이와 복귀 포함 길이를 같은 패스에서 함께 돌려주므로
+    정렬, 엘리트 선택, 기록, 최종 선택이 모두 이 결과를 재사용한다.
+
+    capacity를 주면 정류장별 탑승 인원 변화(load_deltas: 정류장 -> +승차 -하차)의 누적합으로
+    경로를 따라가며 탑승 인원을 구하고, 정원을 넘은 인원 1명·정류장 1곳당 capacity_penalty km를 벌점으로 준다.
+    """
+
+    def __init__(self, stops, depot=DEPOT, load_deltas=None, capacity=None, capacity_penalty=10.0):
+        self.stops = stops
+        self.ids = get_stop_registry().encode(stops)  # 로컬 인덱스 -> 전역 정류장 인덱스
+        self.dist, self.ret = encode_instance(stops, depot)
+        self.evaluations = 0
+        self.capacity = capacity
+        self.capacity_penalty = capacity_penalty
+        load_deltas = load_deltas or {}
+        self.load_delta = np.array([load_deltas.get(s, 0) for s in stops], dtype=np.int64)
+
+    def evaluate_missing(self, population, lengths):
+        """lengths가 NaN인 개체(교차로 새로 만든 자식)만 전체 평가하고 나머지는 캐시 값을 사용"""
+        missing = np.isnan(lengths)
+        if missing.any():
+            lengths[missing] = route_lengths(self.dist, population[missing])
+            self.evaluations += int(missing.sum())
+        return lengths, lengths + self.ret[population[:, -1]]
+
+    def overload(self, population):
+        """개체별 정원 초과 인원 합 (경로 위 모든 정류장에서 정원을 넘은 인원)"""
+        if self.capacity is None:
+            return np.zeros(len(population))
+        load = np.cumsum(self.load_delta[population], axis=1)
+        return np.maximum(load - self.capacity, 0).sum(axis=1)
+
+    def penalty(self, population):
+        # 적합도에 더할 정원 초과 벌점 (km)
+        return self.capacity_penalty * self.overload(population)
+
+    def lower_bound(self):
+        """경로 길이(복귀 제외)의 하한
+
+        시작 정류장을 뺀 모든 정류장은 한 번씩 들어오는 구간이, 마지막 정류장을 뺀 모든 정류장은
+        한 번씩 나가는 구간이 있으므로 최소 진입/진출 구간 합 중 큰 쪽을 쓴다.
+        """
+        n = len(self.stops)
+        if n < 2:
+            return 0.0
+        off_diagonal = np.where(np.eye(n, dtype=bool), np.inf, self.dist)
+        incoming = off_diagonal.min(axis=0)
+        outgoing = off_diagonal.min(axis=1)
+        return float(max(incoming.sum() - incoming.max(), outgoing.sum() - outgoing.max()))
+
+    def swap_delta(self, route, i, j):
+        return swap_delta(self.dist, route, i, j)
+
+    def relocate_delta(self, route, i, j):
+        return relocate_delta(self.dist, route, i, j)
+
+
+def swap_delta(dist, route, i, j):
+    """route[i], route[j]를 바꿨을 때 경로 길이 변화량 (영향받는 최대 4개 구간만 계산)"""
+    if i > j:
+        i, j = j, i
+    a, b = route[i], route[j]
+    last = len(route) - 1
+
+    def swapped(k):
+        return b if k == i else a if k == j else route[k]
+
+    delta = 0.0
+    for k in {i - 1, i, j - 1, j}:
+        if 0 <= k < last:
+            delta += dist[swapped(k), swapped(k + 1)] - dist[route[k], route[k + 1]]
+    return delta
+
+
+def relocate_delta(dist, route, i, j):
+    """route[i]를 빼서 최종 위치 j에 넣었을 때(seq.insert(j, seq.pop(i))) 경로 길이 변화량 (최대 6개 구간)"""
+    if i == j:
+        return 0.0
+    last = len(route) - 1
+    x = route[i]
+    delta = 0.0
+
+    # 제거: prev -> x -> nxt 를 prev -> nxt 로
+    prev = route[i - 1] if i > 0 else None
+    nxt = route[i + 1] if i < last else None
+    if prev is not None:
+        delta -= dist[prev, x]
+    if nxt is not None:
+        delta -= dist[x, nxt]
+    if prev is not None and nxt is not None:
+        delta += dist[prev, nxt]
+
+    # 삽입: x를 뺀 경로의 before -> after 사이에 x
+    def reduced(k):
+        return route[k] if k < i else route[k + 1]
+
+    before = reduced(j - 1) if j > 0 else None
+    after = reduced(j) if j < last else None
+    if before is not None and after is not None:
+        delta -= dist[before, after]
+    if before is not None:
+        delta += dist[before, x]
+    if after is not None:
+        delta += dist[x, after]
+    return delta
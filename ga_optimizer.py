@@ -1,135 +1,545 @@
 import random
-from statistics import mean, stdev
-from utils import get_distance_between
+import time
+import numpy as np
+from collections import OrderedDict
+from utils import get_stop_registry, get_distance_matrix
+from local_search import local_search as polish_route, project_route
+from exact import EXACT_MAX_STOPS, solve_if_small
+from precedence import PrecedenceGraph, instance_stops
+from routing import RouteResult, optimality_gap, prepare_instance, route_totals, print_summary, solution_stats
 
 # ---------------------------
 # Helper Functions
 # ---------------------------
 def generate_valid_sequence(pairs):
-    seen = set()
-    pickups = []
-    for p, _ in pairs:
-        if p not in seen:
-            pickups.append(p)
-            seen.add(p)
-    dropoffs = []
-    for _, d in pairs:
-        if d not in seen:
-            dropoffs.append(d)
-            seen.add(d)
-    sequence = pickups.copy()
-    remaining = dropoffs.copy()
-    random.shuffle(remaining)
-    for drop in remaining:
-        idx = random.randint(0, len(sequence))
-        while sequence.index([p for p, d in pairs if d == drop][0]) >= idx:
-            idx += 1
-        sequence.insert(idx, drop)
-    return sequence
+    # 승차 정류장이 하차 정류장보다 먼저 오는 무작위 방문 순서 (정류장 이름 리스트)
+    graph = PrecedenceGraph(instance_stops(pairs), pairs)
+    return [graph.stops[i] for i in graph.random_route()]
 
 def evaluate_sequence(seq):
-    seen = set()
-    unique_seq = []
-    for stop in seq:
-        if stop not in seen:
-            unique_seq.append(stop)
-            seen.add(stop)
-    seq = unique_seq
-    total = 0
-    for i in range(len(seq) - 1):
-        dist = get_distance_between(seq[i], seq[i+1])
-        total += dist if dist else 0
-    return total
-
-def initialize_population(pairs, size=50):
-    return [generate_valid_sequence(pairs) for _ in range(size)]
-
-def crossover(parent1, parent2):
+    # 중복 정류장 제거 후 인덱스 배열로 변환해 거리 행렬에서 한 번에 조회
+    ids = get_stop_registry().encode(dict.fromkeys(seq))
+    return float(get_distance_matrix()[ids[:-1], ids[1:]].sum())
+
+def initialize_population(pairs, size=50, graph=None, rng=random):
+    # 제약 그래프는 한 번만 만들고 개체마다 O(n)으로 생성 (로컬 인덱스 리스트)
+    graph = graph or PrecedenceGraph(instance_stops(pairs), pairs)
+    return [graph.random_route(rng) for _ in range(size)]
+
+# ---------------------------
+# Crossover Operators
+# ---------------------------
+# 모두 O(n) (집합/위치 배열 사용), graph를 주면 같은 호출 안에서 선후 제약 위반을 복구
+def crossover(parent1, parent2, graph=None, rng=random):
+    # 1점 순서 교차: parent1 앞부분 + 나머지는 parent2 순서대로
     if len(parent1) < 3:
         return parent1[:]  # 너무 짧으면 복사만
-    cut = random.randint(1, len(parent1) - 2)
+    cut = rng.randint(1, len(parent1) - 2)
     head = parent1[:cut]
-    tail = [x for x in parent2 if x not in head]
-    return head + tail
+    in_head = set(head)
+    child = head + [x for x in parent2 if x not in in_head]
+    return graph.repair(child) if graph else child
+
+def order_crossover(parent1, parent2, graph=None, rng=random):
+    # OX: parent1의 [i, j) 구간을 그대로 두고, j부터 원형으로 parent2 순서대로 빈 자리를 채움
+    n = len(parent1)
+    if n < 3:
+        return parent1[:]
+    i, j = sorted(rng.sample(range(n + 1), 2))
+    segment = set(parent1[i:j])
+    fill = [parent2[(j + k) % n] for k in range(n)]
+    fill = [x for x in fill if x not in segment]
+    child = [None] * n
+    child[i:j] = parent1[i:j]
+    for k, x in zip(range(n - (j - i)), fill):
+        child[(j + k) % n] = x
+    return graph.repair(child) if graph else child
+
+def pmx_crossover(parent1, parent2, graph=None, rng=random):
+    # PMX: parent1의 [i, j) 구간을 두고, 나머지 자리는 parent2 값을 구간 매핑으로 따라가며 채움
+    n = len(parent1)
+    if n < 3:
+        return parent1[:]
+    i, j = sorted(rng.sample(range(n + 1), 2))
+    pos1 = {x: k for k, x in enumerate(parent1)}
+    child = parent2[:]
+    child[i:j] = parent1[i:j]
+    for k in list(range(i)) + list(range(j, n)):
+        x = parent2[k]
+        while i <= pos1[x] < j:
+            x = parent2[pos1[x]]
+        child[k] = x
+    return graph.repair(child) if graph else child
+
+CROSSOVERS = {
+    "onepoint": crossover,
+    "ox": order_crossover,
+    "pmx": pmx_crossover,
+}
 
 
-def mutate(seq, pickup_set):
-    idx1, idx2 = random.sample(range(len(seq)), 2)
+def pick_swap(seq, pickup_set, graph=None, rng=random):
+    # 승차 정류장이 아닌 두 유전자 위치를 고름 (조건이 안 맞거나 선후 제약을 깨면 None)
+    idx1, idx2 = sorted(rng.sample(range(len(seq)), 2))
     if seq[idx1] not in pickup_set and seq[idx2] not in pickup_set:
-        seq[idx1], seq[idx2] = seq[idx2], seq[idx1]
+        # 하차 전용 정류장은 뒤로 가는 건 항상 가능, 앞으로 오는 쪽만 확인
+        if graph is None or graph.allows_at(seq, seq[idx2], idx1):
+            return idx1, idx2
+    return None
+
+def apply_swap(seq, idx1, idx2):
+    seq[idx1], seq[idx2] = seq[idx2], seq[idx1]
+
+def pick_relocation(seq, pickup_set, graph=None, rng=random):
+    # 승차 정류장이 아닌 유전자 하나를 다른 위치로 옮김 (조건이 안 맞거나 선후 제약을 깨면 None)
+    idx, target = rng.sample(range(len(seq)), 2)
+    if seq[idx] not in pickup_set:
+        if graph is None or target > idx or graph.allows_at(seq, seq[idx], target):
+            return idx, target
+    return None
+
+def apply_relocation(seq, idx, target):
+    seq.insert(target, seq.pop(idx))
+
+# 변이 이름 -> (위치 선택, 적용, 길이 변화량 계산)
+MUTATIONS = {
+    "swap": (pick_swap, apply_swap, "swap_delta"),
+    "relocate": (pick_relocation, apply_relocation, "relocate_delta"),
+}
+
+def mutate(seq, pickup_set, kind="swap", graph=None, rng=random):
+    pick, apply, _ = MUTATIONS[kind]
+    move = pick(seq, pickup_set, graph, rng)
+    if move:
+        apply(seq, *move)
     return seq
 
+class FitnessMemo:
+    """경로(전역 정류장 인덱스 튜플) -> 경로 길이 LRU 캐시
+
+    엘리트 복사나 교차로 똑같이 재생성된 자식을 다시 평가하지 않도록 한다.
+    여러 run_ga 호출에 같은 인스턴스를 넘기면 시간대 사이에도 공유된다.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, key):
+        length = self._cache.get(key)
+        if length is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        return length
+
+    def put(self, key, length):
+        self._cache[key] = length
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def evaluate(self, engine, population, lengths):
+        # 길이를 모르는(NaN) 개체만 캐시 조회, 미스만 한 번에 평가 후 저장
+        pending = {}
+        for idx in np.flatnonzero(np.isnan(lengths)):
+            key = tuple(engine.ids[population[idx]].tolist())
+            cached = self.get(key)
+            if cached is None:
+                pending[idx] = key
+            else:
+                lengths[idx] = cached
+        scores, with_return = engine.evaluate_missing(population, lengths)
+        for idx, key in pending.items():
+            self.put(key, float(scores[idx]))
+        return scores, with_return
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "memo_hits": self.hits,
+            "memo_misses": self.misses,
+            "memo_size": len(self._cache),
+            "memo_hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
 # ---------------------------
 # Main GA Function
 # ---------------------------
-total_distance_across_runs = 0
-total_time_across_runs = 0
+class _Evolution:
+    """한 개체군의 GA 진화 상태 (run_ga와 섬 모델 워커가 공유)"""
+
+    def __init__(self, pairs, pop_size=50, crossover_rate=1.0, mutation="swap", crossover_op="onepoint",
+                 memo=None, rng=None, population=None, local_search=0, seed_routes=None,
+                 capacity=None, capacity_penalty=10.0, load_deltas=None, lengths=None, instance=None):
+        # 염색체는 고유 정류장의 로컬 인덱스 배열, 개체군은 (pop_size, n_stops) 정수 배열
+        # instance: 미리 만든 (정류장, FitnessEngine, PrecedenceGraph) (섬 모델 워커가 재사용)
+        if instance is None:
+            instance = prepare_instance(pairs, load_deltas, capacity, capacity_penalty)
+        self.stops, self.engine, self.graph = instance
+        self.pickup_set = set(np.flatnonzero(self.graph.is_pickup).tolist())
+        self.cross = CROSSOVERS[crossover_op]
+        self.pick_move, self.apply_move, delta_name = MUTATIONS[mutation]
+        self.move_delta = getattr(self.engine, delta_name)
+        self.pop_size = pop_size
+        self.crossover_rate = crossover_rate
+        self.memo = memo
+        self.rng = rng or random.Random()
+        self.local_search = local_search
+        self.local_search_moves = 0
+        self._polished = set()  # 이미 국소 최적인 경로는 다시 탐색하지 않음
+        self.history = []
+        self.fitness_with_return = []
 
-def run_ga(pairs, generations=100, pop_size=50, verbose=True, plot=False):
-    global total_distance_across_runs, total_time_across_runs
+        if population is None:
+            # 시작 경로(이전 시간대 최적 경로 등)를 현재 정류장 집합에 투영해 넣고 나머지는 무작위
+            seeds = [project_route(r, self.stops, self.engine.dist, self.graph) for r in seed_routes or ()]
+            seeds = list({tuple(s): s for s in seeds}.values())[:pop_size]
+            population = np.array(seeds + initialize_population(pairs, pop_size - len(seeds), self.graph, self.rng))
+        self.population = population
+        # 개체군마다 경로 길이/복귀 포함 길이를 한 번만 계산해 정렬·엘리트·기록·최종 선택에 재사용
+        # lengths는 순수 경로 길이(변이 변화량 누적용), scores는 정원 초과 벌점을 더한 적합도
+        # lengths를 주면(섬 모델의 이전 주기 결과) 아는 길이는 그대로 쓰고 NaN인 개체만 평가
+        lengths = np.full(len(population), np.nan) if lengths is None else np.array(lengths, dtype=np.float64)
+        self.scores, self.with_return = self.evaluate(population, lengths)
+        if self.local_search:
+            self.polish_elites()
 
-    population = initialize_population(pairs, pop_size)
-    pickup_set = set([p for p, _ in pairs])
-    fitness_history = []
-    fitness_with_return = []
+    def evaluate(self, population, lengths):
+        if self.memo is None:
+            lengths, with_return = self.engine.evaluate_missing(population, lengths)
+        else:
+            lengths, with_return = self.memo.evaluate(self.engine, population, lengths)
+        self.lengths = lengths
+        if self.engine.capacity is None:
+            return lengths, with_return
+        return lengths + self.engine.penalty(population), with_return
 
-    for gen in range(generations):
-        scored = [(evaluate_sequence(ind), ind) for ind in population]
-        scored.sort(key=lambda x: x[0])
-        best_score, best_seq = scored[0]
+    def polish_elites(self):
+        # 메메틱 단계: 상위 local_search개 개체에 2-opt / Or-opt 지역 탐색 적용
+        order = np.argsort(self.scores, kind="stable")[:self.local_search]
+        for idx in order:
+            key = self.population[idx].tobytes()
+            if key in self._polished:
+                continue
+            route, delta, moves = polish_route(self.population[idx], self.engine.dist, self.graph)
+            # 지역 탐색은 거리만 보므로 정원 벌점까지 더해 실제로 나아질 때만 교체
+            length = self.lengths[idx] + delta
+            score = length + self.engine.penalty(route[None])[0] if self.engine.capacity is not None else length
+            if moves and score < self.scores[idx]:
+                self.population[idx] = route
+                self.lengths[idx] = length
+                self.scores[idx] = score
+                self.with_return[idx] = length + self.engine.ret[route[-1]]
+                self.local_search_moves += moves
+            self._polished.add(self.population[idx].tobytes())
 
-        # 복귀 거리 포함한 총 거리
-        return_dist = get_distance_between(best_seq[-1], "00_오이도차고지") or 0
-        fitness_with_return = [evaluate_sequence(path) + get_distance_between(path[-1], "00_오이도차고지") for path in population]
+    def step(self):
+        rng, population, scores = self.rng, self.population, self.scores
+        order = np.argsort(scores, kind="stable")
+        best_seq = population[order[0]]
 
-        fitness_history.append(best_score)
+        # 복귀 거리 포함한 총 거리 (개체별), 수렴 기록은 최적 개체의 적합도 + 복귀 거리
+        self.fitness_with_return = self.with_return.tolist()
+        self.history.append(float(scores[order[0]] + self.engine.ret[best_seq[-1]]))
 
+        parents = order[:20].tolist()
         next_gen = [best_seq]  # elitism
-        while len(next_gen) < pop_size:
-            p1, p2 = random.sample(scored[:20], 2)
-            child = crossover(p1[1], p2[1])
-            child = mutate(child, pickup_set)
+        # 자식의 경로 길이: 교차로 새로 만든 자식만 NaN(전체 평가), 복사된 자식은 부모 길이 + 변이 변화량
+        next_lengths = [self.lengths[order[0]]]
+        while len(next_gen) < self.pop_size:
+            i1, i2 = rng.sample(parents, 2)
+            parent = population[i1].tolist()
+            if len(parent) < 3 or (self.crossover_rate < 1 and rng.random() >= self.crossover_rate):
+                child, length = parent, self.lengths[i1]
+            else:
+                child, length = self.cross(parent, population[i2].tolist(), self.graph, rng), None
+            move = self.pick_move(child, self.pickup_set, self.graph, rng)
+            if move:
+                if length is not None:
+                    length += self.move_delta(child, *move)
+                self.apply_move(child, *move)
             next_gen.append(child)
+            next_lengths.append(np.nan if length is None else length)
+
+        self.population = np.array(next_gen)
+        self.scores, self.with_return = self.evaluate(self.population, np.array(next_lengths, dtype=np.float64))
+        if self.local_search:
+            self.polish_elites()
+
+    def best_route(self):
+        return [self.stops[i] for i in self.population[np.argmin(self.scores)]]
+
+
+class GASolver:
+    """GA 설정을 담은 솔버 객체
+
+    solve()는 호출마다 자체 난수 생성기·개체군·캐시를 새로 만들기 때문에 모듈 전역 상태가 없고,
+    여러 스레드/시뮬레이션에서 같은 프로세스로 동시에 호출해도 결과가 섞이지 않는다.
+
+    anytime 모드: generations는 상한이고, 다음 중 하나라도 만족하면 그 세대까지의 최적 경로로 종료한다.
+      deadline_ms       - 경과 시간(ms)이 이 값을 넘으면
+      stall_generations - 최적 거리가 이 세대 수 동안 개선되지 않으면
+      target_gap        - (최적 거리 - 하한) / 최적 거리 가 이 값 이하이면
+
+    local_search=k 이면 매 세대 상위 k개 개체를 2-opt / Or-opt로 다듬는다 (메메틱 GA).
+    고유 정류장 수가 exact_threshold 이하이면 GA 대신 Held–Karp DP로 최적해를 구한다 (None이면 항상 GA).
+    capacity를 주면 경로를 따라 탑승 인원이 정원을 넘는 만큼 capacity_penalty km씩 벌점을 준다
+    (정류장별 인원 변화는 solve의 load_deltas, 없으면 쌍마다 1명으로 계산).
+    """
+
+    def __init__(self, generations=100, pop_size=50, crossover_rate=1.0, mutation="swap",
+                 crossover_op="onepoint", memo_size=None, seed=None, verbose=False,
+                 deadline_ms=None, stall_generations=None, target_gap=None, local_search=0,
+                 exact_threshold=EXACT_MAX_STOPS, capacity=None, capacity_penalty=10.0):
+        self.generations = generations
+        self.pop_size = pop_size
+        self.crossover_rate = crossover_rate
+        self.mutation = mutation
+        self.crossover_op = crossover_op
+        self.memo_size = memo_size
+        self.seed = seed
+        self.verbose = verbose
+        self.deadline_ms = deadline_ms
+        self.stall_generations = stall_generations
+        self.target_gap = target_gap
+        self.local_search = local_search
+        self.exact_threshold = exact_threshold
+        self.capacity = capacity
+        self.capacity_penalty = capacity_penalty
+
+    def solve(self, pairs, memo=None, seed_routes=None, load_deltas=None):
+        small = solve_if_small(self, pairs, load_deltas)
+        if small is not None:
+            return small
+
+        # seed가 None이면 OS 엔트로피로 초기화한 전용 난수 생성기
+        rng = random.Random(self.seed)
+        if memo is None and self.memo_size:
+            memo = FitnessMemo(self.memo_size)
+        started = time.perf_counter()
+        evolution = _Evolution(pairs, self.pop_size, self.crossover_rate, self.mutation, self.crossover_op, memo, rng,
+                               local_search=self.local_search, seed_routes=seed_routes, capacity=self.capacity,
+                               capacity_penalty=self.capacity_penalty, load_deltas=load_deltas)
+        lower_bound = evolution.engine.lower_bound()
+        best_score = float("inf")
+        stalled = 0
+        stop_reason = "generations"
+        generations_run = 0
+        for gen in range(self.generations):
+            evolution.step()
+            generations_run += 1
+
+            best_idx = int(np.argmin(evolution.scores))
+            score = float(evolution.scores[best_idx])
+            if score < best_score - 1e-9:
+                best_score, stalled = score, 0
+            else:
+                stalled += 1
+            # gap은 다른 솔버와 같이 정원 벌점을 뺀 순수 경로 길이 기준
+            length = float(evolution.lengths[best_idx])
+            if self.target_gap is not None and optimality_gap(length, lower_bound) <= self.target_gap:
+                stop_reason = "target_gap"
+                break
+            if self.stall_generations and stalled >= self.stall_generations:
+                stop_reason = "stalled"
+                break
+            if self.deadline_ms is not None and (time.perf_counter() - started) * 1000 >= self.deadline_ms:
+                stop_reason = "deadline"
+                break
+
+        # 엘리트 보존으로 현재 개체군의 최적 개체가 곧 지금까지의 최적 경로
+        best = evolution.best_route()
+        stats = {
+            "evaluations": evolution.engine.evaluations,
+            "generations_run": generations_run,
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            **solution_stats(evolution.engine, evolution.population[np.argmin(evolution.scores)], lower_bound),
+        }
+        if self.local_search:
+            stats["local_search_moves"] = evolution.local_search_moves
+        if memo is not None:
+            stats.update(memo.stats())
+        total_distance, total_minutes = route_totals(best, self.verbose)
+        result = RouteResult(best, evolution.fitness_with_return, total_distance, total_minutes, stats, stop_reason,
+                             evolution.history)
+        if self.verbose:
+            print_summary(result)
+        return result
+
+
+def run_ga(pairs, generations=100, pop_size=50, verbose=True, plot=False,
+           crossover_rate=1.0, mutation="swap", memo_size=None, memo=None, crossover_op="onepoint",
+           seed=None, deadline_ms=None, stall_generations=None, target_gap=None, local_search=0,
+           exact_threshold=EXACT_MAX_STOPS, seed_routes=None, capacity=None, capacity_penalty=10.0,
+           load_deltas=None):
+    """GASolver 한 번 실행의 간편 함수 (RouteResult 반환)
+
+    seed_routes: 초기 개체군에 넣을 시작 경로들 (정류장 이름 리스트, 현재 정류장 집합에 맞게 투영됨)
+    load_deltas: 정류장 -> 탑승 인원 변화 (capacity 검사용, Demand.load_deltas())
+    """
+    solver = GASolver(generations, pop_size, crossover_rate, mutation, crossover_op, memo_size, seed, verbose,
+                      deadline_ms, stall_generations, target_gap, local_search, exact_threshold,
+                      capacity, capacity_penalty)
+    return solver.solve(pairs, memo, seed_routes, load_deltas)
+
+
+# ---------------------------
+# Island Model (process pool)
+# ---------------------------
+_island_worker = None  # 워커 프로세스마다 한 번만 만드는 (pairs, (정류장, FitnessEngine, PrecedenceGraph), FitnessMemo)
+
+
+def _init_island_worker(pairs, load_deltas, capacity, capacity_penalty, memo_size):
+    # 인스턴스(로컬 거리 행렬, 제약 그래프)와 적합도 캐시는 이주 주기마다가 아니라 워커당 한 번만 만든다
+    global _island_worker
+    instance = prepare_instance(pairs, load_deltas, capacity, capacity_penalty)
+    _island_worker = (pairs, instance, FitnessMemo(memo_size) if memo_size else None)
+
+
+def _evolve_island(options, population, lengths, rng_state, seed_routes, generations):
+    # 워커 프로세스에서 섬 하나를 generations 세대 진화시킴
+    # 거리 행렬은 각 프로세스가 같은 캐시 파일을 mmap으로 읽어 읽기 전용으로 공유
+    # 이미 아는 경로 길이(lengths)를 넘겨받아 이주로 들어온 개체까지 다시 평가하지 않는다
+    pairs, instance, memo = _island_worker
+    engine = instance[1]
+    evaluations = engine.evaluations
+    hits, misses = (memo.hits, memo.misses) if memo is not None else (0, 0)
+    rng = random.Random()
+    rng.setstate(rng_state)
+    evolution = _Evolution(pairs, rng=rng, population=population, lengths=lengths, instance=instance, memo=memo,
+                           seed_routes=seed_routes, **options)
+    for _ in range(generations):
+        evolution.step()
+    memo_counts = (memo.hits - hits, memo.misses - misses) if memo is not None else (0, 0)
+    return (evolution.population, evolution.scores, evolution.lengths.copy(), evolution.with_return.tolist(),
+            evolution.history, engine.evaluations - evaluations, memo_counts, rng.getstate())
+
+
+def _run_island_epoch(args):
+    return _evolve_island(*args)
+
+
+def run_island_ga(pairs, islands=4, generations=100, pop_size=50, migration_interval=10, migrants=2,
+                  workers=None, seed=None, verbose=True, seed_routes=None, load_deltas=None, **options):
+    """여러 개체군(섬)을 프로세스 풀에서 독립적으로 진화시키고 migration_interval 세대마다
+    각 섬의 상위 migrants개 개체를 다음 섬(링)의 최하위 개체와 교체한다.
+
+    options는 GASolver 설정(crossover_rate, mutation, crossover_op, memo_size, deadline_ms, stall_generations,
+    target_gap, local_search, exact_threshold, capacity, capacity_penalty)이고 그 밖의 이름은 TypeError.
+    memo_size는 워커마다 따로 캐시를 두고, deadline_ms / stall_generations / target_gap은 이주 주기마다 확인한다.
+    workers=0이면 현재 프로세스에서 순서대로 실행 (결과는 같음).
+    run_ga와 같은 RouteResult를 반환하고, stats에 섬별 수렴 기록(island_history)과 최적값(island_best)이 추가된다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    solver = GASolver(generations=generations, pop_size=pop_size, seed=seed, verbose=verbose, **options)
+    small = solve_if_small(solver, pairs, load_deltas)
+    if small is not None:
+        return small
+
+    started = time.perf_counter()
+    get_distance_matrix()  # 워커가 mmap할 거리 캐시를 미리 준비
+    stops, engine, _ = prepare_instance(pairs, load_deltas, solver.capacity, solver.capacity_penalty)
+    lower_bound = engine.lower_bound()
+    island_options = {
+        "pop_size": pop_size, "crossover_rate": solver.crossover_rate, "mutation": solver.mutation,
+        "crossover_op": solver.crossover_op, "local_search": solver.local_search,
+    }
+    init_args = (pairs, load_deltas, solver.capacity, solver.capacity_penalty, solver.memo_size)
+    base = random.Random(seed)
+    states = [random.Random(base.getrandbits(64)).getstate() for _ in range(islands)]
+    populations = [None] * islands
+    lengths = [None] * islands
+    histories = [[] for _ in range(islands)]
+    evaluations = memo_hits = memo_misses = 0
+    best_score, stalled = float("inf"), 0
+    stop_reason = "generations"
+    results = []
+
+    if workers == 0:
+        executor = None
+        _init_island_worker(*init_args)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_island_worker, initargs=init_args)
+    try:
+        done = 0
+        while True:
+            # generations <= 0이어도 초기 개체군은 한 번 평가해 결과를 만든다
+            epoch = max(min(migration_interval, generations - done), 0)
+            args = [(island_options, populations[i], lengths[i], states[i], seed_routes, epoch) for i in range(islands)]
+            if executor is None:
+                results = [_run_island_epoch(a) for a in args]
+            else:
+                results = list(executor.map(_run_island_epoch, args))
+            done += epoch
+
+            for i, (population, _, island_lengths, _, history, count, (hits, misses), state) in enumerate(results):
+                populations[i], lengths[i], states[i] = population, island_lengths, state
+                histories[i].extend(history)
+                evaluations += count
+                memo_hits += hits
+                memo_misses += misses
+
+            # 종료 조건은 이주 주기 단위로 확인 (GASolver와 같은 기준)
+            winner = int(np.argmin([float(np.min(r[1])) for r in results]))
+            best_idx = int(np.argmin(results[winner][1]))
+            score = float(results[winner][1][best_idx])
+            stalled = 0 if score < best_score - 1e-9 else stalled + epoch
+            best_score = min(best_score, score)
+            if done >= generations:
+                break
+            if solver.target_gap is not None and optimality_gap(float(results[winner][2][best_idx]), lower_bound) <= solver.target_gap:
+                stop_reason = "target_gap"
+                break
+            if solver.stall_generations and stalled >= solver.stall_generations:
+                stop_reason = "stalled"
+                break
+            if solver.deadline_ms is not None and (time.perf_counter() - started) * 1000 >= solver.deadline_ms:
+                stop_reason = "deadline"
+                break
 
-        population = next_gen
-
-    best = min(population, key=evaluate_sequence)
-    best = [s for i, s in enumerate(best) if s not in best[:i]]
-
-    total_distance = 0
-    total_minutes = 0
-    for i in range(len(best) - 1):
-        dist = get_distance_between(best[i], best[i+1])
-        if dist and dist > 0:
-            minutes = int(dist * 3)
-            total_distance += dist
-            total_minutes += minutes
-            if verbose:
-                print(f"  {best[i]} -> {best[i+1]} : {dist:.2f} km / {minutes}분")
-
-    last_stop = best[-1]
-    return_to_depot = get_distance_between(last_stop, "00_오이도차고지")
-    if return_to_depot:
-        minutes_back = int(return_to_depot * 3)
-        if verbose:
-            print(f"  {last_stop} -> 00_오이도차고지 : {return_to_depot:.2f} km / {minutes_back}분 (복귀)")
-        total_distance += return_to_depot
-        total_minutes += minutes_back
-
-    total_distance_across_runs += total_distance
-    total_time_across_runs += total_minutes
+            # 링 형태 이주: 섬 i의 상위 개체가 섬 i+1의 하위 개체를 대체 (길이도 함께 옮겨 재평가 없음)
+            if islands > 1:
+                ranks = [np.argsort(results[i][1], kind="stable") for i in range(islands)]
+                emigrants = [(populations[i][ranks[i][:migrants]], lengths[i][ranks[i][:migrants]]) for i in range(islands)]
+                for i in range(islands):
+                    target = (i + 1) % islands
+                    worst = ranks[target][::-1][:migrants]
+                    populations[target] = populations[target].copy()
+                    lengths[target] = lengths[target].copy()
+                    populations[target][worst], lengths[target][worst] = emigrants[i]
+            seed_routes = None  # 시작 경로는 첫 주기의 초기 개체군에만 사용
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
+    island_best = [float(np.min(r[1])) for r in results]
+    population, scores, _, fitness_with_return = results[winner][:4]
+    best_route = population[np.argmin(scores)]
+    best = [stops[i] for i in best_route]
+    stats = {
+        "evaluations": evaluations,
+        "generations_run": done,
+        "elapsed_ms": (time.perf_counter() - started) * 1000,
+        **solution_stats(engine, best_route, lower_bound),
+        "island_best": island_best,
+        "island_history": histories,
+        "best_island": winner,
+    }
+    if solver.memo_size:
+        lookups = memo_hits + memo_misses
+        stats.update(memo_hits=memo_hits, memo_misses=memo_misses, memo_size=solver.memo_size,
+                     memo_hit_rate=memo_hits / lookups if lookups else 0.0)
+    total_distance, total_minutes = route_totals(best, verbose)
+    result = RouteResult(best, fitness_with_return, total_distance, total_minutes, stats, stop_reason,
+                         histories[winner])
     if verbose:
-        print(f"[GA] 총 이동 거리: {total_distance:.2f} km")
-        print(f"[GA] 총 예상 소요 시간: {total_minutes}분")
-        print(f"[GA 누적] 전체 시간대 총 이동 거리 합: {total_distance_across_runs:.2f} km")
-        print(f"[GA 누적] 전체 시간대 총 소요 시간 합: {total_time_across_runs}분")
-        print("[GA] 세대별 최적 거리 통계 (복귀 포함):")
-        print(f"  평균: {mean(fitness_with_return):.2f} km")
-        print(f"  표준편차: {stdev(fitness_with_return) if len(fitness_with_return) > 1 else 0:.2f} km")
-        print(f"  초기: {fitness_with_return[0]:.2f} km → 최종: {fitness_with_return[-1]:.2f} km")
-        print("[GA 최종 요약]")
-        print(f"총 누적 거리: {total_distance_across_runs:.2f} km")
-        print(f"총 누적 시간: {total_time_across_runs}분")
-
-    return best, fitness_with_return, total_distance, total_minutes
+        print_summary(result)
+    return result
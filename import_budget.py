@@ -0,0 +1,66 @@
+"""모듈 import 시간 예산 검사
+
+python -X importtime 으로 각 모듈을 새 인터프리터에서 import 해서
+누적 import 시간(ms)과 함께 불러와진 무거운 모듈, 거리 데이터 로드 여부를 확인한다.
+예산을 넘으면 종료 코드 1 (CI나 배포 전에 `python import_budget.py` 로 실행).
+"""
+import subprocess
+import sys
+
+# 모듈: (누적 import 예산 ms, import 되면 안 되는 모듈)
+# GA/시뮬레이터는 numpy 배열 연산이 핵심이라 numpy만 허용
+IMPORT_BUDGETS = {
+    "customer": (30, ("numpy", "pandas")),
+    "bus": (30, ("numpy", "pandas")),
+    "utils": (30, ("numpy", "pandas")),
+    "route": (30, ("numpy", "pandas")),
+    "parameters": (50, ("numpy", "pandas")),
+    "ga_optimizer": (400, ("pandas",)),
+    "simulator": (400, ("pandas",)),
+}
+
+# import 후 거리 데이터가 로드되지 않았는지(= 파일 I/O가 없었는지) 확인
+_PROBE = """
+import sys, {module}
+import utils, route
+loaded = [m for m in {forbidden!r} if m in sys.modules]
+if 'distance_data' in sys.modules or utils._distance_table is not None or route._distance_table is not None:
+    loaded.append('distance data')
+print(','.join(loaded))
+"""
+
+
+def measure_import_ms(module):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} import 시간을 찾지 못했습니다.")
+
+
+def unexpected_imports(module, forbidden):
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, forbidden=tuple(forbidden))],
+        capture_output=True, text=True, check=True,
+    )
+    return [m for m in proc.stdout.strip().split(",") if m]
+
+
+def check_import_budgets(budgets=IMPORT_BUDGETS):
+    failures = []
+    for module, (budget_ms, forbidden) in budgets.items():
+        elapsed = measure_import_ms(module)
+        extra = unexpected_imports(module, forbidden)
+        status = "OK" if elapsed <= budget_ms and not extra else "FAIL"
+        print(f"[{status}] {module}: {elapsed:.1f}ms / {budget_ms}ms" + (f" (불필요한 로드: {', '.join(extra)})" if extra else ""))
+        if status == "FAIL":
+            failures.append(module)
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if check_import_budgets() else 0)
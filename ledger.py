@@ -0,0 +1,47 @@
+from enum import IntEnum
+
+
+class RiderState(IntEnum):
+    """고객 한 명의 진행 상태"""
+    SCHEDULED = 0  # 아직 승차 정류장에 도착 전
+    WAITING = 1    # 정류장에서 대기 중
+    ONBOARD = 2    # 버스에 탑승
+    DELIVERED = 3  # 하차 완료
+    ABANDONED = 4  # 대기 한도 초과로 탑승 포기
+
+
+class RiderLedger:
+    """고객 ID별 상태와 시간대별 상태 인원을 함께 관리 (이벤트마다 O(1) 갱신)
+
+    운행 종료 여부(open)와 다시 돌 필요(active)를 고객 목록을 훑지 않고 인원 수로 바로 판단한다.
+    """
+
+    def __init__(self, customers):
+        self.states = {}  # 고객 ID -> RiderState
+        self.counts = {}  # 시간대 -> 상태별 인원 [SCHEDULED, WAITING, ONBOARD, DELIVERED, ABANDONED]
+        for c in customers:
+            self.states[c.customer_id] = RiderState.SCHEDULED
+            self.counts.setdefault(c.time // 60, [0] * len(RiderState))[RiderState.SCHEDULED] += 1
+
+    def __getitem__(self, customer_id):
+        return self.states[customer_id]
+
+    def move(self, customer, state):
+        counts = self.counts[customer.time // 60]
+        counts[self.states[customer.customer_id]] -= 1
+        counts[state] += 1
+        self.states[customer.customer_id] = state
+
+    def open(self, hour):
+        """hour 시간대에서 아직 하차/포기하지 않은 고객 수"""
+        counts = self.counts.get(hour)
+        if counts is None:
+            return 0
+        return counts[RiderState.SCHEDULED] + counts[RiderState.WAITING] + counts[RiderState.ONBOARD]
+
+    def active(self, hour):
+        """hour 시간대에서 정류장에 도착해 대기 중이거나 탑승 중인 고객 수"""
+        counts = self.counts.get(hour)
+        if counts is None:
+            return 0
+        return counts[RiderState.WAITING] + counts[RiderState.ONBOARD]
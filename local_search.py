@@ -0,0 +1,185 @@
+import numpy as np
+
+# 지역 탐색 (GA 엘리트 개체 다듬기용)
+# 경로는 로컬 인덱스 배열, dist는 FitnessEngine의 로컬 거리 행렬, graph는 PrecedenceGraph.
+# 두 연산 모두 이동마다 경로 전체를 다시 재지 않고 행렬 조회로 변화량만 계산한다.
+
+_EPS = 1e-9
+
+
+def _positions(route, n):
+    pos = np.empty(n, dtype=np.intp)
+    pos[route] = np.arange(len(route))
+    return pos
+
+
+def two_opt(route, dist, graph):
+    """승차 -> 하차 제약을 지키는 2-opt (구간 뒤집기), 최선 개선 이동을 더 이상 없을 때까지 반복
+
+    거리 행렬이 비대칭일 수 있으므로 정방향/역방향 누적합으로 뒤집힌 구간의 길이를 O(1)에 구한다.
+    구간 [i, j] 안에 선후 관계인 정류장 쌍이 있으면 뒤집을 수 없다.
+    반환값: (개선된 경로, 길이 변화량 합, 적용한 이동 수)
+    """
+    route = np.array(route, dtype=np.intp)
+    n = len(route)
+    total, moves = 0.0, 0
+    if n < 3:
+        return route, total, moves
+    while True:
+        fwd = np.concatenate(([0.0], np.cumsum(dist[route[:-1], route[1:]])))
+        bwd = np.concatenate(([0.0], np.cumsum(dist[route[1:], route[:-1]])))
+        pos = _positions(route, len(dist))
+        # latest[k]: route[k]의 승차 정류장 중 가장 뒤에 있는 위치 (없으면 -1)
+        latest = np.array([max((pos[p] for p in graph.preds[v]), default=-1) for v in route])
+
+        best_delta, best_move = -_EPS, None
+        for i in range(n - 1):
+            feasible = np.maximum.accumulate(latest[i + 1:]) < i
+            js = np.arange(i + 1, n)[feasible]
+            if len(js) == 0:
+                continue
+            delta = (bwd[js] - bwd[i]) - (fwd[js] - fwd[i])
+            if i > 0:
+                delta += dist[route[i - 1], route[js]] - dist[route[i - 1], route[i]]
+            inner = js < n - 1
+            after = route[js[inner] + 1]
+            delta[inner] += dist[route[i], after] - dist[route[js[inner]], after]
+            k = int(np.argmin(delta))
+            if delta[k] < best_delta:
+                best_delta, best_move = float(delta[k]), (i, int(js[k]))
+        if best_move is None:
+            return route, total, moves
+        i, j = best_move
+        route[i:j + 1] = route[i:j + 1][::-1]
+        total += best_delta
+        moves += 1
+
+
+def or_opt(route, dist, graph, max_segment=3):
+    """연속한 1~max_segment개 정류장을 순서 그대로 다른 위치로 옮기는 Or-opt
+
+    옮긴 구간의 승차 정류장은 모두 새 위치 앞에, 하차 정류장은 모두 뒤에 있어야 한다.
+    개선되는 이동을 찾으면 바로 적용하고 처음부터 다시 찾는다.
+    반환값: (개선된 경로, 길이 변화량 합, 적용한 이동 수)
+    """
+    route = np.array(route, dtype=np.intp)
+    n = len(route)
+    total, moves = 0.0, 0
+    improved = True
+    while improved:
+        improved = False
+        for length in range(1, min(max_segment, n - 1) + 1):
+            for i in range(n - length + 1):
+                move = _best_segment_move(route, dist, graph, i, length)
+                if move is not None:
+                    delta, route = move
+                    total += delta
+                    moves += 1
+                    improved = True
+                    break
+            if improved:
+                break
+    return route, total, moves
+
+
+def _best_segment_move(route, dist, graph, i, length):
+    segment = route[i:i + length]
+    rest = np.concatenate((route[:i], route[i + length:]))
+    first, last = segment[0], segment[-1]
+    m = len(rest)
+
+    # 제거 이득: prev -> segment -> next 를 prev -> next 로
+    removal = 0.0
+    if i > 0:
+        removal += dist[rest[i - 1], first]
+    if i < m:
+        removal += dist[last, rest[i]]
+    if 0 < i < m:
+        removal -= dist[rest[i - 1], rest[i]]
+
+    # 넣을 수 있는 틈 g (rest[g] 앞) 범위: 바깥 승차 정류장 뒤, 바깥 하차 정류장 앞
+    pos = _positions(rest, len(dist))
+    members = set(segment.tolist())
+    outside_preds = [pos[p] for v in members for p in graph.preds[v] if p not in members]
+    outside_succs = [pos[s] for v in members for s in graph.succs[v] if s not in members]
+    lo = max(outside_preds, default=-1) + 1
+    hi = min(outside_succs, default=m)
+
+    gaps = np.arange(lo, hi + 1)
+    gaps = gaps[gaps != i]
+    if len(gaps) == 0:
+        return None
+    delta = insertion_costs(rest, dist, first, last, gaps) - removal
+    k = int(np.argmin(delta))
+    if delta[k] >= -_EPS:
+        return None
+    g = int(gaps[k])
+    return float(delta[k]), np.concatenate((rest[:g], segment, rest[g:]))
+
+
+def insertion_costs(route, dist, first, last, gaps):
+    """first..last 구간을 route의 각 틈 g(route[g] 앞)에 넣을 때 늘어나는 길이 (gaps 배열에 대해 한 번에)"""
+    m = len(route)
+    cost = np.zeros(len(gaps))
+    has_before, has_after = gaps > 0, gaps < m
+    cost[has_before] += dist[route[gaps[has_before] - 1], first]
+    cost[has_after] += dist[last, route[gaps[has_after]]]
+    both = has_before & has_after
+    cost[both] -= dist[route[gaps[both] - 1], route[gaps[both]]]
+    return cost
+
+
+def insert_stops(partial, order, dist, graph):
+    """order의 정류장을 차례로 partial 경로에서 제약을 지키는 가장 싼 위치에 삽입
+
+    승차 정류장이 먼저 삽입되도록 order는 위상 순서여야 한다. 반환값: 로컬 인덱스 리스트
+    """
+    route = np.asarray(partial, dtype=np.intp)
+    for v in order:
+        pos = {s: k for k, s in enumerate(route.tolist())}
+        lo = max((pos[p] for p in graph.preds[v] if p in pos), default=-1) + 1
+        hi = min((pos[s] for s in graph.succs[v] if s in pos), default=len(route))
+        if lo > hi:
+            # 간접 선후 관계로 들어갈 틈이 없으면 일단 앞쪽에 두고 마지막에 복구
+            g = lo
+        else:
+            gaps = np.arange(lo, hi + 1)
+            g = int(gaps[np.argmin(insertion_costs(route, dist, v, v, gaps))])
+        route = np.concatenate((route[:g], [v], route[g:]))
+    return graph.repair(route.tolist())
+
+
+def project_route(route, stops, dist, graph):
+    """다른 인스턴스의 경로(정류장 이름)를 현재 정류장 집합에 맞춘 시작 경로로 변환
+
+    현재 인스턴스에 없는 정류장은 빼고, 남은 순서를 제약에 맞게 고친 뒤 새 정류장은 가장 싼 위치에 삽입한다.
+    """
+    index = {s: i for i, s in enumerate(stops)}
+    kept = [index[s] for s in dict.fromkeys(route) if s in index]
+    present = set(kept)
+    missing = [i for i in range(len(stops)) if i not in present]
+    return insert_stops(graph.repair(kept), graph.repair(missing), dist, graph)
+
+
+def best_seed_route(seed_routes, stops, dist, graph):
+    """시작 경로 후보들을 현재 인스턴스로 투영해 가장 짧은 것을 반환 (후보가 없으면 None)"""
+    projected = [project_route(route, stops, dist, graph) for route in seed_routes or ()]
+    if not projected:
+        return None
+    return min(projected, key=lambda r: float(dist[r[:-1], r[1:]].sum()))
+
+
+def local_search(route, dist, graph, max_segment=3):
+    """2-opt와 Or-opt를 번갈아 적용해 둘 다 개선하지 못하는 국소 최적 경로를 구함
+
+    반환값: (개선된 경로, 길이 변화량 합(음수면 짧아짐), 적용한 이동 수)
+    """
+    route = np.array(route, dtype=np.intp)
+    total, moves = 0.0, 0
+    while True:
+        route, delta_2opt, moves_2opt = two_opt(route, dist, graph)
+        route, delta_or, moves_or = or_opt(route, dist, graph, max_segment)
+        total += delta_2opt + delta_or
+        moves += moves_2opt + moves_or
+        if moves_or == 0:
+            return route, total, moves
@@ -1,11 +1,13 @@
-import heapq
-import pandas as pd
-import numpy as np
-from bus import Bus
-from utils import get_distance_between, calculate_cost
+from customer import Customer
+from utils import get_distance_between
+
+# pandas/numpy는 실제로 수요 데이터를 읽을 때만 import (모듈 import는 가볍게 유지)
 
 # 고정된 고객 목록을 반환
 def generate_daily_poisson_prediction(df, target_date, seed=42):
+    import pandas as pd
+    import numpy as np
+
     시간대들 = ['10', '11', '12', '13', '14', '15', '16']
     df['월'] = pd.to_datetime(df['일']).dt.month
     train_df = df[df['월'].between(3, 10)]
@@ -41,6 +43,8 @@ def generate_daily_poisson_prediction(df, target_date, seed=42):
     return pd.DataFrame(결과)
 
 def get_dropoff_distribution(df, 승차정류장, 시간대, 수요수):
+    import numpy as np
+
     시간컬럼 = f"{시간대}(하차)"
     try:
         index_start = df[df["정류장_ID"] == 승차정류장].index[0]
@@ -58,13 +62,9 @@ def get_dropoff_distribution(df, 승차정류장, 시간대, 수요수):
     return np.random.choice(after_df["정류장_ID"], size=수요수, p=probs)
 
 
-from customer import Customer
-from utils import get_distance_between
-import pandas as pd
-import numpy as np
-import random
-
 def load_fixed_customers():
+    import pandas as pd
+
     df_수요 = pd.read_excel("C:\\Users\\panda\\Documents\\졸작\\result\\bus_25(10-16).xlsx")[['정류장_ID', '일', '10', '11', '12', '13', '14', '15', '16']]
     df_하차비율 = pd.read_csv("C:\\Users\\panda\\Documents\\졸작\\result\\25번_정류장_승하차\\승하차정류장_ID.csv")
     시간대들 = ['10', '11', '12', '13', '14', '15', '16']
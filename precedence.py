@@ -0,0 +1,142 @@
+import heapq
+import random
+
+import numpy as np
+
+
+def instance_stops(pairs):
+    # ga_optimizer.generate_valid_sequence와 같은 순서(승차 정류장 → 하차 전용 정류장)의 고유 정류장 목록
+    return list(dict.fromkeys([p for p, _ in pairs] + [d for _, d in pairs]))
+
+
+class PrecedenceGraph:
+    """고유 정류장(로컬 인덱스) 사이의 '승차 정류장이 하차 정류장보다 먼저' 제약
+
+    stops[i]가 로컬 인덱스 i. (승차, 하차) 쌍마다 승차 -> 하차 간선을 두고,
+    한 정류장이 어떤 고객의 승차이면서 다른 고객의 하차인 경우도 같은 그래프로 처리한다.
+    서로 반대 방향 수요(A->B, B->A)처럼 순환이 생기는 간선은 한 번의 방문 순서로는
+    만족시킬 수 없으므로 제외한다 (해당 고객은 시뮬레이터의 반복 운행에서 처리).
+    """
+
+    def __init__(self, stops, pairs):
+        self.stops = list(stops)
+        index = {s: i for i, s in enumerate(self.stops)}
+        n = len(self.stops)
+        self.preds = [[] for _ in range(n)]
+        self.succs = [[] for _ in range(n)]
+        self.is_pickup = np.zeros(n, dtype=bool)
+
+        edges = []
+        seen = set()
+        for p, d in pairs:
+            a, b = index[p], index[d]
+            self.is_pickup[a] = True
+            if a == b or (a, b) in seen or self._reaches(b, a):
+                continue
+            seen.add((a, b))
+            edges.append((a, b))
+            self.succs[a].append(b)
+            self.preds[b].append(a)
+        self.src = np.fromiter((a for a, _ in edges), dtype=np.intp, count=len(edges))
+        self.dst = np.fromiter((b for _, b in edges), dtype=np.intp, count=len(edges))
+
+        # 승차 정류장 구간: 첫 등장 순서를 최대한 유지하는 위상 정렬
+        self.pickup_order = self.topological_order(np.flatnonzero(self.is_pickup).tolist())
+        pickup_pos = {s: k for k, s in enumerate(self.pickup_order)}
+        # 하차 전용 정류장: 자기 승차 정류장들 뒤에만 올 수 있으므로 들어갈 수 있는 가장 앞 틈(gap) 미리 계산
+        self.dropoff_only = np.flatnonzero(~self.is_pickup).tolist()
+        self.earliest_gap = {d: 1 + max((pickup_pos[p] for p in self.preds[d]), default=-1) for d in self.dropoff_only}
+
+    def __len__(self):
+        return len(self.stops)
+
+    def _reaches(self, start, target):
+        stack, seen = [start], {start}
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for nxt in self.succs[node]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return False
+
+    def topological_order(self, nodes, priority=None):
+        """nodes의 위상 순서 (Kahn 알고리즘, 진입 가능한 정류장 중 priority(기본: 로컬 인덱스)가 작은 것부터)"""
+        priority = priority if priority is not None else {v: v for v in nodes}
+        members = set(nodes)
+        indegree = {v: sum(1 for p in self.preds[v] if p in members) for v in nodes}
+        ready = [(priority[v], v) for v in nodes if indegree[v] == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, v = heapq.heappop(ready)
+            order.append(v)
+            for w in self.succs[v]:
+                if w in members:
+                    indegree[w] -= 1
+                    if indegree[w] == 0:
+                        heapq.heappush(ready, (priority[w], w))
+        return order
+
+    def random_route(self, rng=random):
+        """제약을 만족하는 무작위 방문 순서를 O(n)에 생성
+
+        승차 정류장 순서는 고정하고, 하차 전용 정류장마다 자기 승차 정류장들 뒤의
+        틈 하나를 무작위로 골라 틈별로 모은 뒤 틈 안에서 섞는다 (반복 insert 없음).
+        """
+        n_pickups = len(self.pickup_order)
+        gaps = [[] for _ in range(n_pickups + 1)]
+        for d in self.dropoff_only:
+            gaps[rng.randint(self.earliest_gap[d], n_pickups)].append(d)
+        route = []
+        for k, gap in enumerate(gaps):
+            if len(gap) > 1:
+                rng.shuffle(gap)
+            route.extend(gap)
+            if k < n_pickups:
+                route.append(self.pickup_order[k])
+        return route
+
+    def repair(self, route):
+        """제약을 어긴 순서를 가능한 한 원래 순서를 유지하며 고침 (위반이 없으면 그대로 반환)
+
+        현재 위치를 우선순위로 하는 위상 정렬이므로 O(n log n + 간선 수).
+        일부 정류장만 담은 경로도 그 정류장들 사이의 제약에 맞게 정렬한다.
+        """
+        if len(route) == len(self.stops) and self.is_feasible(route):
+            return route
+        return self.topological_order(route, {v: k for k, v in enumerate(route)})
+
+    def allows_at(self, route, stop, index):
+        # stop을 route의 index 위치로 옮겨도 되는지 (stop의 승차 정류장이 모두 그 앞에 있는지)
+        preds = self.preds[stop]
+        if not preds:
+            return True
+        prefix = set(route[:index])
+        return all(p in prefix for p in preds)
+
+    def allows_relocation(self, route, i, j):
+        # route[i]를 빼서 최종 위치 j에 넣어도(seq.insert(j, seq.pop(i))) 되는지: 지나치는 정류장 중
+        # 앞으로 갈 때는 자기 승차 정류장이, 뒤로 갈 때는 자기 하차 정류장이 없어야 함
+        stop = route[i]
+        if j < i:
+            passed, blockers = route[j:i], self.preds[stop]
+        else:
+            passed, blockers = route[i + 1:j + 1], self.succs[stop]
+        if not blockers:
+            return True
+        passed = set(passed)
+        return not any(b in passed for b in blockers)
+
+    def allows_swap(self, route, i, j):
+        # route[i], route[j] 교환 = 뒤쪽 정류장을 i로, 앞쪽 정류장을 j로 옮기는 것과 같은 조건
+        if i > j:
+            i, j = j, i
+        return self.allows_relocation(route, j, i) and self.allows_relocation(route, i, j)
+
+    def is_feasible(self, route):
+        pos = np.empty(len(self.stops), dtype=np.intp)
+        pos[np.asarray(route)] = np.arange(len(route))
+        return bool(np.all(pos[self.src] < pos[self.dst]))
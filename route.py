@@ -1,23 +1,29 @@
-import re
-import ast
-
 # 거리 데이터 불러오기 (파일 경로는 환경에 맞게 수정)
-with open(r"C:\\Users\\panda\\Documents\\졸작\\distance_map_UPDATED.txt", "r", encoding="utf-8") as f:
-    raw_text = f.read()
+# 처음 거리를 조회할 때 한 번만 텍스트를 파싱해 바이너리 캐시를 만들고, 이후에는 캐시를 mmap으로 읽음
+DISTANCE_SOURCE = r"C:\\Users\\panda\\Documents\\졸작\\distance_map_UPDATED.txt"
+_distance_table = None
+
 
-dict_blocks = re.findall(r"\{[^{}]+\}", raw_text)
-distance_matrix = {}
-for block in dict_blocks:
-    distance_matrix.update(ast.literal_eval(block))
+def _load_distance_table():
+    global _distance_table
+    if _distance_table is None:
+        from distance import open_distance_matrix
+        _distance_table = open_distance_matrix(DISTANCE_SOURCE)
+    return _distance_table
 
 
 def get_distance_between(stop1, stop2):
     """실제 거리 매트릭스를 기반으로 거리 반환"""
-    return distance_matrix.get((stop1, stop2)) 
+    registry, _, _, exact = _distance_table or _load_distance_table()
+    i = registry.get(stop1)
+    j = registry.get(stop2)
+    if i is None or j is None:
+        return None
+    return float(exact[i, j])
 '''
 def get_distance_between(stop1, stop2):
     # 간단한 예시용 거리 계산
     if stop1 == stop2:
         return 0
     return 5  # 고정 거리
-'''
\ No newline at end of file
+'''
@@ -0,0 +1,104 @@
+from dataclasses import dataclass, field
+from statistics import mean, stdev
+
+import numpy as np
+
+from demand import compress_demand
+from fitness import DEPOT, FitnessEngine, route_lengths
+from precedence import PrecedenceGraph, instance_stops
+from utils import get_distance_between
+
+
+@dataclass
+class RouteResult:
+    """경로 최적화 한 번의 결과
+
+    호출마다 독립적이며, 여러 시간대에 걸친 누적 거리/시간은 호출한 쪽(Simulation 등)이 관리한다.
+    """
+    route: list                       # 방문 정류장 순서
+    fitness_with_return: list         # 최종 후보 경로별 거리 (복귀 포함, 벌점 제외): GA는 마지막 세대 개체별, 나머지는 최종 경로 하나
+    total_distance: float             # 복귀 포함 총 이동 거리 (km)
+    total_minutes: int                # 복귀 포함 총 예상 소요 시간 (분)
+    stats: dict = field(default_factory=dict)
+    stop_reason: str = "generations"  # 종료 사유: generations / iterations / deadline / stalled / target_gap / exact
+    history: list = field(default_factory=list)  # 수렴 기록: 지금까지의 최적 적합도 (복귀·정원 벌점 포함), GA는 세대별, SA는 표본 반복별, ALNS는 반복별
+
+
+def prepare_instance(pairs, load_deltas=None, capacity=None, capacity_penalty=10.0):
+    """솔버 공통 준비: (고유 정류장 목록, FitnessEngine, PrecedenceGraph)
+
+    capacity가 있는데 load_deltas를 주지 않으면 pairs를 압축해 정류장별 탑승 인원 변화를 구한다.
+    """
+    stops = instance_stops(pairs)
+    if capacity is not None and load_deltas is None:
+        load_deltas = compress_demand(pairs).load_deltas()
+    engine = FitnessEngine(stops, load_deltas=load_deltas, capacity=capacity, capacity_penalty=capacity_penalty)
+    return stops, engine, PrecedenceGraph(stops, pairs)
+
+
+def route_totals(route, verbose=False, depot=DEPOT):
+    """경로의 구간별 거리/시간(1km당 3분)을 차고지 복귀까지 합산"""
+    total_distance = 0
+    total_minutes = 0
+    for i in range(len(route) - 1):
+        dist = get_distance_between(route[i], route[i+1])
+        if dist and dist > 0:
+            minutes = int(dist * 3)
+            total_distance += dist
+            total_minutes += minutes
+            if verbose:
+                print(f"  {route[i]} -> {route[i+1]} : {dist:.2f} km / {minutes}분")
+
+    last_stop = route[-1]
+    return_to_depot = get_distance_between(last_stop, depot)
+    if return_to_depot:
+        minutes_back = int(return_to_depot * 3)
+        if verbose:
+            print(f"  {last_stop} -> {depot} : {return_to_depot:.2f} km / {minutes_back}분 (복귀)")
+        total_distance += return_to_depot
+        total_minutes += minutes_back
+    return total_distance, total_minutes
+
+
+def optimality_gap(score, lower_bound):
+    """(경로 길이 - 하한) / 경로 길이, 솔버 종료 조건과 비교용 통계에 공통으로 사용"""
+    return (score - lower_bound) / score if score > 0 else 0.0
+
+
+def solution_stats(engine, route, lower_bound):
+    """솔버 공통 품질 통계 (route는 로컬 인덱스 경로)
+
+    gap은 정원 벌점을 뺀 순수 경로 길이(복귀 제외)로 계산해 솔버끼리 비교할 수 있게 하고,
+    capacity가 있으면 정원 초과 인원과 그 벌점(km)을 따로 기록한다.
+    """
+    population = np.asarray([route])
+    length = float(route_lengths(engine.dist, population)[0])
+    stats = {"lower_bound": lower_bound, "gap": optimality_gap(length, lower_bound)}
+    if engine.capacity is not None:
+        stats["capacity_overload"] = int(engine.overload(population)[0])
+        stats["capacity_penalty"] = float(engine.penalty(population)[0])
+    return stats
+
+
+def print_summary(result, label="GA"):
+    stats = result.stats
+    fitness_with_return = result.fitness_with_return
+    print(f"[{label}] 총 이동 거리: {result.total_distance:.2f} km")
+    print(f"[{label}] 총 예상 소요 시간: {result.total_minutes}분")
+    if result.stop_reason == "exact":
+        print(f"[{label}] 최적해 (DP 상태 {stats['states']}개, {stats['elapsed_ms']:.1f}ms)")
+        return
+    if result.stop_reason not in ("generations", "iterations"):
+        runs = stats.get("generations_run", stats.get("iterations_run"))
+        print(f"[{label}] 조기 종료: {result.stop_reason} ({runs}회 반복, {stats.get('elapsed_ms', 0):.0f}ms)")
+    if result.history:
+        history = result.history
+        print(f"[{label}] 수렴 기록 (최적 적합도, 복귀 포함, {len(history)}회): 초기 {history[0]:.2f} km → 최종 {history[-1]:.2f} km")
+    if len(fitness_with_return) > 1:
+        print(f"[{label}] 최종 후보 {len(fitness_with_return)}개 거리 통계 (복귀 포함):")
+        print(f"  평균: {mean(fitness_with_return):.2f} km")
+        print(f"  표준편차: {stdev(fitness_with_return):.2f} km")
+    if "memo_hits" in stats:
+        print(f"[{label}] 적합도 캐시: 적중 {stats['memo_hits']} / 미스 {stats['memo_misses']} (적중률 {stats['memo_hit_rate']:.1%}, 크기 {stats['memo_size']})")
+    if "island_best" in stats:
+        print(f"[{label}] 섬별 최적 거리: {', '.join(f'{d:.2f}' for d in stats['island_best'])} km")
@@ -2,151 +2,331 @@ from parameters import load_fixed_customers
 from customer import Customer
 from utils import get_distance_between, calculate_cost
 from bus import Bus
-from ga_optimizer import run_ga
+from solvers import get_solver
+from demand import compress_demand
+from waiting import WaitingRoom
+from ledger import RiderLedger, RiderState
+from fitness import DEPOT
 from statistics import mean, stdev
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
 import heapq
+import itertools
+
+# 솔버별 기본 설정 (solver_options를 주지 않았을 때)
+DEFAULT_SOLVER_OPTIONS = {"ga": {"memo_size": 4096}}
+BUS_CAPACITY = 15  # 버스 정원, 경로 계획 단계에서도 이 인원을 넘지 않도록 벌점
+MAX_WAIT = 45  # 이 시간(분)을 넘게 기다린 고객은 탑승 포기
+DEPOT_RETURN_GAP = 15  # 다음 시간대까지 이 시간(분) 이상 남으면 차고지로 복귀
+
+
+class EventType(IntEnum):
+    """시뮬레이션 이벤트 종류 (같은 시각이면 값이 작은 것부터 처리)
+
+    도착한 고객은 같은 시각에 온 버스에 탈 수 있고, 대기 한도(45분)가 되는 시각에 온 버스에도 탈 수 있다.
+    """
+    CUSTOMER_ARRIVAL = 0  # 고객이 승차 정류장에 도착
+    CYCLE_START = 1       # 시간대 경로 운행 시작 (정각)
+    BUS_ARRIVAL = 2       # 버스가 정류장에 도착
+    DROPOFF = 3           # 하차 처리
+    BOARDING = 4          # 탑승 처리 후 다음 정류장으로 출발
+    ABANDON = 5           # 대기 한도 도달, 아직 못 탔으면 탑승 포기
+    DEPOT_RETURN = 6      # 차고지 복귀 완료
+
+
+def _clock(minutes):
+    hour, minute = divmod(minutes, 60)
+    return f"{hour:02d}:{minute:02d}"
+
 
 class Simulation:
-    def __init__(self):
+    def __init__(self, seed=42, parallel=True, workers=None, solver="ga", solver_options=None, warm_start=False,
+                 fleet_size=None):
         self.customers = []                      # 전체 고객 리스트
         self.buses = []                          # 버스 객체 리스트
-        self.waiting_customers = {}              # 정류장별 대기 중인 고객 딕셔너리
+        self.waiting_rooms = {}                  # 정류장 -> WaitingRoom (대기 중인 고객)
         self.current_time = 600                  # 시뮬레이션 시간 (분 단위, 10:00시작)
         self.bus_counter = 1                     # 버스 번호 부여용 카운터
         self.total_distance_across_runs = 0      # 누적 이동 거리
         self.total_time_across_runs = 0          # 누적 이동 시간
         self.fitness_all = []                    # GA 성능 기록 리스트
         self.abandoned_customers = 0             # 대기시간 초과로 포기한 고객 수
+        self.seed = seed                         # 시간대별 GA 난수 시드 기준값 (seed + 시각)
+        self.parallel = parallel                 # 시간대별 GA를 프로세스 풀에서 동시에 풀지 여부
+        self.workers = workers                   # 프로세스 풀 크기 (None이면 CPU 수)
+        self.ga_stats = {}                       # 시간대별 GA 통계 (평가 횟수, 캐시 적중 등)
+        self.demands = {}                        # 시간대별 압축된 OD 수요 (고유 승하차 쌍, 정류장별 승하차 인원)
+        self.solver = solver                     # 경로 솔버 이름 (solvers.SOLVERS: ga / sa / alns / exact)
+        self.solver_options = solver_options if solver_options is not None else DEFAULT_SOLVER_OPTIONS.get(solver, {})
+        self.warm_start = warm_start             # 직전 시간대 최적 경로로 다음 시간대 탐색 시작 (시간대 순서대로 풀게 됨)
+        self.calendar = []                       # 이벤트 캘린더 (시각, 종류, 순번, 대상) 힙
+        self._event_seq = itertools.count()      # 같은 시각·종류 이벤트의 등록 순서
+        self.plans = {}                          # 시간대별 경로 계획 (RouteResult)
+        self.riders = None                       # RiderLedger: 고객 ID별 상태 (대기/탑승/하차/포기)
+        self.cycle_bus = {}                      # 운행 중인 시간대 -> 버스
+        self.pending_cycles = deque()            # 버스가 비기를 기다리는 시간대
+        self.idle_buses = []                     # 쉬는 버스 힙 (가용 시각, 버스 번호) - 가장 먼저 비는 버스부터 배차
+        self.fleet_size = fleet_size             # 최대 버스 수 (None이면 빈 버스가 없을 때마다 새 버스 투입)
 
     def generate_customers(self):
         fixed_customers = load_fixed_customers()  # 파라미터에서 고정 고객 생성
         for customer in fixed_customers:
             if customer.boarding_stop != customer.getoff_stop:  # 승하차 정류장이 같지 않은 경우만
                 self.customers.append(customer)
-                self.waiting_customers.setdefault(customer.boarding_stop, []).append(customer)
+
+    def hourly_customers(self, hour):
+        hour_min = hour * 60
+        return [c for c in self.customers if hour_min <= c.time < hour_min + 60]
+
+    def plan_routes(self):
+        """시간대별 승하차 쌍은 고객 생성 시점에 이미 정해지므로 모든 시간대의 GA를 먼저 풀어 둠
+
+        같은 승하차 쌍의 고객은 하나의 OD 수요로 합쳐 고유 쌍만 솔버에 넘긴다.
+        시간대마다 seed + 시각으로 고정한 난수를 쓰기 때문에 병렬/순차 실행 결과가 같다.
+        warm_start이면 각 시간대가 직전 시간대 결과 경로에서 시작하므로 병렬 없이 시각 순서대로 푼다.
+        """
+        problems = {}
+        for hour in range(10, 17):
+            pairs = [(c.boarding_stop, c.getoff_stop) for c in self.hourly_customers(hour)]
+            if pairs:
+                self.demands[hour] = compress_demand(pairs)
+                problems[hour] = self.demands[hour].pairs
+        options = dict({"capacity": BUS_CAPACITY}, **self.solver_options)
+        solvers = {hour: get_solver(self.solver, seed=self.seed + hour, verbose=False, **options) for hour in problems}
+        loads = {hour: self.demands[hour].load_deltas() for hour in problems}
+
+        if self.warm_start:
+            plans, previous = {}, None
+            for hour, pairs in problems.items():
+                plans[hour] = solvers[hour].solve(pairs, seed_routes=[previous.route] if previous else None,
+                                                  load_deltas=loads[hour])
+                previous = plans[hour]
+            return plans
+        if self.parallel and len(problems) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {hour: executor.submit(solvers[hour].solve, pairs, load_deltas=loads[hour]) for hour, pairs in problems.items()}
+                return {hour: future.result() for hour, future in futures.items()}
+        return {hour: solvers[hour].solve(pairs, load_deltas=loads[hour]) for hour, pairs in problems.items()}
+
+    # ---------------------------
+    # 이벤트 캘린더
+    # ---------------------------
+    def schedule(self, time, kind, payload):
+        # 같은 시각이면 이벤트 종류 순서, 그다음 등록 순서대로 처리
+        heapq.heappush(self.calendar, (time, kind, next(self._event_seq), payload))
 
     def run(self):
+        """이산 사건 시뮬레이션: 캘린더에서 가장 이른 이벤트를 꺼내 그 시각으로 바로 이동하며 처리"""
         self.generate_customers()  # 고객 생성
-        self.buses.append(Bus(bus_id="Bus1", current_stop="00_오이도차고지", max_capacity=15))  # 버스 초기화
-
-        for hour in range(10, 17):  # 10시 ~ 16시까지 반복
-            hour_min = hour * 60
-            hourly_customers = [c for c in self.customers if hour_min <= c.time < hour_min + 60]
-            hourly_ids = {c.customer_id for c in hourly_customers}
-            remaining_customers = hourly_customers.copy()
-            #GA 최적화 준비 및 실행
-            pairs = [(c.boarding_stop, c.getoff_stop) for c in hourly_customers]
-            if not pairs:
-                continue
-            stops_to_visit, fitness_with_return, distance, minutes = run_ga(pairs, verbose=True)
-            # 탑승/하차 인원 계산
-            boarding_count = {}
-            getoff_count = {}
-
-            for c in hourly_customers:
-                boarding_count[c.boarding_stop] = boarding_count.get(c.boarding_stop, 0) + 1
-                getoff_count[c.getoff_stop] = getoff_count.get(c.getoff_stop, 0) + 1
-            
-            #각 정류장에 승하차 인원이 있다면 "정류장ID(3승차, 2하차)" 형식으로 표기
-            route_summary = []
-            for stop in stops_to_visit:
-                board = boarding_count.get(stop, 0)
-                drop = getoff_count.get(stop, 0)
-                label = stop
-                info = []
-                if board > 0:
-                    info.append(f"{board}승차")
-                if drop > 0:
-                    info.append(f"{drop}하차")
-                if info:
-                    label += f"({', '.join(info)})"
-                route_summary.append(label)
-            #경로 출력 및 누적 기록 "15시 사이클] 방문 경로: A(2승차) → B(1하차)"
-            print(f"[{hour}시 사이클] 방문 경로: {' → '.join(route_summary)}")
-            self.total_distance_across_runs += distance
-            self.total_time_across_runs += minutes
-            self.fitness_all.extend(fitness_with_return)
-            #고객이 남아있는데 버스가 부족하면 새 버스 추가
-            bus_index = 0
-            while remaining_customers:
-                if bus_index >= len(self.buses):
-                    self.bus_counter += 1
-                    new_bus = Bus(bus_id=f"Bus{self.bus_counter}", current_stop="00_오이도차고지", max_capacity=15)
-                    self.buses.append(new_bus)
-
-                #버스 한 대씩 루트 수행, 이동거리만큼 current_time도 증가
-                bus = self.buses[bus_index]
-                bus_index += 1
-
-                unfinished = {c.customer_id for c in remaining_customers}
-                while unfinished:
-                    for i, stop in enumerate(stops_to_visit):
-                        if i > 0:
-                            prev = stops_to_visit[i - 1]
-                            dist = get_distance_between(prev, stop)
-                            if dist is not None:
-                                bus.total_distance += dist
-                                self.current_time += int(dist * 3)
-
-                        #정류장에서 하차 처리
-                        bus.current_stop = stop
-
-                        dropped = bus.drop_customer(stop, self.current_time)
-                        for c in dropped:
-                            c.dropoff_time = self.current_time
-                            hour, minute = divmod(self.current_time, 60)
-                            print(f"[{hour:02d}:{minute:02d}] {c.customer_id}번 고객이 {bus.bus_id} 버스에서 하차 (정류장: {stop})")
-                        #정류장에서 대기 중인 고객 확인 및 탑승
-                        waiting_list = list(self.waiting_customers.get(stop, []))
-                        for c in waiting_list:
-                            wait_time = self.current_time - c.time
-                            #고객 탑승 조건 확인 
-                            #해당 시간대 고객인지
-                            #45분 이하로 기다렸는지
-                            #버스 자리가 남았는지
-                            if (
-                                c.customer_id in hourly_ids and 
-                                c.time <= self.current_time and 
-                                wait_time <= 45 and 
-                                bus.can_board_customer()
-                            ):
-                                #탑승 or 포기 처리
-                                bus.board_customer(c, self.current_time)
-                                self.waiting_customers[stop].remove(c)
-                                c.pickup_time = self.current_time
-                                hour, minute = divmod(self.current_time, 60)
-                                print(f"[{hour:02d}:{minute:02d}] {c.customer_id}번 고객이 {bus.bus_id} 버스에 탑승 (정류장: {stop}, 하차: {c.getoff_stop})")
-                            elif wait_time > 45:
-                                self.waiting_customers[stop].remove(c)
-                                self.abandoned_customers += 1
-                                remaining_customers = [x for x in remaining_customers if x.customer_id != c.customer_id]  # ⬅️ 이 줄 추가
-                                hour, minute = divmod(self.current_time, 60)
-                                print(f"[{hour:02d}:{minute:02d}] {c.customer_id}번 고객이 {stop}에서 대기 {wait_time}분 후 탑승 포기")
-
-                    #아직 남아있는 고객 ID 다시 설정
-                    unfinished = {c.customer_id for c in remaining_customers if c.customer_id not in {cust.customer_id for cust, _ in bus.finished_customers}}
-
-                bus.end_time = self.current_time
-                remaining_customers = [c for c in remaining_customers if all(c.customer_id != cust.customer_id for cust, _ in bus.finished_customers)]
-            
-            # 다음 시간대까지 시간 여유 계산, 다음 시간대까지 시간이 15분 이상 남으면 버스를 차고지로 복귀
-            next_hour = (hour + 1) * 60 if hour < 16 else None
-            if next_hour:
-                time_gap = next_hour - self.current_time
-                if time_gap >= 15:
-                    for bus in self.buses:
-                        if bus.current_stop != "00_오이도차고지":
-                            dist = get_distance_between(bus.current_stop, "00_오이도차고지")
-                            if dist:
-                                bus.total_distance += dist
-                                self.current_time += int(dist * 3)
-                                bus.current_stop = "00_오이도차고지"
-                                hour, minute = divmod(self.current_time, 60)
-                                print(f"[{hour:02d}:{minute:02d}] {bus.bus_id} 버스가 오이도차고지로 복귀하여 대기")
-                else:
-                    hour, minute = divmod(self.current_time, 60)
-                    print(f"[{hour:02d}:{minute:02d}] 버스들이 대기 없이 다음 정류장 이동 예정")
+        for _ in range(self.fleet_size or 1):  # 버스 초기화
+            self.add_bus()
+        self.plans = self.plan_routes()  # 모든 시간대 경로를 먼저 계산한 뒤 시뮬레이션 재생
+
+        self.riders = RiderLedger(self.customers)
+        for c in self.customers:
+            self.schedule(c.time, EventType.CUSTOMER_ARRIVAL, c)
+            self.schedule(c.time + MAX_WAIT, EventType.ABANDON, c)
+        for hour in sorted(self.plans):
+            self.schedule(hour * 60, EventType.CYCLE_START, hour)
+
+        handlers = {
+            EventType.CUSTOMER_ARRIVAL: self.on_customer_arrival,
+            EventType.CYCLE_START: self.on_cycle_start,
+            EventType.BUS_ARRIVAL: self.on_bus_arrival,
+            EventType.DROPOFF: self.on_dropoff,
+            EventType.BOARDING: self.on_boarding,
+            EventType.ABANDON: self.on_abandon,
+            EventType.DEPOT_RETURN: self.on_depot_return,
+        }
+        while self.calendar:
+            time, kind, _, payload = heapq.heappop(self.calendar)
+            self.current_time = time
+            handlers[kind](payload)
+
+        self.print_summary()
+
+    # ---------------------------
+    # 이벤트 처리
+    # ---------------------------
+    def on_customer_arrival(self, customer):
+        room = self.waiting_rooms.get(customer.boarding_stop)
+        if room is None:
+            room = self.waiting_rooms[customer.boarding_stop] = WaitingRoom()
+        room.add(customer)
+        self.riders.move(customer, RiderState.WAITING)
+        # 이 시간대 버스가 고객을 기다리며 쉬고 있으면 바로 노선 운행 시작
+        bus = self.cycle_bus.get(customer.time // 60)
+        if bus is not None and bus.route_index is None:
+            self.start_loop(bus)
+
+    def on_cycle_start(self, hour):
+        plan = self.plans[hour]
+        self.ga_stats[hour] = plan.stats
+        #각 정류장에 승하차 인원이 있다면 "정류장ID(3승차, 2하차)" 형식으로 표기
+        #승하차 인원은 압축된 수요에서 정류장별로 다시 펼침
+        route_summary = []
+        for stop, board, drop in self.demands[hour].stop_loads(plan.route):
+            label = stop
+            info = []
+            if board > 0:
+                info.append(f"{board}승차")
+            if drop > 0:
+                info.append(f"{drop}하차")
+            if info:
+                label += f"({', '.join(info)})"
+            route_summary.append(label)
+        #경로 출력 및 누적 기록 "15시 사이클] 방문 경로: A(2승차) → B(1하차)"
+        print(f"[{hour}시 사이클] 방문 경로: {' → '.join(route_summary)}")
+        print(f"[{hour}시 사이클] GA 이동 거리: {plan.total_distance:.2f} km / 예상 소요 시간: {plan.total_minutes}분")
+        # 시간대 누적 합계는 시뮬레이션이 직접 관리 (GA 호출은 서로 독립)
+        self.total_distance_across_runs += plan.total_distance
+        self.total_time_across_runs += plan.total_minutes
+        self.fitness_all.extend(plan.fitness_with_return)
+
+        self.pending_cycles.append(hour)
+        self.dispatch()
+
+    def on_bus_arrival(self, bus):
+        bus.current_stop = bus.next_stop
+        bus.finish_move()
+        self.schedule(self.current_time, EventType.DROPOFF, bus)
+        self.schedule(self.current_time, EventType.BOARDING, bus)
+
+    def on_dropoff(self, bus):
+        stop = bus.current_stop
+        for c in bus.drop_customer(stop, self.current_time):
+            c.dropoff_time = self.current_time
+            self.riders.move(c, RiderState.DELIVERED)
+            print(f"[{_clock(self.current_time)}] {c.customer_id}번 고객이 {bus.bus_id} 버스에서 하차 (정류장: {stop})")
+
+    def on_boarding(self, bus):
+        # 대기 중인 고객 중 이 버스가 운행하는 시간대 고객만, 자리가 남는 동안 탑승
+        # (45분을 넘긴 고객은 ABANDON 이벤트에서 이미 빠져 있음)
+        stop = bus.current_stop
+        room = self.waiting_rooms.get(stop)
+        while room and bus.can_board_customer():
+            c = room.pop_eligible(bus.cycle)
+            if c is None:
+                break
+            bus.board_customer(c, self.current_time)
+            self.riders.move(c, RiderState.ONBOARD)
+            c.pickup_time = self.current_time
+            print(f"[{_clock(self.current_time)}] {c.customer_id}번 고객이 {bus.bus_id} 버스에 탑승 (정류장: {stop}, 하차: {c.getoff_stop})")
+        self.advance(bus)
+
+    def on_abandon(self, customer):
+        # 같은 정류장에서 대기 한도에 도달한 고객을 한 번에 꺼냄 (이미 탑승/포기했으면 빈 목록)
+        room = self.waiting_rooms[customer.boarding_stop]
+        for c in room.expire_older_than(self.current_time - MAX_WAIT):
+            self.abandoned_customers += 1
+            self.riders.move(c, RiderState.ABANDONED)
+            wait_time = self.current_time - c.time
+            print(f"[{_clock(self.current_time)}] {c.customer_id}번 고객이 {c.boarding_stop}에서 대기 {wait_time}분 후 탑승 포기")
+            bus = self.cycle_bus.get(c.time // 60)
+            if bus is not None and bus.route_index is None:
+                self.continue_cycle(bus)  # 쉬고 있던 버스의 마지막 남은 고객이었으면 운행 종료
+
+    def on_depot_return(self, bus):
+        bus.current_stop = bus.next_stop
+        bus.finish_move()
+        print(f"[{_clock(self.current_time)}] {bus.bus_id} 버스가 오이도차고지로 복귀하여 대기")
+        # 차고지에 도착한 뒤에야 배차 대상 (복귀 중인 버스는 힙에 넣지 않음)
+        self.release(bus, self.current_time)
+        self.dispatch()
+
+    # ---------------------------
+    # 배차
+    # ---------------------------
+    def add_bus(self):
+        bus = Bus(bus_id=f"Bus{len(self.buses) + 1}", current_stop=DEPOT, max_capacity=BUS_CAPACITY)
+        bus.clock = bus.available_at = self.current_time
+        bus.fleet_index = len(self.buses)
+        self.buses.append(bus)
+        self.bus_counter = len(self.buses)
+        heapq.heappush(self.idle_buses, (bus.available_at, bus.fleet_index))
+        return bus
+
+    def dispatch(self):
+        """기다리는 시간대를 가장 먼저 비는 버스에 배정
+
+        힙에는 지금 멈춰 있는 버스만 들어 있다. 비어 있는 버스가 없으면 fleet_size 한도 안에서
+        새 버스를 투입하고, 한도에 걸리면 버스가 비는 시점(운행 종료·차고지 도착)에 다시 배차한다.
+        """
+        while self.pending_cycles:
+            if not self.idle_buses:
+                if self.fleet_size is not None and len(self.buses) >= self.fleet_size:
+                    return
+                self.add_bus()
+            _, index = heapq.heappop(self.idle_buses)
+            self.start_cycle(self.buses[index], self.pending_cycles.popleft())
+
+    def release(self, bus, available_at):
+        bus.available_at = available_at
+        heapq.heappush(self.idle_buses, (available_at, bus.fleet_index))
+
+    # ---------------------------
+    # 버스 운행
+    # ---------------------------
+    def depart(self, bus, stop, kind=EventType.BUS_ARRIVAL):
+        # 현재 정류장에서 stop으로 출발, 도착 이벤트 예약 (1km당 3분)
+        if bus.is_moving or bus.clock > self.current_time:
+            raise RuntimeError(f"{bus.bus_id} 버스가 {_clock(bus.clock)} 도착 예정으로 아직 이동 중입니다.")
+        dist = get_distance_between(bus.current_stop, stop) or 0
+        bus.total_distance += dist
+        bus.next_stop = stop
+        bus.start_move()
+        bus.clock = self.current_time + int(dist * 3)
+        self.schedule(bus.clock, kind, bus)
+
+    def start_cycle(self, bus, hour):
+        bus.cycle = hour
+        bus.route = self.plans[hour].route
+        bus.route_index = None
+        self.cycle_bus[hour] = bus
+        self.continue_cycle(bus)
+
+    def start_loop(self, bus):
+        # 시간대 경로를 처음부터 한 바퀴 운행
+        bus.route_index = 0
+        self.depart(bus, bus.route[0])
+
+    def advance(self, bus):
+        bus.route_index += 1
+        if bus.route_index < len(bus.route):
+            self.depart(bus, bus.route[bus.route_index])
+        else:
+            bus.route_index = None
+            self.continue_cycle(bus)
+
+    def continue_cycle(self, bus):
+        """한 바퀴를 마쳤거나 시간대를 시작할 때: 남은 고객에 따라 다시 돌기 / 도착 대기 / 운행 종료"""
+        if not self.riders.open(bus.cycle):
+            self.finish_cycle(bus)
+        elif self.riders.active(bus.cycle):
+            self.start_loop(bus)
+        # 아직 도착하지 않은 고객만 남았으면 route_index=None 상태로 도착 이벤트를 기다림
+
+    def finish_cycle(self, bus):
+        hour = bus.cycle
+        del self.cycle_bus[hour]
+        bus.cycle = None
+        bus.end_time = self.current_time
+        if self.pending_cycles:
+            # 배차를 기다리는 시간대가 있으면 차고지에 들르지 않고 바로 이어서 운행
+            self.release(bus, self.current_time)
+            self.dispatch()
+            return
+        # 다음 시간대까지 시간 여유 계산, 다음 시간대까지 시간이 15분 이상 남으면 버스를 차고지로 복귀
+        next_hour = (hour + 1) * 60 if hour < 16 else None
+        if next_hour is not None and next_hour - self.current_time >= DEPOT_RETURN_GAP and bus.current_stop != DEPOT:
+            self.depart(bus, DEPOT, EventType.DEPOT_RETURN)  # on_depot_return에서 배차 대상으로 복귀
+            return
+        if next_hour is not None and next_hour - self.current_time < DEPOT_RETURN_GAP:
+            print(f"[{_clock(self.current_time)}] {bus.bus_id} 버스가 대기 없이 다음 시간대 운행 예정")
+        self.release(bus, self.current_time)
 
+    def print_summary(self):
         print("\n=== 시뮬레이션 종료 ===")
 
         print("[GA 최종 요약]")
@@ -169,6 +349,12 @@ class Simulation:
         print(f"총 누적 거리: {self.total_distance_across_runs:.2f} km")
         print(f"총 누적 시간: {self.total_time_across_runs}분")
         print(f"총 예상 비용: {calculate_cost(self.total_distance_across_runs):,}원")
+        for bus in self.buses:
+            print(f"{bus.bus_id} 실제 운행 거리: {bus.total_distance:.2f} km (탑승 {bus.total_boarded_customers}명)")
+        memo_hits = sum(s.get("memo_hits", 0) for s in self.ga_stats.values())
+        memo_misses = sum(s.get("memo_misses", 0) for s in self.ga_stats.values())
+        if memo_hits + memo_misses:
+            print(f"GA 적합도 캐시 적중률: {memo_hits / (memo_hits + memo_misses):.1%} (적중 {memo_hits} / 미스 {memo_misses})")
 
 if __name__ == "__main__":
     sim = Simulation()
@@ -0,0 +1,91 @@
+"""경로 솔버 회귀 검사
+
+작은 무작위 인스턴스에서
+  - held_karp(정원 제약 포함/미포함)가 모든 순열을 직접 따져 구한 최단 경로와 같은 길이를 내는지
+  - 1점/OX/PMX 교차 + PrecedenceGraph.repair 결과가 항상 제약을 지키는 순열인지
+확인한다. 하나라도 어긋나면 종료 코드 1 (`python solver_checks.py` 로 실행).
+"""
+import itertools
+import random
+import sys
+
+import numpy as np
+
+from demand import compress_demand
+from exact import held_karp
+from fitness import FitnessEngine, route_lengths
+from ga_optimizer import CROSSOVERS
+from precedence import PrecedenceGraph, instance_stops
+from utils import get_stop_registry
+
+BRUTE_FORCE_MAX_STOPS = 7  # 순열 전수 조사(7! = 5040)가 금방 끝나는 크기
+
+
+def random_pairs(rng, names, max_pairs=4):
+    # 같은 쌍이 여러 번 나오도록 뽑아 정류장별 인원이 1명보다 많은 경우도 만든다
+    pairs = [tuple(rng.sample(names, 2)) for _ in range(rng.randint(1, max_pairs))]
+    return pairs + [rng.choice(pairs) for _ in range(rng.randint(0, 3))]
+
+
+def brute_force(engine, graph, capacity=None):
+    """제약(과 정원)을 지키는 모든 순열 중 최단 길이 (없으면 None)"""
+    routes = [list(p) for p in itertools.permutations(range(len(graph.stops))) if graph.is_feasible(list(p))]
+    population = np.array(routes)
+    lengths = route_lengths(engine.dist, population)
+    if capacity is not None:
+        lengths = lengths[engine.overload(population) == 0]
+    return float(lengths.min()) if len(lengths) else None
+
+
+def check_held_karp(instances=60, seed=0):
+    rng = random.Random(seed)
+    names = list(get_stop_registry().names)
+    failures = checked = 0
+    while checked < instances:
+        pairs = random_pairs(rng, names)
+        stops = instance_stops(pairs)
+        if len(stops) > BRUTE_FORCE_MAX_STOPS:
+            continue
+        checked += 1
+        capacity = rng.choice((None, 1, 2, 3))
+        unique = list(dict.fromkeys(pairs))
+        engine = FitnessEngine(stops, load_deltas=compress_demand(pairs).load_deltas(), capacity=capacity)
+        graph = PrecedenceGraph(stops, unique)
+        expected = brute_force(engine, graph, capacity)
+        solution = held_karp(engine.dist, graph, engine.load_delta, capacity)
+        if solution is None:
+            ok = expected is None
+        else:
+            route, length = solution
+            actual = float(route_lengths(engine.dist, np.array([route]))[0])
+            ok = (expected is not None and graph.is_feasible(route) and sorted(route) == list(range(len(stops)))
+                  and abs(length - expected) < 1e-6 and abs(actual - length) < 1e-6)
+            if capacity is not None:
+                ok = ok and engine.overload(np.array([route]))[0] == 0
+        if not ok:
+            failures += 1
+            print(f"[FAIL] held_karp: pairs={unique} capacity={capacity} 기대={expected} 결과={solution}")
+    print(f"[{'OK' if not failures else 'FAIL'}] held_karp: 무작위 인스턴스 {instances}개 (정원 제약 포함)")
+    return failures
+
+
+def check_crossovers(instances=200, seed=0):
+    rng = random.Random(seed)
+    names = list(get_stop_registry().names)
+    failures = 0
+    for _ in range(instances):
+        pairs = list(dict.fromkeys(random_pairs(rng, names, max_pairs=12)))
+        stops = instance_stops(pairs)
+        graph = PrecedenceGraph(stops, pairs)
+        parent1, parent2 = graph.random_route(rng), graph.random_route(rng)
+        for name, cross in CROSSOVERS.items():
+            child = cross(parent1, parent2, graph, rng)
+            if sorted(child) != list(range(len(stops))) or not graph.is_feasible(child):
+                failures += 1
+                print(f"[FAIL] {name} 교차: 부모={parent1}, {parent2} 자식={child}")
+    print(f"[{'OK' if not failures else 'FAIL'}] 교차 + 복구 ({', '.join(CROSSOVERS)}): 무작위 인스턴스 {instances}개")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if check_held_karp() + check_crossovers() else 0)
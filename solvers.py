@@ -0,0 +1,42 @@
+"""경로 솔버 인터페이스와 이름별 등록부
+
+모든 솔버는 설정을 생성자 인자로 받고 solve(pairs, memo=None, seed_routes=None, load_deltas=None)
+-> RouteResult 를 제공한다. seed_routes는 이전 시간대 경로 같은 시작 경로 후보(정류장 이름 리스트)로,
+현재 정류장 집합에 투영해 쓴다. load_deltas(정류장 -> 탑승 인원 변화)는 생성자에 capacity를 준 경우 정원 검사에 쓴다.
+결과의 stats에는 공통으로 evaluations, elapsed_ms, lower_bound, gap 이 들어 있어
+같은 기준으로 비교할 수 있다. Simulation은 이름으로 솔버를 골라 쓴다.
+"""
+from typing import Protocol
+
+from alns import ALNSSolver
+from annealing import AnnealingSolver
+from exact import ExactSolver
+from ga_optimizer import GASolver
+from routing import RouteResult
+
+
+class RouteSolver(Protocol):
+    def solve(self, pairs, memo=None, seed_routes=None, load_deltas=None) -> RouteResult:
+        ...
+
+
+SOLVERS = {
+    "ga": GASolver,
+    "sa": AnnealingSolver,
+    "alns": ALNSSolver,
+    "exact": ExactSolver,
+}
+
+
+def register_solver(name, factory):
+    """새 솔버 등록 (factory(**options)가 RouteSolver의 solve를 가진 객체를 반환해야 함)"""
+    SOLVERS[name] = factory
+    return factory
+
+
+def get_solver(name, **options):
+    try:
+        factory = SOLVERS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 솔버입니다: {name} (사용 가능: {', '.join(SOLVERS)})") from None
+    return factory(**options)
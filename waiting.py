@@ -0,0 +1,51 @@
+from collections import deque
+
+
+class WaitingRoom:
+    """한 정류장의 대기 고객 (시간대별 도착 순 deque + 고객 ID 색인)
+
+    탑승/포기로 빠진 고객은 색인에서만 지우고, deque에서는 맨 앞에 왔을 때 버린다 (지연 삭제).
+    그래서 탑승·포기·포함 여부 확인이 모두 O(1) (상각)이고 리스트 복사나 remove가 없다.
+    """
+
+    def __init__(self):
+        self.queues = {}  # 시간대 -> 도착 순 고객 deque
+        self.index = {}   # 고객 ID -> 고객 (아직 대기 중인 고객만)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, customer):
+        return customer.customer_id in self.index
+
+    def add(self, customer):
+        self.queues.setdefault(customer.time // 60, deque()).append(customer)
+        self.index[customer.customer_id] = customer
+
+    def _head(self, queue):
+        # 이미 빠진 고객을 앞에서 버리고 맨 앞 대기 고객 반환 (없으면 None)
+        while queue and queue[0].customer_id not in self.index:
+            queue.popleft()
+        return queue[0] if queue else None
+
+    def pop_eligible(self, hour):
+        """hour 시간대 고객 중 가장 먼저 온 고객을 꺼냄 (없으면 None)"""
+        queue = self.queues.get(hour)
+        customer = self._head(queue) if queue else None
+        if customer is not None:
+            queue.popleft()
+            del self.index[customer.customer_id]
+        return customer
+
+    def expire_older_than(self, cutoff):
+        """cutoff 시각 이전(포함)에 도착한 고객을 모두 꺼내 도착 순으로 반환 (O(꺼낸 고객 수))"""
+        expired = []
+        for queue in self.queues.values():
+            customer = self._head(queue)
+            while customer is not None and customer.time <= cutoff:
+                queue.popleft()
+                del self.index[customer.customer_id]
+                expired.append(customer)
+                customer = self._head(queue)
+        expired.sort(key=lambda c: c.time)
+        return expired